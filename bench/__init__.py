@@ -0,0 +1 @@
+"""Benchmarks (mock ATS server, end-to-end and micro-benchmarks)"""
@@ -0,0 +1,160 @@
+"""
+Synthetic job corpus
+
+Seeded generator of realistic `Job` objects for benchmarks: a mix of
+matching and non-matching titles, location strings assembled from the
+LocationParser tables, descriptions of varying length and leftover HTML
+noise as produced by the feed plugins.
+"""
+import random
+from typing import Iterator, List
+
+from src.location_parser import LocationParser
+from src.models import Job
+
+
+TITLES = [
+    "Site Reliability Engineer",
+    "Senior Site Reliability Engineer",
+    "SRE II",
+    "Platform Engineer",
+    "Senior DevOps Engineer",
+    "Cloud Infrastructure Engineer",
+    "Infrastructure Engineer, Kubernetes",
+    "Production Engineer",
+    "Systems Engineer (Linux)",
+    "Backend Engineer",
+    "Senior Software Engineer, Payments",
+    "Frontend Engineer",
+    "Product Manager",
+    "Engineering Manager, Platform",
+    "Data Engineer",
+    "Security Engineer",
+    "Solutions Architect",
+    "Customer Support Engineer",
+    "Account Executive",
+    "Machine Learning Engineer",
+    "Head of Infrastructure",
+    "Staff Engineer, Developer Productivity",
+]
+
+STACK_WORDS = [
+    "kubernetes", "terraform", "aws", "gcp", "azure", "docker", "prometheus",
+    "grafana", "datadog", "incident", "on-call", "observability", "linux",
+    "ci/cd", "github actions", "python", "go", "postgres", "kafka", "helm",
+]
+
+FILLER_WORDS = [
+    "team", "customers", "build", "scale", "reliable", "systems", "culture",
+    "growth", "mission", "benefits", "impact", "collaborate", "ownership",
+    "product", "platform", "users", "global", "learning", "flexible", "values",
+]
+
+COMPANIES = [
+    "Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries",
+    "Wayne Enterprises", "Cyberdyne", "Soylent", "Tyrell", "Aperture",
+]
+
+SOURCES = [
+    "greenhouse", "lever", "ashby", "recruitee", "workable",
+    "remotive", "remoteok", "weworkremotely", "adzuna",
+]
+
+# Leftovers that regex-based HTML stripping lets through
+HTML_NOISE = [
+    "&nbsp;", "&amp;", "&#39;", "<br/>", "</li>", "<strong>", "&mdash;",
+    "<a href=\"https://example.com/apply\">apply</a>", " ", "&lt;3",
+]
+
+RESIDENCY_PHRASES = [
+    "", "", "",
+    "You must be located in the EU.",
+    "Must reside in the United States.",
+    "Only candidates located in Germany will be considered.",
+    "We are a remote-first company hiring across EMEA.",
+    "Work from anywhere, we are fully distributed.",
+]
+
+
+class CorpusGenerator:
+    """Deterministic stream of synthetic jobs"""
+
+    def __init__(self, seed: int = 42, mean_description_words: int = 450, html_noise: float = 0.3):
+        self.rng = random.Random(seed)
+        self.mean_description_words = mean_description_words
+        self.html_noise = html_noise
+
+        parser = LocationParser
+        self.countries = [c.title() for c in parser.COUNTRY_PATTERNS]
+        self.regions = [r.upper() if len(r) <= 4 else r.title() for r in parser.REGION_PATTERNS]
+        self.us_cities = [c.title() for c in parser.US_CITIES]
+        self.us_states = sorted(s.upper() for s in parser.US_STATES if len(s) == 2)
+        self.other_cities = [c.title() for c in parser.CANADIAN_CITIES | parser.AUSTRALIAN_CITIES]
+        self.worldwide = [w.title() for w in parser.WORLDWIDE_PATTERNS]
+
+    def location(self) -> str:
+        rng = self.rng
+        kind = rng.random()
+        if kind < 0.15:
+            return rng.choice([f"Remote, {r}" for r in self.regions] + [f"Remote - {r}" for r in self.regions])
+        if kind < 0.25:
+            return rng.choice(self.worldwide)
+        if kind < 0.40:
+            return f"Remote - {rng.choice(self.countries)}"
+        if kind < 0.50:
+            return f"Remote ({rng.choice(self.us_cities)}, {rng.choice(self.us_states)} only)"
+        if kind < 0.60:
+            return f"{rng.choice(self.us_cities)}, {rng.choice(self.us_states)}"
+        if kind < 0.65:
+            return f"{rng.choice(self.other_cities)}, Remote"
+        if kind < 0.75:
+            return f"Hybrid - {rng.choice(self.countries)}"
+        if kind < 0.85:
+            first, second = rng.sample(self.countries, 2)
+            return f"Remote - {first}; {second}"
+        if kind < 0.95:
+            return "Remote"
+        return f"{rng.choice(self.countries)} (Office)"
+
+    def description(self) -> str:
+        rng = self.rng
+        words = max(20, int(rng.lognormvariate(0, 0.6) * self.mean_description_words))
+        out = []
+        for i in range(words):
+            roll = rng.random()
+            if roll < 0.06:
+                out.append(rng.choice(STACK_WORDS))
+            elif roll < 0.06 + 0.02 * self.html_noise:
+                out.append(rng.choice(HTML_NOISE))
+            else:
+                out.append(rng.choice(FILLER_WORDS))
+            if i % 15 == 14:
+                out[-1] += "."
+        phrase = rng.choice(RESIDENCY_PHRASES)
+        if phrase:
+            out.insert(rng.randrange(len(out)), phrase)
+        return " ".join(out)
+
+    def job(self, index: int) -> Job:
+        rng = self.rng
+        source = rng.choice(SOURCES)
+        company = rng.choice(COMPANIES)
+        return Job(
+            source=source,
+            company=company.lower() if source in ("greenhouse", "lever", "ashby") else company,
+            job_id=f"{index:07d}",
+            title=rng.choice(TITLES),
+            location=self.location(),
+            url=f"https://jobs.example.com/{source}/{index}",
+            updated_at=f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T10:00:00Z",
+            content_text=self.description(),
+        )
+
+    def jobs(self, count: int) -> Iterator[Job]:
+        for i in range(count):
+            yield self.job(i)
+
+
+def generate_jobs(count: int, seed: int = 42, **kwargs) -> List[Job]:
+    """Convenience wrapper returning a list"""
+    return list(CorpusGenerator(seed=seed, **kwargs).jobs(count))
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+End-to-end scan benchmark
+
+Starts the local mock ATS server, runs JobScanner.scan end to end against
+synthetic boards at several scales and reports throughput, p95 board
+latency and peak RSS. Each scale runs in a fresh subprocess with its own
+temporary state so RSS and state DB sizes don't leak between scales.
+
+Usage:
+    python3 bench/e2e.py                                  # 100, 1k, 10k boards
+    python3 bench/e2e.py --scales 100 1000 --latency-ms 50 --error-rate 0.02
+    python3 bench/e2e.py --scales 1000 --adaptive --max-in-flight 16   # AIMD vs a throttling API
+    python3 bench/e2e.py --update-baseline                # rewrite bench/baseline.json
+
+Exits 1 if any scale regresses past --tolerance against the baseline.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench.mock_ats import MockATSServer, MockConfig, point_sources_at
+
+
+DEFAULT_BASELINE = ROOT / "bench" / "baseline.json"
+
+# Share of boards per ATS plugin; aggregated feeds are added separately
+ATS_MIX = {
+    "greenhouse": 0.5,
+    "lever": 0.2,
+    "ashby": 0.1,
+    "recruitee": 0.1,
+    "workable": 0.1,
+}
+
+FEEDS = {
+    "remotive": ["software-dev", "devops"],
+    "remoteok": ["all"],
+    "weworkremotely": ["programming", "devops"],
+}
+
+# Higher is better for these, lower is better for the rest
+HIGHER_IS_BETTER = {"jobs_per_second", "boards_per_second"}
+COMPARED = ["jobs_per_second", "boards_per_second", "p95_board_latency", "peak_rss_mb"]
+
+
+def build_sources(boards: int) -> dict:
+    """Synthetic sources config with `boards` ATS boards plus the shared feeds"""
+    sources = {name: list(ids) for name, ids in FEEDS.items()}
+    sources["adzuna"] = [f"nl:platform engineer:{page}" for page in range(1, max(2, boards // 100) + 1)]
+
+    assigned = 0
+    names = list(ATS_MIX)
+    for i, name in enumerate(names):
+        count = boards - assigned if i == len(names) - 1 else int(boards * ATS_MIX[name])
+        sources[name] = [f"{name}-{n:05d}" for n in range(count)]
+        assigned += count
+
+    return sources
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def run_scale(args) -> dict:
+    """Child process: run one scan against the mock server"""
+    from src.config import Config
+    from src.state import StateManager
+    from src.scanner import JobScanner
+
+    point_sources_at(args.base_url)
+    os.environ.setdefault("ADZUNA_APP_ID", "bench")
+    os.environ.setdefault("ADZUNA_APP_KEY", "bench")
+
+    config = Config(str(ROOT / args.config))
+    filters = config.get_filters()
+    concurrency = config.get_concurrency_config()
+    concurrency["adaptive"] = args.adaptive
+    sources = build_sources(args.scale)
+
+    with tempfile.TemporaryDirectory(prefix="jobhunt-bench-") as workdir:
+        os.chdir(workdir)
+        state = StateManager(os.path.join(workdir, ".state", "jobhunt.sqlite"))
+        scanner = JobScanner(
+            sources=sources,
+            filter_config=filters,
+            state_manager=state,
+            max_workers=args.workers,
+            dry_run=True,
+            metrics_config={},
+            checkpoint=True,
+            concurrency=concurrency,
+        )
+
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = scanner.scan()
+        wall = time.perf_counter() - started
+        state.close()
+
+    latencies = [s["latency"] for s in scanner.source_stats.values()]
+    fetched_bytes = sum(s["bytes"] for s in scanner.source_stats.values())
+    # Postings dropped by the source-side pre-filter were still fetched
+    jobs_fetched = stats["jobs_fetched"] + stats["jobs_rejected_at_source"]
+
+    return {
+        "boards": sum(len(ids) for ids in sources.values()),
+        "wall_seconds": round(wall, 3),
+        "jobs_fetched": jobs_fetched,
+        "jobs_passed": stats["jobs_passed"],
+        "errors": stats["errors"],
+        "jobs_per_second": round(jobs_fetched / wall, 1) if wall else 0.0,
+        "boards_per_second": round(len(latencies) / wall, 1) if wall else 0.0,
+        "p50_board_latency": round(percentile(latencies, 50), 4),
+        "p95_board_latency": round(percentile(latencies, 95), 4),
+        "mb_fetched": round(fetched_bytes / (1024 * 1024), 2),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "workers_final": stats["workers_final"],
+        "workers_peak": stats["workers_peak"],
+    }
+
+
+def spawn_scale(scale: int, base_url: str, args) -> dict:
+    cmd = [
+        sys.executable, __file__, "--child",
+        "--base-url", base_url,
+        "--scale", str(scale),
+        "--workers", str(args.workers),
+        "--config", args.config,
+    ]
+    if args.adaptive:
+        cmd.append("--adaptive")
+    proc = subprocess.run(cmd, capture_output=True, text=True, cwd=str(ROOT))
+    if proc.returncode != 0:
+        raise RuntimeError(f"scale {scale} failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def settings_of(args) -> dict:
+    return {
+        "workers": args.workers,
+        "config": args.config,
+        "jobs_per_board": args.jobs_per_board,
+        "feed_jobs": args.feed_jobs,
+        "description_bytes": args.description_bytes,
+        "latency_ms": args.latency_ms,
+        "error_rate": args.error_rate,
+        "adaptive": args.adaptive,
+        "max_in_flight": args.max_in_flight,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Return regression messages"""
+    regressions = []
+    for scale, current in results.items():
+        previous = baseline.get("results", {}).get(scale)
+        if not previous:
+            continue
+        for key in COMPARED:
+            old, new = previous.get(key), current.get(key)
+            if not old or new is None:
+                continue
+            if key in HIGHER_IS_BETTER:
+                change = (old - new) / old
+            else:
+                change = (new - old) / old
+            if change > tolerance:
+                regressions.append(f"{scale} boards: {key} {old} -> {new} ({change:+.0%} worse)")
+    return regressions
+
+
+def print_results(results: dict):
+    print(f"\n{'='*86}")
+    print("🏁 END-TO-END SCAN BENCHMARK")
+    print(f"{'='*86}")
+    print(f"  {'Boards':>7}{'Wall s':>9}{'Jobs':>9}{'Jobs/s':>10}{'Boards/s':>10}"
+          f"{'p50 s':>9}{'p95 s':>9}{'MB in':>9}{'RSS MB':>9}{'Errors':>7}")
+    for r in results.values():
+        print(f"  {r['boards']:>7}{r['wall_seconds']:>9.2f}{r['jobs_fetched']:>9}{r['jobs_per_second']:>10.0f}"
+              f"{r['boards_per_second']:>10.1f}{r['p50_board_latency']:>9.3f}{r['p95_board_latency']:>9.3f}"
+              f"{r['mb_fetched']:>9.1f}{r['peak_rss_mb']:>9.1f}{r['errors']:>7}")
+    print(f"{'='*86}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end scan benchmark")
+    parser.add_argument("--scales", type=int, nargs="+", default=[100, 1000, 10000], help="Board counts")
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--adaptive", action="store_true", help="Let the AIMD controller move --workers (config bounds)")
+    parser.add_argument("--config", default="config.balanced.json", help="Config whose filters are used")
+    parser.add_argument("--jobs-per-board", type=int, default=20)
+    parser.add_argument("--feed-jobs", type=int, default=200, help="Postings per aggregated feed")
+    parser.add_argument("--description-bytes", type=int, default=3000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-in-flight", type=int, default=0, help="Mock API answers 429 above this many concurrent requests")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression")
+
+    # Internal: single scale in a child process
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    parser.add_argument("--scale", type=int, help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_scale(args)))
+        return 0
+
+    server = MockATSServer(MockConfig(
+        jobs_per_board=args.jobs_per_board,
+        feed_jobs=args.feed_jobs,
+        description_bytes=args.description_bytes,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        max_in_flight=args.max_in_flight,
+        seed=args.seed,
+    )).start()
+    print(f"🧪 Mock ATS server at {server.base_url}")
+
+    results = {}
+    try:
+        for scale in args.scales:
+            print(f"  ▶ {scale} boards...")
+            results[str(scale)] = spawn_scale(scale, server.base_url, args)
+    finally:
+        server.stop()
+
+    print_results(results)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline = {"settings": settings_of(args), "results": results}
+        if baseline_path.exists():
+            # Keep scales that weren't re-run
+            previous = json.loads(baseline_path.read_text())
+            merged = previous.get("results", {})
+            merged.update(results)
+            baseline["results"] = merged
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"📝 Baseline written to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print("ℹ️  No baseline found (run with --update-baseline)")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())
+    if baseline.get("settings") != settings_of(args):
+        print("⚠️  Baseline was recorded with different settings - comparison may be meaningless")
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) vs {baseline_path.name}:")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+
+    print(f"✅ Within {args.tolerance:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
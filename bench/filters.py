@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Filter micro-benchmarks
+
+Times each JobFilter gate, GeoFilter.check_location, scoring, the full
+filter_job pipeline and the explain path over a seeded synthetic corpus,
+using the real `filters` section of every config.*.json.
+
+Usage:
+    python3 bench/filters.py                         # all configs, 2k jobs
+    python3 bench/filters.py --configs config.balanced.json --jobs 20000
+    python3 bench/filters.py --update-baseline       # rewrite bench/filters_baseline.json
+
+Exits 1 if any benchmark is slower than the baseline by more than --tolerance.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench.corpus import generate_jobs
+from src.config import Config
+from src.filtering import JobFilter
+
+
+DEFAULT_BASELINE = ROOT / "bench" / "filters_baseline.json"
+
+
+def _cases(job_filter: JobFilter, jobs):
+    """name -> callable(job) for every measured path"""
+    prepared = {}
+    for job in jobs:
+        title = job.title.lower()
+        location = job.location.lower()
+        content = job.content_text.lower()
+        prepared[id(job)] = (title, location, content, f"{title} {location} {content}")
+
+    cases = {}
+    if job_filter.geo_filter:
+        geo = job_filter.geo_filter
+        cases["gate.geo"] = lambda job: geo.check_location(job.location, job.content_text)
+        cases["geo.parse_location"] = lambda job: geo.parser.parse_location(job.location, job.content_text)
+    else:
+        cases["gate.remote"] = lambda job: job_filter._check_remote_gate(prepared[id(job)][1], prepared[id(job)][2])
+        cases["gate.region"] = lambda job: job_filter._check_region_gate(prepared[id(job)][1], prepared[id(job)][2])
+
+    cases["gate.title"] = lambda job: job_filter._check_title_gate(prepared[id(job)][0])
+    cases["gate.stack"] = lambda job: job_filter._check_stack_gate(prepared[id(job)][3])
+    cases["score"] = lambda job: job_filter._compute_score(prepared[id(job)][0], prepared[id(job)][2])
+    cases["filter_job"] = lambda job: job_filter.filter_job(job)
+    cases["filter_job.explain"] = lambda job: job_filter.filter_job(job, explain=True)
+    cases["explain_job"] = lambda job: job_filter.explain_job(job)
+    return cases
+
+
+def time_case(fn, jobs, repeat: int) -> float:
+    """Best-of-`repeat` microseconds per job"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for job in jobs:
+            fn(job)
+        best = min(best, time.perf_counter() - started)
+    return best / len(jobs) * 1e6
+
+
+def run(config_paths, jobs, repeat: int) -> dict:
+    results = {}
+    for path in config_paths:
+        filters = Config(str(ROOT / path)).get_filters()
+        if "geo" in filters:
+            # The verdict LRU would turn every repeat after the first into cache hits
+            filters["geo"] = {**filters["geo"], "cache_size": 0}
+        job_filter = JobFilter(filters)
+
+        passed = sum(1 for job in jobs if job_filter.filter_job(job).passed)
+        timings = {}
+        for name, fn in _cases(job_filter, jobs).items():
+            timings[name] = round(time_case(fn, jobs, repeat), 2)
+
+        results[path] = {"pass_rate": round(passed / len(jobs), 4), "us_per_job": timings}
+    return results
+
+
+def print_results(results: dict, job_count: int):
+    print(f"\n{'='*70}")
+    print(f"🔬 FILTER MICRO-BENCHMARKS ({job_count} jobs, µs/job, best of runs)")
+    print(f"{'='*70}")
+    for path, data in results.items():
+        print(f"\n  {path}  (pass rate {data['pass_rate']:.2%})")
+        for name, micros in data["us_per_job"].items():
+            rate = 1e6 / micros if micros else 0
+            print(f"    {name:<22}{micros:>10.2f} µs{rate:>14,.0f} jobs/s")
+    print(f"\n{'='*70}\n")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for path, data in results.items():
+        previous = baseline.get("results", {}).get(path, {}).get("us_per_job", {})
+        for name, micros in data["us_per_job"].items():
+            old = previous.get(name)
+            if old and (micros - old) / old > tolerance:
+                regressions.append(f"{path} {name}: {old} -> {micros} µs ({(micros - old) / old:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Filter micro-benchmarks")
+    parser.add_argument("--configs", nargs="+", default=sorted(p.name for p in ROOT.glob("config.*.json")))
+    parser.add_argument("--jobs", type=int, default=2000, help="Corpus size")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown")
+    args = parser.parse_args()
+
+    jobs = generate_jobs(args.jobs, seed=args.seed)
+    results = run(args.configs, jobs, args.repeat)
+    print_results(results, len(jobs))
+
+    baseline_path = Path(args.baseline)
+    settings = {"jobs": args.jobs, "seed": args.seed}
+
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps({"settings": settings, "results": results}, indent=2, sort_keys=True) + "\n")
+        print(f"📝 Baseline written to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print("ℹ️  No baseline found (run with --update-baseline)")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())
+    if baseline.get("settings") != settings:
+        print("⚠️  Baseline was recorded with a different corpus - comparison may be meaningless")
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) vs {baseline_path.name}:")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+
+    print(f"✅ Within {args.tolerance:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
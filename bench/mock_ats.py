@@ -0,0 +1,413 @@
+"""
+Local mock ATS / job board server for benchmarks
+
+Serves synthetic payloads for every source plugin on one local port:
+
+    /greenhouse/{board}/jobs            Greenhouse Boards API
+    /lever/{account}?mode=json          Lever Postings API
+    /ashby/{board}/embed                Ashby job board
+    /recruitee/{company}/api/offers     Recruitee offers API
+    /workable/{account}                 Workable widget API
+    /remotive?category=...              Remotive API
+    /remoteok                           RemoteOK JSON feed
+    /wwr/{category}.rss                 WeWorkRemotely RSS
+    /adzuna/{country}/search/{page}     Adzuna search API
+
+Payloads are deterministic per path (seeded), so repeated runs fetch
+identical data. Latency and error rate apply per request; with
+max_in_flight the server answers 429 to requests beyond that concurrency,
+like a rate-limited API.
+"""
+import json
+import random
+import threading
+import time
+import zlib
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Optional
+from urllib.parse import urlsplit, parse_qs
+from xml.sax.saxutils import escape
+
+from bench.corpus import TITLES, STACK_WORDS, FILLER_WORDS, COMPANIES
+
+
+LOCATIONS = [
+    "Remote, EMEA",
+    "Remote - Europe",
+    "Home based - Worldwide",
+    "Remote - EU",
+    "Remote (Global)",
+    "Remote",
+    "Remote - Poland",
+    "Remote (UK)",
+    "Remote - USA",
+    "Remote (Seattle, WA only)",
+    "Toronto, Remote in Canada",
+    "Amsterdam, Netherlands",
+    "Berlin, Germany (Hybrid)",
+    "San Francisco, CA",
+    "London, United Kingdom",
+    "New York, NY",
+]
+
+
+class MockConfig:
+    """Tunable payload shape and server behaviour"""
+
+    def __init__(
+        self,
+        jobs_per_board: int = 20,
+        feed_jobs: int = 200,
+        description_bytes: int = 3000,
+        latency_ms: float = 20.0,
+        jitter_ms: float = 10.0,
+        error_rate: float = 0.0,
+        max_in_flight: int = 0,
+        seed: int = 42,
+    ):
+        self.jobs_per_board = jobs_per_board
+        self.feed_jobs = feed_jobs
+        self.description_bytes = description_bytes
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.max_in_flight = max_in_flight
+        self.seed = seed
+
+
+class PayloadFactory:
+    """Build and cache deterministic payloads per request path"""
+
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self._cache: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def _rng(self, key: str) -> random.Random:
+        return random.Random(zlib.crc32(key.encode()) ^ self.config.seed)
+
+    def _description(self, rng: random.Random) -> str:
+        target = max(0, int(rng.gauss(self.config.description_bytes, self.config.description_bytes / 4)))
+        parts = ["<div>"]
+        size = 0
+        while size < target:
+            words = [rng.choice(FILLER_WORDS) for _ in range(12)]
+            words[rng.randrange(12)] = rng.choice(STACK_WORDS)
+            sentence = " ".join(words).capitalize() + "."
+            tag = rng.choice(["p", "li", "p", "strong"])
+            chunk = f"<{tag}>{sentence}</{tag}>"
+            parts.append(chunk)
+            size += len(chunk)
+        parts.append("</div>")
+        return "".join(parts)
+
+    def _posting(self, rng: random.Random, key: str, index: int) -> Dict:
+        published = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=rng.randrange(500000))
+        return {
+            "id": f"{zlib.crc32(key.encode()):08x}{index:05d}",
+            "title": rng.choice(TITLES),
+            "location": rng.choice(LOCATIONS),
+            "company": rng.choice(COMPANIES),
+            "description": self._description(rng),
+            "published": published,
+        }
+
+    def get(self, kind: str, key: str, base_url: str) -> bytes:
+        cache_key = f"{kind}:{key}"
+        with self._lock:
+            cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        body = getattr(self, f"_build_{kind}")(key, base_url)
+
+        with self._lock:
+            self._cache[cache_key] = body
+        return body
+
+    def _postings(self, key: str, count: int):
+        rng = self._rng(key)
+        return [self._posting(rng, key, i) for i in range(count)]
+
+    def _build_greenhouse(self, board: str, base_url: str) -> bytes:
+        jobs = [{
+            "id": int(p["id"], 16),
+            "title": p["title"],
+            "location": {"name": p["location"]},
+            "absolute_url": f"{base_url}/greenhouse/{board}/jobs/{p['id']}",
+            "updated_at": p["published"].isoformat(),
+            "content": p["description"],
+        } for p in self._postings(board, self.config.jobs_per_board)]
+        return json.dumps({"jobs": jobs, "meta": {"total": len(jobs)}}).encode()
+
+    def _build_lever(self, account: str, base_url: str) -> bytes:
+        jobs = [{
+            "id": p["id"],
+            "text": p["title"],
+            "categories": {"location": p["location"]},
+            "hostedUrl": f"{base_url}/lever/{account}/{p['id']}",
+            "createdAt": int(p["published"].timestamp() * 1000),
+            "description": p["description"],
+            "lists": [],
+        } for p in self._postings(account, self.config.jobs_per_board)]
+        return json.dumps(jobs).encode()
+
+    def _build_ashby(self, board: str, base_url: str) -> bytes:
+        jobs = [{
+            "id": p["id"],
+            "title": p["title"],
+            "location": p["location"],
+            "description": p["description"],
+            "requirements": "",
+        } for p in self._postings(board, self.config.jobs_per_board)]
+        return json.dumps({"jobs": jobs}).encode()
+
+    def _build_recruitee(self, company: str, base_url: str) -> bytes:
+        offers = []
+        for p in self._postings(company, self.config.jobs_per_board):
+            city, _, country = p["location"].partition(", ")
+            offers.append({
+                "id": int(p["id"], 16),
+                "slug": p["id"],
+                "status": "published",
+                "title": p["title"],
+                "city": city,
+                "country": country,
+                "careers_url": f"{base_url}/recruitee/{company}/o/{p['id']}",
+                "updated_at": p["published"].isoformat(),
+                "description": p["description"],
+            })
+        return json.dumps({"offers": offers}).encode()
+
+    def _build_workable(self, account: str, base_url: str) -> bytes:
+        jobs = []
+        for p in self._postings(account, self.config.jobs_per_board):
+            city, _, country = p["location"].partition(", ")
+            jobs.append({
+                "shortcode": p["id"],
+                "title": p["title"],
+                "city": city,
+                "country": country,
+                "url": f"{base_url}/workable/{account}/j/{p['id']}",
+                "description": p["description"],
+            })
+        return json.dumps({"name": account, "jobs": jobs}).encode()
+
+    def _build_remotive(self, category: str, base_url: str) -> bytes:
+        postings = sorted(self._postings(f"remotive-{category}", self.config.feed_jobs),
+                          key=lambda p: p["published"], reverse=True)
+        jobs = [{
+            "id": int(p["id"], 16),
+            "url": f"{base_url}/remotive/jobs/{p['id']}",
+            "title": p["title"],
+            "company_name": p["company"],
+            "candidate_required_location": p["location"],
+            "publication_date": p["published"].strftime("%Y-%m-%dT%H:%M:%S"),
+            "description": p["description"],
+        } for p in postings]
+        return json.dumps({"job-count": len(jobs), "jobs": jobs}).encode()
+
+    def _build_remoteok(self, key: str, base_url: str) -> bytes:
+        postings = sorted(self._postings("remoteok", self.config.feed_jobs),
+                          key=lambda p: p["published"], reverse=True)
+        items = [{"legal": "Mock RemoteOK feed"}]
+        for p in postings:
+            items.append({
+                "id": p["id"],
+                "slug": f"remote-{p['id']}",
+                "epoch": int(p["published"].timestamp()),
+                "date": p["published"].isoformat(),
+                "company": p["company"],
+                "position": p["title"],
+                "location": p["location"],
+                "description": p["description"],
+            })
+        return json.dumps(items).encode()
+
+    def _build_wwr(self, category: str, base_url: str) -> bytes:
+        postings = sorted(self._postings(f"wwr-{category}", self.config.feed_jobs),
+                          key=lambda p: p["published"], reverse=True)
+        items = []
+        for p in postings:
+            items.append(
+                "<item>"
+                f"<title>{escape(p['company'])}: {escape(p['title'])}</title>"
+                f"<link>{base_url}/wwr/jobs/{p['id']}</link>"
+                f"<pubDate>{format_datetime(p['published'])}</pubDate>"
+                f"<description>{escape(p['description'])}</description>"
+                "</item>"
+            )
+        rss = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0"><channel><title>Mock WWR</title>'
+            + "".join(items)
+            + "</channel></rss>"
+        )
+        return rss.encode()
+
+    def _build_adzuna(self, key: str, base_url: str) -> bytes:
+        results = [{
+            "id": str(int(p["id"], 16)),
+            "title": p["title"],
+            "company": {"display_name": p["company"]},
+            "location": {"display_name": p["location"]},
+            "redirect_url": f"{base_url}/adzuna/jobs/{p['id']}",
+            "created": p["published"].strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "description": p["description"][:500],
+        } for p in self._postings(f"adzuna-{key}", self.config.jobs_per_board)]
+        return json.dumps({"count": len(results), "results": results}).encode()
+
+
+def _route(path: str, query: Dict) -> Optional[tuple]:
+    """Map request path to (payload kind, key)"""
+    parts = [p for p in path.split("/") if p]
+    if not parts:
+        return None
+
+    kind = parts[0]
+    if kind == "greenhouse" and len(parts) == 3 and parts[2] == "jobs":
+        return "greenhouse", parts[1]
+    if kind == "lever" and len(parts) == 2:
+        return "lever", parts[1]
+    if kind == "ashby" and len(parts) == 3 and parts[2] == "embed":
+        return "ashby", parts[1]
+    if kind == "recruitee" and len(parts) == 4 and parts[2:] == ["api", "offers"]:
+        return "recruitee", parts[1]
+    if kind == "workable" and len(parts) == 2:
+        return "workable", parts[1]
+    if kind == "remotive" and len(parts) == 1:
+        return "remotive", query.get("category", ["all"])[0]
+    if kind == "remoteok" and len(parts) == 1:
+        return "remoteok", "all"
+    if kind == "wwr" and len(parts) == 2 and parts[1].endswith(".rss"):
+        return "wwr", parts[1][:-4]
+    if kind == "adzuna" and len(parts) == 4 and parts[2] == "search":
+        what = query.get("what", [""])[0]
+        return "adzuna", f"{parts[1]}:{what}:{parts[3]}"
+    return None
+
+
+class MockATSServer:
+    """Threaded local HTTP server serving synthetic job payloads"""
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockConfig()
+        self.payloads = PayloadFactory(self.config)
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.in_flight = 0
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 1024
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server._handle(self)
+
+        return Handler
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            throttle = 0 < self.config.max_in_flight < self.in_flight
+            if throttle:
+                self.throttled += 1
+        try:
+            if throttle:
+                self._send(handler, 429, b'{"error": "rate limited"}', "application/json", {"Retry-After": "1"})
+            else:
+                self._serve(handler)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _serve(self, handler: BaseHTTPRequestHandler):
+        with self._lock:
+            delay = max(0.0, self.config.latency_ms + self._rng.uniform(-1, 1) * self.config.jitter_ms)
+            fail = self._rng.random() < self.config.error_rate
+
+        if delay:
+            time.sleep(delay / 1000)
+
+        parts = urlsplit(handler.path)
+        route = _route(parts.path, parse_qs(parts.query))
+
+        if route is None:
+            self._send(handler, 404, b'{"error": "not found"}', "application/json")
+            return
+
+        if fail:
+            with self._lock:
+                self.errors += 1
+            self._send(handler, 503, b'{"error": "mock failure"}', "application/json")
+            return
+
+        kind, key = route
+        body = self.payloads.get(kind, key, self.base_url)
+        content_type = "application/rss+xml" if kind == "wwr" else "application/json"
+        self._send(handler, 200, body, content_type)
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, body: bytes, content_type: str, headers: Optional[Dict] = None):
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def start(self) -> "MockATSServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-ats", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def point_sources_at(base_url: str):
+    """Redirect every source plugin to the mock server"""
+    from src.sources.greenhouse import GreenhouseSource
+    from src.sources.lever import LeverSource
+    from src.sources.ashby import AshbySource
+    from src.sources.recruitee import RecruiteeSource
+    from src.sources.workable import WorkableSource
+    from src.sources.remotive import RemotiveSource
+    from src.sources.remoteok import RemoteOKSource
+    from src.sources.weworkremotely import WeWorkRemotelySource
+    from src.sources.adzuna import AdzunaSource
+
+    GreenhouseSource.BASE_URL = f"{base_url}/greenhouse"
+    LeverSource.BASE_URL = f"{base_url}/lever"
+    AshbySource.BASE_URL = f"{base_url}/ashby"
+    RecruiteeSource.BASE_URL = f"{base_url}/recruitee/{{identifier}}"
+    WorkableSource.BASE_URL = f"{base_url}/workable"
+    RemotiveSource.BASE_URL = f"{base_url}/remotive"
+    RemoteOKSource.JSON_URL = f"{base_url}/remoteok"
+    WeWorkRemotelySource.RSS_URLS = {
+        category: f"{base_url}/wwr/{category}.rss"
+        for category in WeWorkRemotelySource.RSS_URLS
+    }
+    AdzunaSource.BASE_URL = f"{base_url}/adzuna"
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Search index benchmark
+
+Fills a temporary state DB with a seeded synthetic corpus through
+StateManager.save_job (so the search index is built the way scans build
+it), spreads first_seen over half a year, then times a set of
+`jobhunt.py search` queries.
+
+Usage:
+    python3 bench/search.py                          # 50k postings
+    python3 bench/search.py --jobs 300000 --keep /tmp/search.sqlite
+    python3 bench/search.py --state /tmp/search.sqlite   # reuse a kept DB
+    python3 bench/search.py --update-baseline        # rewrite bench/search_baseline.json
+
+Exits 1 if any query is slower than the baseline by more than --tolerance.
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench.corpus import CorpusGenerator
+from src.state import StateManager
+
+
+DEFAULT_BASELINE = ROOT / "bench" / "search_baseline.json"
+
+# name -> search_jobs() arguments
+QUERIES = {
+    "single term": {"query": "terraform"},
+    "two terms": {"query": "terraform kubernetes"},
+    "title phrase": {"query": 'title:"site reliability"'},
+    "prefix": {"query": "kube*"},
+    "location column": {"query": "kubernetes location:emea"},
+    "not": {"query": "kafka NOT azure"},
+    "last 30 days": {"query": "terraform kubernetes", "days": 30},
+    "source + score": {"query": "prometheus", "sources": ["greenhouse", "lever"], "min_score": 40},
+    "newest first": {"query": "helm", "order": "newest"},
+    "rare": {"query": "tyrell grafana"},
+}
+
+
+def build(state: StateManager, count: int, seed: int) -> float:
+    """Save `count` postings, return saves per second"""
+    rng = random.Random(seed)
+    # Benchmark setup only - scans keep the default durability
+    state.conn.execute("PRAGMA synchronous = OFF")
+    started = time.perf_counter()
+    for job in CorpusGenerator(seed=seed).jobs(count):
+        state.save_job(job, is_new=True, score=rng.randint(0, 100))
+    rate = count / (time.perf_counter() - started)
+
+    # Postings arrive over time: rowid order is first_seen order, as in a real state DB
+    now = datetime.utcnow()
+    ages = sorted((rng.uniform(0, 180) for _ in range(count)), reverse=True)
+    state.conn.executemany(
+        "UPDATE jobs SET first_seen = ? WHERE rowid = ?",
+        [((now - timedelta(days=age)).isoformat(), rowid) for rowid, age in enumerate(ages, 1)]
+    )
+    state.conn.commit()
+    return rate
+
+
+def time_query(state: StateManager, spec: dict, repeat: int) -> dict:
+    spec = dict(spec)
+    days = spec.pop("days", None)
+    if days:
+        spec["since"] = (datetime.utcnow() - timedelta(days=days)).isoformat()
+    samples = []
+    rows = []
+    for _ in range(repeat):
+        rows, elapsed_ms = state.search_jobs(limit=20, **spec)
+        samples.append(elapsed_ms)
+    return {"best_ms": round(min(samples), 2), "results": len(rows)}
+
+
+def print_results(results: dict, jobs: int, save_rate: float):
+    print(f"\n{'='*60}")
+    print(f"🔎 SEARCH BENCHMARK ({jobs:,} postings, top 20, best of runs)")
+    print(f"{'='*60}")
+    if save_rate:
+        print(f"  save_job + index: {save_rate:,.0f} jobs/s\n")
+    for name, data in results.items():
+        print(f"  {name:<20}{data['best_ms']:>10.2f} ms{data['results']:>8} hits")
+    print(f"{'='*60}\n")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for name, data in results.items():
+        old = baseline.get("results", {}).get(name, {}).get("best_ms")
+        # Sub-millisecond timings are mostly noise
+        if old and data["best_ms"] > 1 and (data["best_ms"] - old) / old > tolerance:
+            regressions.append(f"{name}: {old} -> {data['best_ms']} ms ({(data['best_ms'] - old) / old:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search index benchmark")
+    parser.add_argument("--jobs", type=int, default=50000, help="Corpus size")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--state", help="Existing DB to query instead of building one")
+    parser.add_argument("--keep", help="Build the DB at this path and keep it")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="jobhunt-search-") as tmp:
+        save_rate = 0.0
+        if args.state:
+            state = StateManager(args.state)
+        else:
+            path = args.keep or str(Path(tmp) / "search.sqlite")
+            state = StateManager(path)
+            print(f"🏗️  Saving {args.jobs:,} postings...")
+            save_rate = build(state, args.jobs, args.seed)
+        jobs = state.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        results = {name: time_query(state, spec, args.repeat) for name, spec in QUERIES.items()}
+        state.close()
+
+    print_results(results, jobs, save_rate)
+
+    baseline_path = Path(args.baseline)
+    settings = {"jobs": jobs, "seed": args.seed}
+
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps({"settings": settings, "results": results}, indent=2, sort_keys=True) + "\n")
+        print(f"📝 Baseline written to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print("ℹ️  No baseline found (run with --update-baseline)")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())
+    if baseline.get("settings") != settings:
+        print("⚠️  Baseline was recorded with a different corpus - comparison may be meaningless")
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) vs {baseline_path.name}:")
+        for message in regressions:
+            print(f"   {message}")
+        return 1
+
+    print(f"✅ Within {args.tolerance:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+CLI startup benchmark
+
+Runs every jobhunt.py subcommand in a fresh interpreter against an empty
+temporary state and reports the fastest of N runs (noise on a shared
+machine only ever adds time, so the minimum is the stable number).
+Commands that would touch the network or never return (serve,
+test-slack) are timed with --help, which still covers interpreter
+start, imports and argument parsing.
+
+Usage:
+    python3 bench/startup.py
+    python3 bench/startup.py --runs 20
+    python3 bench/startup.py --update-baseline        # rewrite bench/startup_baseline.json
+
+Exits 1 if a subcommand regresses past --tolerance (and --min-delta-ms)
+against the baseline.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+JOBHUNT = ROOT / "jobhunt.py"
+DEFAULT_BASELINE = ROOT / "bench" / "startup_baseline.json"
+
+# name -> jobhunt.py arguments
+COMMANDS = {
+    "help": ["--help"],
+    "scan": ["scan", "--dry-run"],
+    "serve": ["serve", "--help"],
+    "merge": ["merge"],
+    "test-slack": ["test-slack", "--help"],
+    "flush-alerts": ["flush-alerts"],
+    "schedule": ["schedule"],
+    "search": ["search", "kubernetes"],
+    "stats": ["stats"],
+    "compact": ["compact"],
+    "restore": ["restore"],
+    "source-health": ["source-health"],
+}
+
+
+def write_config(directory: Path) -> Path:
+    """The test config's filters without any boards; everything else lands in `directory`"""
+    config = json.loads((ROOT / "config.test.json").read_text())
+    config["sources"] = {}
+    config["state_path"] = str(directory / ".state" / "jobhunt.sqlite")
+    # flush-alerts must not find a sink to deliver to
+    config["alerts"] = {"sinks": []}
+    path = directory / "config.json"
+    path.write_text(json.dumps(config))
+    return path
+
+
+def time_command(argv: list, cwd: Path, runs: int, warmup: int = 3) -> float:
+    """Fastest wall milliseconds of `argv` over `runs` runs (after `warmup` untimed ones)"""
+    samples = []
+    for i in range(warmup + runs):
+        started = time.perf_counter()
+        subprocess.run(argv, cwd=str(cwd), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if i >= warmup:
+            samples.append((time.perf_counter() - started) * 1000)
+    return round(min(samples), 1)
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list:
+    """Return regression messages"""
+    regressions = []
+    for name, current in results.items():
+        old = baseline.get("results", {}).get(name)
+        if not old:
+            continue
+        if current - old > max(old * tolerance, min_delta_ms):
+            regressions.append(f"{name}: {old} -> {current} ms ({(current - old) / old:+.0%})")
+    return regressions
+
+
+def print_results(results: dict, interpreter_ms: float, baseline: dict):
+    previous = baseline.get("results", {})
+    print(f"\n{'='*52}")
+    print("🚀 CLI STARTUP BENCHMARK")
+    print(f"{'='*52}")
+    print(f"  {'Command':<18}{'Best ms':>11}{'Baseline':>11}{'Change':>10}")
+    for name, ms in results.items():
+        old = previous.get(name)
+        change = f"{(ms - old) / old:+.0%}" if old else ""
+        print(f"  {name:<18}{ms:>11.1f}{old or '-':>11}{change:>10}")
+    print(f"  {'(bare python)':<18}{interpreter_ms:>11.1f}")
+    print(f"{'='*52}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI startup benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="Timed runs per command")
+    parser.add_argument("--commands", nargs="+", choices=list(COMMANDS), default=list(COMMANDS))
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression")
+    parser.add_argument("--min-delta-ms", type=float, default=15.0, help="Ignore regressions smaller than this")
+    args = parser.parse_args()
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+
+    with tempfile.TemporaryDirectory(prefix="jobhunt-startup-") as tmp:
+        directory = Path(tmp)
+        config_path = write_config(directory)
+        interpreter_ms = time_command([sys.executable, "-c", "pass"], directory, args.runs)
+        results = {}
+        for name in args.commands:
+            argv = [sys.executable, str(JOBHUNT), "--config", str(config_path), *COMMANDS[name]]
+            results[name] = time_command(argv, directory, args.runs)
+
+    print_results(results, interpreter_ms, baseline)
+
+    if args.update_baseline:
+        merged = {**baseline.get("results", {}), **results}
+        baseline_path.write_text(json.dumps({"runs": args.runs, "results": merged}, indent=2, sort_keys=True) + "\n")
+        print(f"📝 Baseline written to {baseline_path}")
+        return 0
+
+    if not baseline:
+        print("ℹ️  No baseline found (run with --update-baseline)")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) vs {baseline_path.name}:")
+        for message in regressions:
+            print(f"   {message}")
+        return 1
+
+    print(f"✅ Within {args.tolerance:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
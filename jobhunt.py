@@ -5,63 +5,226 @@ Remote SRE Job Scanner CLI
 import sys
 import os
 import argparse
+from datetime import datetime, timedelta
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Auto-load .env file
-env_file = Path(__file__).parent / '.env'
-if env_file.exists():
-    with open(env_file) as f:
+# Light modules only - anything that pulls in requests, BeautifulSoup or the
+# source plugins is imported by the commands that need it (bench/startup.py)
+from src.config import Config
+from src.state import StateManager, ScanCursor
+from src.source_health import SourceHealth, DEFAULT_DB_PATH as HEALTH_DB_PATH
+from src.tiers import plan_scan, add_carryover
+from src.schedule import BoardScheduler
+from src.budget import ScanBudget, board_key, parse_duration
+from src.memory import parse_size
+from src.shard import (
+    parse_shard, shard_sources, segment_paths, fork_segment, set_segment_meta,
+    find_segments, merge_segment, remove_segment
+)
+
+
+def load_env(path: Path = Path(__file__).parent / '.env'):
+    """Export KEY=value lines of a .env file (overrides the environment)"""
+    if not path.exists():
+        return
+    with open(path) as f:
         for line in f:
             line = line.strip()
             if line and not line.startswith('#') and '=' in line:
                 key, val = line.split('=', 1)
                 os.environ[key] = val
 
-from src.config import Config
-from src.state import StateManager
-from src.scanner import JobScanner
-from src.alerting import SlackAlerter
-from src.source_health import SourceHealth
+
+def parse_since(text: str) -> str:
+    """'30d' / '12h' (ago) or an ISO date -> ISO timestamp (UTC, like the state DB)"""
+    try:
+        return datetime.fromisoformat(text).isoformat()
+    except ValueError:
+        return (datetime.utcnow() - timedelta(seconds=parse_duration(text))).isoformat()
 
 
 def cmd_scan(args):
     """Run job scan"""
+    from src.scanner import JobScanner
+    from src.sinks import build_sinks
+    from src.profiling import Profiler
+
     config = Config(args.config)
-    state = StateManager(config.get_state_path())
 
-    # Setup Slack - always try if webhook is available
-    slack = None
+    # A shard scans its slice of boards into its own state segment
+    shard = None
+    state_path, health_path = config.get_state_path(), HEALTH_DB_PATH
+    if args.shard:
+        shard = parse_shard(args.shard)
+        state_path, health_path = segment_paths(state_path, health_path, *shard)
+        fork_segment(HEALTH_DB_PATH, health_path)
+        if not fork_segment(config.get_state_path(), state_path, {"shard": args.shard, "health_segment": health_path}):
+            print(f"⚠️  Continuing unmerged segment {state_path} (run merge)")
+        print(f"🧩 Shard {shard[0]}/{shard[1]} -> {state_path}")
+
+    state = StateManager(state_path)
+
+    alerts_config = config.get_alerts_config()
+    if args.digest:
+        alerts_config["mode"] = "digest"
+
+    # Setup alert sinks - Slack is always tried if a webhook is available
+    sinks = []
     if not args.dry_run:
         webhook = config.get_slack_webhook()
+        sinks = build_sinks(alerts_config, webhook)
         if webhook:
-            print(f"✅ Slack webhook configured")
-            slack = SlackAlerter(webhook)
+            print(f"✅ Slack webhook configured ({alerts_config['mode']} mode)")
         else:
             print("⚠️  No Slack webhook found (set SLACK_WEBHOOK_URL env var)")
+        for sink in sinks:
+            if sink.type_name != "slack":
+                print(f"✅ Alert sink: {sink.name} ({sink.type_name})")
+
+    # Tier 1 every run, rotating slices of tier 2/3
+    cursor = ScanCursor(config.get_cursor_path())
+    tier_config = config.get_tier_config()
+    if args.all_tiers:
+        tier_config = {tier: {"boards_per_run": 10**9} for tier in tier_config}
+    tiers = config.get_source_tiers()
+    cursor_state = cursor.load()
+    plan, next_cursor = plan_scan(tiers, tier_config, cursor_state)
+
+    # Boards a budgeted run did not get to go first this time
+    budget = ScanBudget(args.budget) if args.budget else None
+    carryover = add_carryover(plan, tiers, cursor_state.get("carryover", []))
+
+    if shard:
+        plan.sources = shard_sources(plan.sources, *shard)
+        owned = {board_key(source_type, i) for source_type, ids in plan.sources.items() for i in ids}
+        carryover = [key for key in carryover if key in owned]
+
+    feeds_config = config.get_feeds_config()
+    if args.full_feeds:
+        feeds_config["incremental"] = False
+
+    # Churn is always tracked; boards are only skipped with schedule.enabled
+    scheduler = BoardScheduler(state, config.get_schedule_config())
+    if args.all_tiers or args.ignore_schedule:
+        scheduler.enabled = False
+
+    concurrency = config.get_concurrency_config()
+    if args.fixed_workers:
+        concurrency["adaptive"] = False
 
     # Create scanner
     scanner = JobScanner(
-        sources=config.get_sources(),
+        sources=plan.sources,
         filter_config=config.get_filters(),
         state_manager=state,
-        slack_alerter=slack,
+        sinks=sinks,
         max_workers=args.workers,
         dry_run=args.dry_run,
         explain=args.explain,
-        print_all=args.print_all
+        print_all=args.print_all,
+        metrics_config=config.get_metrics_config(),
+        profiler=Profiler(
+            enabled=args.profile,
+            use_cprofile=args.cprofile,
+            use_tracemalloc=args.tracemalloc
+        ),
+        profile_dir=args.profile_dir,
+        dedup_config=config.get_dedup_config(),
+        alerts_config=alerts_config,
+        tier_plan=plan,
+        scheduler=scheduler,
+        budget=budget,
+        carryover=carryover,
+        source_health=SourceHealth(health_path),
+        deliver=shard is None,
+        feeds_config=feeds_config,
+        max_memory=args.max_memory,
+        # Checkpoints only serve --resume (and budgeted runs a CI timeout may cut off);
+        # dry runs neither write them nor clear a real run's
+        checkpoint=not args.dry_run and bool(args.resume or args.budget),
+        resume_since=(datetime.utcnow() - timedelta(seconds=args.resume)).isoformat() if args.resume else None,
+        concurrency=concurrency
     )
 
     # Run scan
     stats = scanner.scan()
     state.close()
 
+    # Only a completed (non dry) run moves the rotation forward
+    if not args.dry_run:
+        next_state = {
+            **(cursor_state if args.all_tiers else next_cursor),
+            "carryover": scanner.carryover,
+        }
+        if shard:
+            # Every shard plans the same rotation; merge saves it once
+            set_segment_meta(state_path, "cursor", next_state)
+        else:
+            cursor.save(next_state)
+
     return 0
 
 
+def cmd_merge(args):
+    """Fold shard segments into the main state"""
+    config = Config(args.config)
+    state_path = config.get_state_path()
+    segments = args.segments or find_segments(state_path)
+    if not segments:
+        print("ℹ️  No shard segments to merge")
+        return 0
+
+    # Make sure both main DBs exist with the current schema
+    StateManager(state_path).close()
+    SourceHealth(HEALTH_DB_PATH)
+
+    cursor = ScanCursor(config.get_cursor_path())
+    next_cursor = None
+    carryover = []
+    for segment in segments:
+        counts = merge_segment(state_path, HEALTH_DB_PATH, segment)
+        print(
+            f"🧩 {Path(segment).name}: {counts['jobs']} jobs, {counts['boards']} boards,"
+            f" {counts['alerts']} alerts queued ({counts['duplicate_alerts']} cross-shard duplicates dropped),"
+            f" {counts['health']} health records, {counts['runs']} scan runs, {counts['events']} closed/reopened events"
+        )
+        if counts["cursor"]:
+            next_cursor = next_cursor or counts["cursor"]
+            carryover.extend(counts["cursor"].get("carryover", []))
+        if not args.keep:
+            remove_segment(segment)
+            health_segment = counts.get("health_segment")
+            if health_segment:
+                remove_segment(health_segment)
+
+    if next_cursor:
+        cursor.save({**next_cursor, "carryover": carryover})
+
+    print("✅ Merged - run flush-alerts (or the next scan) to deliver queued alerts")
+    return 0
+
+
+def cmd_serve(args):
+    """Run scans on an interval in one long-lived process"""
+    from src.daemon import ScanDaemon
+
+    daemon = ScanDaemon(
+        args.config,
+        max_workers=args.workers,
+        fixed_workers=args.fixed_workers,
+        dry_run=args.dry_run,
+        interval=args.interval,
+        port=args.port,
+    )
+    return daemon.run()
+
+
 def cmd_test_slack(args):
     """Test Slack integration"""
+    from src.alerting import SlackAlerter
+
     config = Config(args.config)
     webhook = config.get_slack_webhook()
 
@@ -75,6 +238,247 @@ def cmd_test_slack(args):
     return 0
 
 
+def cmd_flush_alerts(args):
+    """Retry alerts left in the outbox"""
+    from src.outbox import DeliveryPool
+    from src.sinks import build_sinks
+
+    config = Config(args.config)
+
+    alerts_config = config.get_alerts_config()
+    if args.digest:
+        alerts_config["mode"] = "digest"
+
+    sinks = build_sinks(alerts_config, config.get_slack_webhook())
+    if not sinks:
+        print("❌ No alert sinks configured (set SLACK_WEBHOOK_URL or alerts.sinks)")
+        return 1
+
+    # Make sure the outbox table exists on old state DBs
+    StateManager(config.get_state_path()).close()
+
+    pool = DeliveryPool(
+        config.get_state_path(),
+        sinks,
+        max_attempts=alerts_config["max_attempts"],
+        backoff=alerts_config["backoff"]
+    )
+    counts = pool.flush(include_failed=not args.pending_only, timeout=alerts_config["drain_timeout"])
+
+    leftover = False
+    for name, sink_counts in counts.items():
+        print(f"📢 {name}: delivered {sink_counts['sent']} alerts")
+        if sink_counts["pending"] or sink_counts["failed_total"]:
+            print(f"⚠️  {name}: still queued: {sink_counts['pending']} pending, {sink_counts['failed_total']} failed")
+            leftover = True
+
+    if leftover:
+        for error in sorted(set(pool.errors))[:5]:
+            print(f"  {error}")
+        return 1
+
+    return 0
+
+
+def cmd_schedule(args):
+    """Show upcoming board fetches"""
+    config = Config(args.config)
+    state = StateManager(config.get_state_path())
+    scheduler = BoardScheduler(state, config.get_schedule_config())
+    rows = scheduler.upcoming(limit=args.limit)
+    state.close()
+
+    if not rows:
+        print("ℹ️  No boards scheduled yet (run a scan first)")
+        return 0
+
+    now = datetime.utcnow()
+    print("\n" + "=" * 78)
+    print(f"🗓️  BOARD SCHEDULE ({'enabled' if scheduler.enabled else 'disabled - tracking only'})")
+    print("=" * 78)
+    print(f"  {'Board':<34}{'Next fetch':>12}{'Interval':>10}{'Churn/h':>9}{'Last Δ':>8}{'Fetches':>9}")
+    for row in rows:
+        due_in = datetime.fromisoformat(row["next_due"]) - now
+        hours = due_in.total_seconds() / 3600
+        when = "due" if hours <= 0 else f"in {hours:.1f}h"
+        print(
+            f"  {row['source'] + '/' + row['board']:<34}{when:>12}{row['interval_hours']:>9.1f}h"
+            f"{row['churn_ema']:>9.2f}{row['last_changes']:>8}{row['fetches']:>9}"
+        )
+    print("=" * 78 + "\n")
+    return 0
+
+
+def cmd_search(args):
+    """Full-text search over collected jobs"""
+    config = Config(args.config)
+    state = StateManager(config.get_state_path())
+    try:
+        rows, elapsed_ms = state.search_jobs(
+            args.query,
+            since=args.since,
+            sources=args.source,
+            min_score=args.min_score,
+            order=args.sort,
+            limit=args.limit,
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        state.close()
+
+    print(f"\n🔎 {len(rows)} result{'s' if len(rows) != 1 else ''} for {args.query!r} ({elapsed_ms:.1f} ms)")
+    for row in rows:
+        score = "-" if row["score"] is None else row["score"]
+        print(f"\n  [{score:>3}] {row['title']} @ {row['company']} - {row['location']}")
+        print(f"        {row['source']} · first seen {row['first_seen'][:10]} · {row['url']}")
+        if row["snippet"]:
+            print(f"        {row['snippet']}")
+    print()
+    return 0
+
+
+def cmd_stats(args):
+    """Scan trends, slowest and lowest-yield sources from the run history"""
+    config = Config(args.config)
+    state = StateManager(config.get_state_path())
+    recent = (datetime.utcnow() - timedelta(days=1)).isoformat()
+    days = state.get_run_days(args.since)
+    stages = state.get_run_stages(args.since, recent)
+    by_source = state.get_run_sources(args.since, order="busiest", by_board=False)
+    slowest = state.get_run_sources(args.since, order="slowest", limit=args.limit)
+    lowest_yield = state.get_run_sources(args.since, order="lowest_yield", limit=args.limit)
+    closed = state.get_closed_jobs(args.since, limit=args.limit)
+    reopened = state.get_job_events(args.since, event="reopened", matched=True, limit=args.limit)
+    state.close()
+
+    if not days:
+        print("ℹ️  No scan runs recorded in this period (run a scan first)")
+        return 0
+
+    runs = sum(day["runs"] for day in days)
+    print("\n" + "=" * 94)
+    print(f"📈 SCAN STATS ({runs} runs since {args.since[:10]})")
+    print("=" * 94)
+    print(f"  {'Day':<12}{'Runs':>6}{'Avg s':>9}{'Max s':>9}{'Fetched/run':>13}{'Passed/run':>12}{'New':>6}{'Updated':>9}{'Closed':>8}{'Errors':>8}")
+    for day in days:
+        print(
+            f"  {day['day']:<12}{day['runs']:>6}{day['avg_seconds']:>9.1f}{day['max_seconds']:>9.1f}"
+            f"{day['avg_fetched']:>13,.0f}{day['avg_passed']:>12.1f}{day['new']:>6}{day['updated']:>9}{day['closed']:>8}{day['errors']:>8}"
+        )
+
+    print("\n⏱️  Stage time per run (seconds, summed over worker threads)")
+    print(f"  {'Stage':<12}{'Average':>10}{'Last 24h':>10}{'Change':>9}")
+    for stage in stages:
+        recent_seconds = stage["recent_seconds"]
+        if recent_seconds is None:
+            print(f"  {stage['stage']:<12}{stage['avg_seconds']:>10.2f}{'-':>10}")
+            continue
+        change = (recent_seconds - stage["avg_seconds"]) / stage["avg_seconds"] if stage["avg_seconds"] else 0
+        print(f"  {stage['stage']:<12}{stage['avg_seconds']:>10.2f}{recent_seconds:>10.2f}{change:>+9.0%}")
+
+    print("\n📦 By source")
+    print(f"  {'Source':<16}{'Boards':>8}{'Fetches':>9}{'Avg s':>8}{'Fetch s':>10}{'MB':>9}{'Jobs':>10}{'Matches':>9}{'Errors':>8}")
+    for row in by_source:
+        print(
+            f"  {row['source']:<16}{row['boards']:>8}{row['fetches']:>9}{row['avg_latency']:>8.2f}{row['total_latency']:>10.1f}"
+            f"{row['bytes'] / 1024 ** 2:>9.1f}{row['jobs']:>10,}{row['matches']:>9}{row['errors']:>8}"
+        )
+
+    print("\n🐢 Slowest boards (average fetch time)")
+    print(f"  {'Board':<36}{'Fetches':>9}{'Avg s':>8}{'Max s':>8}{'Avg KB':>9}{'Errors':>8}")
+    for row in slowest:
+        print(
+            f"  {row['source'] + '/' + row['board']:<36}{row['fetches']:>9}{row['avg_latency']:>8.2f}"
+            f"{row['max_latency']:>8.2f}{row['avg_bytes'] / 1024:>9.0f}{row['errors']:>8}"
+        )
+
+    print("\n🪫 Lowest-yield boards (matches per fetch minute, most time spent first)")
+    print(f"  {'Board':<36}{'Fetches':>9}{'Fetch s':>9}{'Jobs':>9}{'Matches':>9}{'Per min':>9}")
+    for row in lowest_yield:
+        print(
+            f"  {row['source'] + '/' + row['board']:<36}{row['fetches']:>9}{row['total_latency']:>9.1f}"
+            f"{row['jobs']:>9,}{row['matches']:>9}{row['matches_per_minute']:>9.2f}"
+        )
+
+    if closed:
+        print("\n🚪 Recently closed matches")
+        for row in closed:
+            listed = datetime.fromisoformat(row["closed_at"]) - datetime.fromisoformat(row["first_seen"])
+            print(f"  {row['closed_at'][:10]}  {row['company']}: {row['title']} (listed {listed.days}d) {row['url']}")
+    if reopened:
+        print("\n🔁 Reopened matches (listed again after closing)")
+        for row in reopened:
+            print(f"  {row['at'][:10]}  {row['company']}: {row['title']} {row['url']}")
+    print("=" * 94 + "\n")
+    return 0
+
+
+def _db_bytes(path: str) -> int:
+    """Size of a SQLite DB including its WAL"""
+    return sum(Path(path + suffix).stat().st_size for suffix in ("", "-wal") if Path(path + suffix).exists())
+
+
+def cmd_compact(args):
+    """Prune state past the retention policy, VACUUM and write the CI snapshot"""
+    from src.snapshot import write_snapshot
+
+    config = Config(args.config)
+    state_path = config.get_state_path()
+    if find_segments(state_path):
+        print("❌ Unmerged shard segments - run `jobhunt.py merge` first")
+        return 1
+
+    before = _db_bytes(state_path)
+    state = StateManager(state_path)
+    deleted = state.prune(config.get_retention_config())
+    state.compact()
+    state.close()
+    after = _db_bytes(state_path)
+
+    pruned = ", ".join(f"{count:,} {table}" for table, count in deleted.items() if count)
+    print(f"🧹 Pruned: {pruned or 'nothing past the retention policy'}")
+    print(f"🗜️  {state_path}: {before / 1024:,.0f} KB -> {after / 1024:,.0f} KB")
+
+    if args.no_snapshot:
+        return 0
+    output = args.output or config.get_snapshot_path()
+    sizes = write_snapshot({
+        "state.sqlite": state_path,
+        "source_health.sqlite": HEALTH_DB_PATH,
+        "scan_cursor.json": config.get_cursor_path(),
+    }, output)
+    print(
+        f"📦 {output}: {Path(output).stat().st_size / 1024:,.0f} KB"
+        f" ({', '.join(sizes)}; {sum(sizes.values()) / 1024:,.0f} KB uncompressed)"
+    )
+    return 0
+
+
+def cmd_restore(args):
+    """Unpack a `compact` snapshot into the state paths"""
+    from src.snapshot import restore_snapshot
+
+    config = Config(args.config)
+    snapshot = args.snapshot or config.get_snapshot_path()
+    if not Path(snapshot).exists():
+        print(f"ℹ️  No snapshot at {snapshot} - starting from the current state")
+        return 0
+    state_path = config.get_state_path()
+    if Path(state_path).exists() and not args.force:
+        print(f"❌ {state_path} already exists - pass --force to replace it")
+        return 1
+
+    restored = restore_snapshot(snapshot, {
+        "state.sqlite": state_path,
+        "source_health.sqlite": HEALTH_DB_PATH,
+        "scan_cursor.json": config.get_cursor_path(),
+    })
+    print(f"✅ Restored {', '.join(restored)} from {snapshot}")
+    return 0
+
+
 def cmd_source_health(args):
     """Show source health status"""
     health = SourceHealth()
@@ -111,7 +515,8 @@ def main():
     parser = argparse.ArgumentParser(description="Remote SRE Job Scanner")
 
     parser.add_argument("--config", default="config.balanced.json", help="Config file")
-    parser.add_argument("--workers", type=int, default=10, help="Workers")
+    parser.add_argument("--workers", type=int, default=10, help="Concurrent fetches to start with (adapted within concurrency bounds)")
+    parser.add_argument("--fixed-workers", action="store_true", help="Keep --workers fetches in flight, no adaptive concurrency")
 
     subparsers = parser.add_subparsers(dest="command")
 
@@ -120,14 +525,78 @@ def main():
     scan_parser.add_argument("--dry-run", action="store_true")
     scan_parser.add_argument("--explain", action="store_true")
     scan_parser.add_argument("--print-all", action="store_true")
+    scan_parser.add_argument("--all-tiers", action="store_true", help="Scan every tier 2/3 board (no rotation)")
+    scan_parser.add_argument(
+        "--budget", type=parse_duration, metavar="DURATION",
+        help="Wall-clock budget, e.g. 5m - fetch the highest-yield boards first, carry the rest over"
+    )
+    scan_parser.add_argument("--shard", metavar="I/N", help="Scan only shard I of N into a state segment (see merge)")
+    scan_parser.add_argument(
+        "--max-memory", type=parse_size, metavar="SIZE",
+        help="Memory ceiling, e.g. 1G - spill job descriptions to a temp file when RSS gets close"
+    )
+    scan_parser.add_argument(
+        "--resume", type=parse_duration, nargs="?", const=parse_duration("6h"), metavar="WINDOW",
+        help="Take boards an interrupted scan fetched within WINDOW (default 6h) from its checkpoints"
+    )
+    scan_parser.add_argument("--full-feeds", action="store_true", help="Read RemoteOK/Remotive/WWR past their high-water marks")
+    scan_parser.add_argument("--ignore-schedule", action="store_true", help="Fetch boards even if not due")
+    scan_parser.add_argument("--digest", action="store_true", help="Batch alerts into Slack digest messages")
+    scan_parser.add_argument("--profile", action="store_true", help="Print per-stage timings and write a Chrome trace")
+    scan_parser.add_argument("--cprofile", action="store_true", help="With --profile: run cProfile per stage")
+    scan_parser.add_argument("--tracemalloc", action="store_true", help="With --profile: track allocations per stage")
+    scan_parser.add_argument("--profile-dir", default="out/profile", help="Where trace/profile files go")
+
+    # serve
+    serve_parser = subparsers.add_parser("serve", help="Scan on an interval with warm connections and a health endpoint")
+    serve_parser.add_argument("--interval", type=parse_duration, metavar="DURATION", help="Time between scans (default: daemon.interval, 5m)")
+    serve_parser.add_argument("--port", type=int, help="Health/metrics port, 0 to disable (default: daemon.port, 8787)")
+    serve_parser.add_argument("--dry-run", action="store_true")
+
+    # merge
+    merge_parser = subparsers.add_parser("merge", help="Fold shard state segments into the main state")
+    merge_parser.add_argument("segments", nargs="*", help="Segment DBs (default: all under .state/shards/)")
+    merge_parser.add_argument("--keep", action="store_true", help="Don't delete segments after merging")
 
     # test-slack
     test_slack_parser = subparsers.add_parser("test-slack")
 
+    # flush-alerts
+    flush_parser = subparsers.add_parser("flush-alerts", help="Retry undelivered alerts from the outbox")
+    flush_parser.add_argument("--digest", action="store_true", help="Send leftovers as one digest")
+    flush_parser.add_argument("--pending-only", action="store_true", help="Skip alerts that exhausted their retries")
+
+    # schedule
+    schedule_parser = subparsers.add_parser("schedule", help="Show upcoming board fetches")
+    schedule_parser.add_argument("--limit", type=int, default=50)
+
+    # search
+    search_parser = subparsers.add_parser("search", help="Full-text search over collected jobs")
+    search_parser.add_argument("query", help='FTS5 query, e.g. "terraform kubernetes location:emea"')
+    search_parser.add_argument("--since", type=parse_since, metavar="AGE|DATE", help="First seen within (30d, 12h) or since a date")
+    search_parser.add_argument("--source", action="append", help="Only this source (repeatable)")
+    search_parser.add_argument("--min-score", type=int, help="Only jobs that scored at least this")
+    search_parser.add_argument("--sort", choices=["rank", "newest", "score"], default="rank")
+    search_parser.add_argument("--limit", type=int, default=20)
+
+    # stats
+    stats_parser = subparsers.add_parser("stats", help="Scan trends and slowest / lowest-yield sources")
+    stats_parser.add_argument("--since", type=parse_since, default="30d", metavar="AGE|DATE", help="Period (default: 30d)")
+    stats_parser.add_argument("--limit", type=int, default=10, help="Boards per table")
+
+    # compact / restore
+    compact_parser = subparsers.add_parser("compact", help="Prune old state, VACUUM and write a compressed snapshot")
+    compact_parser.add_argument("--output", help="Snapshot path (default: snapshot.tar.gz next to the state DB)")
+    compact_parser.add_argument("--no-snapshot", action="store_true", help="Only prune and VACUUM")
+    restore_parser = subparsers.add_parser("restore", help="Unpack a compact snapshot into the state paths")
+    restore_parser.add_argument("snapshot", nargs="?", help="Snapshot path (default: snapshot.tar.gz next to the state DB)")
+    restore_parser.add_argument("--force", action="store_true", help="Replace an existing state DB")
+
     # source-health
     source_health_parser = subparsers.add_parser("source-health", help="Show source health status")
 
     args = parser.parse_args()
+    load_env()
 
     if not args.command:
         parser.print_help()
@@ -135,7 +604,15 @@ def main():
 
     handlers = {
         "scan": cmd_scan,
+        "serve": cmd_serve,
+        "merge": cmd_merge,
         "test-slack": cmd_test_slack,
+        "flush-alerts": cmd_flush_alerts,
+        "schedule": cmd_schedule,
+        "search": cmd_search,
+        "stats": cmd_stats,
+        "compact": cmd_compact,
+        "restore": cmd_restore,
         "source-health": cmd_source_health,
     }
 
@@ -1,32 +1,142 @@
 """
 Slack alerting
+
+Alerts go out one message per job, or in digest mode as a few Block Kit
+messages packing many jobs each (sorted by score, split to stay under
+Slack's block and text limits). Rate limits (429) are retried after the
+server's Retry-After.
 """
 import os
+import time
 import requests
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from .models import Job
 
 
+# Slack rejects messages over 50 blocks and section texts over 3000 chars
+MAX_BLOCKS = 50
+MAX_SECTION_CHARS = 3000
+MAX_MESSAGE_CHARS = 30000
+
+
+class SlackRateLimited(Exception):
+    """Slack kept answering 429 after all retries"""
+
+
+class DigestReport:
+    """Outcome of a digest delivery"""
+
+    def __init__(self):
+        self.delivered: List[Job] = []
+        self.deferred: List[Job] = []
+        self.messages = 0
+        self.errors: List[str] = []
+
+
 class SlackAlerter:
     """Send job alerts to Slack"""
 
-    def __init__(self, webhook_url: Optional[str] = None):
+    def __init__(self, webhook_url: Optional[str] = None, max_retries: int = 3, max_retry_wait: float = 60.0,
+                 timeout: float = 10.0):
         self.webhook_url = webhook_url or os.getenv("SLACK_WEBHOOK_URL")
         if not self.webhook_url:
             raise ValueError("SLACK_WEBHOOK_URL not configured")
+        self.max_retries = max_retries
+        self.max_retry_wait = max_retry_wait
+        self.timeout = timeout
 
-    def send_alert(self, job: Job, result):
-        """Send Slack alert for job"""
-        message = self._format_message(job, result)
+    def _post(self, payload: Dict):
+        """POST to the webhook, sleeping through 429s"""
+        for attempt in range(self.max_retries + 1):
+            resp = requests.post(self.webhook_url, json=payload, timeout=self.timeout)
+            if resp.status_code != 429:
+                resp.raise_for_status()
+                return resp
+
+            try:
+                wait = float(resp.headers.get("Retry-After", 1))
+            except ValueError:
+                wait = 1.0
+            if attempt == self.max_retries or wait > self.max_retry_wait:
+                break
+            time.sleep(wait)
+
+        raise SlackRateLimited(f"Rate limited by Slack (Retry-After: {resp.headers.get('Retry-After')})")
+
+    def send_alert(self, job: Job, result, duplicates: Optional[List[Dict]] = None):
+        """Send Slack alert for job (with links to cross-posted copies)"""
+        message = self._format_message(job, result, duplicates)
         payload = {
             "text": message,
             "unfurl_links": False,
             "unfurl_media": False,
         }
-        resp = requests.post(self.webhook_url, json=payload, timeout=10)
-        resp.raise_for_status()
+        self._post(payload)
+
+    def send_digest(self, alerts: List[Tuple], duplicates: Optional[Dict[str, List[Dict]]] = None) -> DigestReport:
+        """
+        Send (job, result) pairs as batched Block Kit messages, best score first
+
+        A chunk that fails is deferred and the next one is tried; once Slack
+        keeps rate limiting, everything not yet sent is deferred.
+        """
+        duplicates = duplicates or {}
+        report = DigestReport()
+
+        ranked = sorted(alerts, key=lambda pair: pair[1].score, reverse=True)
+        sections = [
+            (job, self._format_digest_entry(job, result, duplicates.get(job.get_db_key())))
+            for job, result in ranked
+        ]
+        chunks = self._chunk(sections)
 
-    def _format_message(self, job: Job, result) -> str:
+        for index, chunk in enumerate(chunks):
+            jobs = [job for job, _ in chunk]
+            header = f"📬 {len(ranked)} new matches" + (f" ({index + 1}/{len(chunks)})" if len(chunks) > 1 else "")
+            blocks = [{"type": "header", "text": {"type": "plain_text", "text": header}}]
+            blocks.extend({"type": "section", "text": {"type": "mrkdwn", "text": text}} for _, text in chunk)
+            payload = {
+                "text": header,
+                "blocks": blocks,
+                "unfurl_links": False,
+                "unfurl_media": False,
+            }
+
+            try:
+                self._post(payload)
+            except SlackRateLimited as e:
+                report.errors.append(str(e))
+                report.deferred.extend(job for rest in chunks[index:] for job, _ in rest)
+                break
+            except requests.RequestException as e:
+                report.errors.append(str(e))
+                report.deferred.extend(jobs)
+                continue
+
+            report.messages += 1
+            report.delivered.extend(jobs)
+
+        return report
+
+    @staticmethod
+    def _chunk(sections: List[Tuple]) -> List[List[Tuple]]:
+        """Split sections so each message stays under the block/char limits"""
+        chunks = []
+        current = []
+        chars = 0
+        for section in sections:
+            # One block per message is the header
+            if current and (len(current) + 1 >= MAX_BLOCKS or chars + len(section[1]) > MAX_MESSAGE_CHARS):
+                chunks.append(current)
+                current = []
+                chars = 0
+            current.append(section)
+            chars += len(section[1])
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _format_message(self, job: Job, result, duplicates: Optional[List[Dict]] = None) -> str:
         """Format job as Slack message"""
         lines = [
             f"🎯 *{job.title}*",
@@ -36,22 +146,50 @@ class SlackAlerter:
         ]
 
         # Add top matched keywords
-        if hasattr(result, 'keyword_matches') and result.keyword_matches:
-            all_matches = []
-            for category, keywords in result.keyword_matches.items():
-                all_matches.extend(keywords)
-
-            if all_matches:
-                top_matches = all_matches[:5]
-                lines.append(f"🔑 {', '.join(top_matches)}")
+        top_matches = self._top_keywords(result)
+        if top_matches:
+            lines.append(f"🔑 {', '.join(top_matches)}")
 
         lines.append(f"🔗 {job.url}")
+
+        if duplicates:
+            links = ", ".join(f"<{d['url']}|{d['source']}>" for d in duplicates)
+            lines.append(f"🔁 Also on: {links}")
+
         return "\n".join(lines)
 
+    def _format_digest_entry(self, job: Job, result, duplicates: Optional[List[Dict]] = None) -> str:
+        """Compact mrkdwn section for one job in a digest"""
+        lines = [
+            f"🎯 *<{job.url}|{job.title}>*",
+            f"🏢 {job.company.upper()} ({job.source})  ·  📍 {job.location}  ·  ⭐ {result.score}",
+        ]
+
+        top_matches = self._top_keywords(result)
+        if top_matches:
+            lines.append(f"🔑 {', '.join(top_matches)}")
+
+        if duplicates:
+            links = ", ".join(f"<{d['url']}|{d['source']}>" for d in duplicates)
+            lines.append(f"🔁 Also on: {links}")
+
+        text = "\n".join(lines)
+        if len(text) > MAX_SECTION_CHARS:
+            text = text[:MAX_SECTION_CHARS - 1] + "…"
+        return text
+
+    @staticmethod
+    def _top_keywords(result, limit: int = 5) -> List[str]:
+        if not getattr(result, 'keyword_matches', None):
+            return []
+        all_matches = []
+        for category, keywords in result.keyword_matches.items():
+            all_matches.extend(keywords)
+        return all_matches[:limit]
+
     def send_test(self):
         """Send test message"""
         payload = {"text": "✅ Remote SRE Job Scanner is working!"}
-        resp = requests.post(self.webhook_url, json=payload, timeout=10)
-        resp.raise_for_status()
+        self._post(payload)
         print("✅ Test alert sent successfully!")
 
@@ -0,0 +1,106 @@
+"""
+Time-budgeted scans
+
+`scan --budget 5m` ranks boards by expected value - historical matches per
+second of fetch time (board_stats in the state DB) - and dispatches them in
+that order until the fetch phase of the budget is used up. Fetches still in
+flight get the same deadline (BaseSource.deadline), and every board that
+was not fetched is carried over to the front of the next run.
+"""
+import re
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(d|h|m|s)?", re.IGNORECASE)
+_UNITS = {"d": 86400, "h": 3600, "m": 60, "s": 1, None: 1}
+
+
+def parse_duration(text: str) -> float:
+    """'90s' / '5m' / '1h30m' / '30d' / '300' -> seconds"""
+    text = text.strip()
+    pos = 0
+    total = 0.0
+    for match in _DURATION_RE.finditer(text):
+        if match.start() != pos or not match.group(0):
+            break
+        total += float(match.group(1)) * _UNITS[match.group(2) and match.group(2).lower()]
+        pos = match.end()
+    if not text or pos != len(text) or total <= 0:
+        raise ValueError(f"Invalid duration: {text!r} (use e.g. 90s, 5m, 1h30m)")
+    return total
+
+
+def format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(round(seconds)), 60)
+    return f"{minutes}m{secs:02d}s" if minutes else f"{secs}s"
+
+
+class ScanBudget:
+    """Wall-clock budget for one scan"""
+
+    def __init__(self, seconds: float, reserve_fraction: float = 0.15, min_reserve: float = 10.0):
+        self.seconds = seconds
+        # Time kept back for dedup, filtering and alert delivery
+        self.reserve = min(max(seconds * reserve_fraction, min_reserve), seconds / 2)
+        self.started = time.monotonic()
+
+    @property
+    def fetch_deadline(self) -> float:
+        """time.monotonic() value after which no fetch should be running"""
+        return self.started + self.seconds - self.reserve
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def can_dispatch(self, expected_seconds: float) -> bool:
+        return time.monotonic() + expected_seconds <= self.fetch_deadline
+
+
+def board_key(source_type: str, identifier: str) -> str:
+    return f"{source_type}/{identifier}"
+
+
+def rank_tasks(
+    tasks: List[Tuple],
+    board_stats: Dict[Tuple[str, str], Dict],
+    carryover: Optional[List[str]] = None
+) -> Tuple[List[Tuple], Dict[str, float]]:
+    """
+    Order (source_type, identifier, ...) tasks by expected value
+
+    Carried-over boards come first (in their previous order), then the rest
+    by matches per fetch second. Boards without history get the median
+    value so they are neither starved nor favoured.
+
+    Returns:
+        (ordered tasks, expected fetch seconds per board key)
+    """
+    carryover = carryover or []
+
+    values = {}
+    expected = {}
+    for task in tasks:
+        stats = board_stats.get((task[0], task[1]))
+        if stats and stats["fetches"]:
+            seconds = max(stats["fetch_seconds"], 0.05)
+            values[board_key(task[0], task[1])] = (stats["matches"] + 0.1) / seconds
+            expected[board_key(task[0], task[1])] = seconds
+
+    default_value = statistics.median(values.values()) if values else 0.0
+    default_seconds = statistics.median(expected.values()) if expected else 2.0
+
+    position = {key: i for i, key in enumerate(carryover)}
+    for task in tasks:
+        key = board_key(task[0], task[1])
+        values.setdefault(key, default_value)
+        expected.setdefault(key, default_seconds)
+
+    def sort_key(task):
+        key = board_key(task[0], task[1])
+        if key in position:
+            return (0, position[key], 0.0)
+        return (1, 0, -values[key])
+
+    return sorted(tasks, key=sort_key), expected
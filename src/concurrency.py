@@ -0,0 +1,201 @@
+"""
+Adaptive fetch concurrency
+
+`--workers` is where a scan starts; from there the number of fetches in
+flight is steered between `min_workers` and `max_workers` by AIMD, the way
+TCP sizes its congestion window:
+
+- additive increase: +`increase` after each round (as many clean
+  completions as the current limit) that ran saturated and kept up its
+  throughput
+- multiplicative decrease: x`decrease` when a host throttles (429/5xx),
+  times out or drops the connection, or its latency EWMA climbs past
+  `latency_factor` x its baseline. Fetches started before the limit
+  dropped went out at the old rate and carry no signal, so one burst of
+  errors counts once.
+
+Fetches that failed for other reasons (a 404, the scan budget running
+out) count as neither.
+
+Signals are tracked per host - each source type is one API (Greenhouse,
+Lever, ...) - while the limit is shared by the scan. Every change lands in
+`timeline` for the run summary.
+"""
+import time
+from typing import Dict, List, Optional
+
+import requests
+
+from .sources.base import DeadlineExceeded, THROTTLE_STATUSES
+
+# Per-host latency smoothing, and samples needed before it is judged
+LATENCY_ALPHA = 0.2
+MIN_SAMPLES = 5
+# A round whose throughput fell below this share of the previous one holds the limit
+THROUGHPUT_HOLD = 0.9
+
+
+def congestion_reason(error: Optional[BaseException]) -> Optional[str]:
+    """Why a failed fetch means the host is overloaded (None for board errors like 404)"""
+    # Plugins re-raise request errors wrapped ("Workable API error: ...")
+    while error is not None:
+        if isinstance(error, DeadlineExceeded):
+            return None
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status = error.response.status_code
+            return f"HTTP {status}" if status in THROTTLE_STATUSES else None
+        if isinstance(error, requests.Timeout):
+            return "timeout"
+        if isinstance(error, requests.ConnectionError):
+            return "connection error"
+        error = error.__cause__ or error.__context__
+    return None
+
+
+class ConcurrencyController:
+    """AIMD limit on in-flight fetches"""
+
+    def __init__(
+        self,
+        initial: int,
+        min_workers: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        increase: int = 1,
+        decrease: float = 0.5,
+        latency_factor: float = 3.0,
+    ):
+        # Without bounds the limit is pinned to `initial`
+        self.min_workers = max(1, min_workers if min_workers is not None else initial)
+        self.max_workers = max(self.min_workers, max_workers if max_workers is not None else initial)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+
+        self.limit = self._clamp(initial)
+        self.peak = self.limit
+        self.decreases = 0
+        self.started = time.monotonic()
+        self.timeline: List[Dict] = [{"at": 0.0, "limit": self.limit, "reason": "start"}]
+
+        # host -> {"ewma", "baseline", "samples"}
+        self._hosts: Dict[str, Dict] = {}
+        self._last_decrease = self.started
+        self._round = 0
+        self._round_started = self.started
+        self._last_rate: Optional[float] = None
+
+    @property
+    def adaptive(self) -> bool:
+        return self.max_workers > self.min_workers
+
+    def _clamp(self, value: float) -> int:
+        return max(self.min_workers, min(self.max_workers, int(value)))
+
+    def record(
+        self,
+        host: str,
+        latency: float,
+        error: Optional[BaseException] = None,
+        throttled: int = 0,
+        in_flight: Optional[int] = None,
+        measured: bool = True,
+    ) -> int:
+        """
+        Feed one finished fetch and return the limit for the next dispatch
+
+        `throttled` counts 429/5xx answers retried along the way, `in_flight`
+        is how many fetches were running when it finished. `measured` is
+        False for fetches that made no request of their own (shared feeds).
+        """
+        now = time.monotonic()
+        if not self.adaptive or now - latency < self._last_decrease:
+            return self.limit
+
+        reason = congestion_reason(error)
+        if reason is None and throttled:
+            reason = f"throttled x{throttled}"
+        if reason is None and measured and error is None:
+            reason = self._observe_latency(host, latency)
+        if reason is not None:
+            self._back_off(now, f"{reason} on {host}")
+            return self.limit
+        # Budget cut-offs and board errors (404) are neither congestion nor clean completions
+        if error is not None:
+            return self.limit
+
+        # Only a limit that was actually used says anything about the next one
+        if in_flight is not None and in_flight < self.limit:
+            return self.limit
+        self._round += 1
+        if self._round < self.limit:
+            return self.limit
+
+        rate = self._round / max(now - self._round_started, 1e-6)
+        grow = self._last_rate is None or rate >= self._last_rate * THROUGHPUT_HOLD
+        self._last_rate = rate
+        self._start_round(now)
+        if grow and self.limit < self.max_workers:
+            self._change(now, self.limit + self.increase, f"+{self.increase} ({rate:.1f} fetches/s)")
+        return self.limit
+
+    def _observe_latency(self, host: str, latency: float) -> Optional[str]:
+        """Update the host's latency EWMA; a reason once it is inflated"""
+        stats = self._hosts.setdefault(host, {"ewma": None, "baseline": None, "samples": 0})
+        ewma = latency if stats["ewma"] is None else stats["ewma"] + LATENCY_ALPHA * (latency - stats["ewma"])
+        stats["ewma"] = ewma
+        stats["samples"] += 1
+        if stats["samples"] < MIN_SAMPLES:
+            return None
+        if stats["baseline"] is None or ewma < stats["baseline"]:
+            stats["baseline"] = ewma
+            return None
+        if ewma > stats["baseline"] * self.latency_factor:
+            return f"latency {ewma / stats['baseline']:.1f}x"
+        return None
+
+    def _back_off(self, now: float, reason: str):
+        self._last_decrease = now
+        self._last_rate = None
+        self._start_round(now)
+        # Latency is re-learned at the new limit; baselines are kept
+        for stats in self._hosts.values():
+            stats["ewma"] = None
+            stats["samples"] = 0
+        if self.limit > self.min_workers:
+            self.decreases += 1
+            self._change(now, self.limit * self.decrease, reason)
+
+    def _start_round(self, now: float):
+        self._round = 0
+        self._round_started = now
+
+    def _change(self, now: float, limit: float, reason: str):
+        self.limit = self._clamp(limit)
+        self.peak = max(self.peak, self.limit)
+        self.timeline.append({"at": round(now - self.started, 2), "limit": self.limit, "reason": reason})
+
+    def summary_lines(self, max_lines: int = 10) -> List[str]:
+        """Timeline with runs of increases folded into one line each"""
+        segments = []
+        for entry in self.timeline:
+            increase = entry["reason"].startswith("+")
+            if increase and segments and segments[-1]["increase"]:
+                segments[-1].update(until=entry["at"], limit=entry["limit"], steps=segments[-1]["steps"] + 1)
+                continue
+            segments.append({
+                "at": entry["at"], "until": entry["at"], "limit": entry["limit"],
+                "reason": entry["reason"], "increase": increase, "steps": 1,
+            })
+
+        lines = []
+        for segment in segments:
+            at = f"{segment['at']:.1f}s"
+            reason = segment["reason"]
+            if segment["increase"] and segment["steps"] > 1:
+                at = f"{segment['at']:.1f}-{segment['until']:.1f}s"
+                reason = f"{segment['steps']} increases"
+            lines.append(f"{at:>14}  {segment['limit']:>3}  {reason}")
+        if len(lines) > max_lines:
+            hidden = len(lines) - max_lines + 1
+            lines = lines[:1] + [f"{'...':>14}       {hidden} more changes"] + lines[-(max_lines - 2):]
+        return lines
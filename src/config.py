@@ -29,15 +29,67 @@ class Config:
         normalized = {}
         for source_type, config in sources.items():
             if isinstance(config, dict):
-                # New format: {"boards": [...]}
-                key = list(config.keys())[0]
-                normalized[source_type] = config[key]
+                # New format: {"boards": [...]} (+ optional "tier2"/"tier3"); the list
+                # key varies by source ("accounts", "job_boards", ...) and may be absent
+                keys = [k for k in config if not k.startswith("tier")]
+                normalized[source_type] = config[keys[0]] if keys else []
             else:
                 # Old format: direct list
                 normalized[source_type] = config
 
         return normalized
 
+    def get_source_tiers(self) -> Dict[str, Dict[str, List[str]]]:
+        """Get sources split by tier: {source_type: {"tier1": [...], "tier2": [...], "tier3": [...]}}"""
+        sources = self.config.get("sources", {})
+        tier1 = self.get_sources()
+
+        tiers = {}
+        for source_type, config in sources.items():
+            tiers[source_type] = {"tier1": tier1.get(source_type, [])}
+            if isinstance(config, dict):
+                for tier in ("tier2", "tier3"):
+                    if config.get(tier):
+                        tiers[source_type][tier] = config[tier]
+        return tiers
+
+    def get_tier_config(self) -> Dict:
+        """Get rotation sizes for tier 2/3"""
+        tiers = {
+            "tier2": {"boards_per_run": 25},
+            "tier3": {"boards_per_run": 10},
+        }
+        for tier, settings in self.config.get("tiers", {}).items():
+            tiers.setdefault(tier, {}).update(settings)
+        return tiers
+
+    def get_schedule_config(self) -> Dict:
+        """Get adaptive revisit scheduling settings"""
+        return self.config.get("schedule", {})
+
+    def get_feeds_config(self) -> Dict:
+        """Get high-water-mark settings for RemoteOK/Remotive/WWR"""
+        feeds = {
+            "incremental": True,
+            "full_pass_hours": 24,
+        }
+        feeds.update(self.config.get("feeds", {}))
+        return feeds
+
+    def get_daemon_config(self) -> Dict:
+        """Get `jobhunt.py serve` settings"""
+        daemon = {
+            "interval": "5m",
+            "host": "127.0.0.1",
+            "port": 8787,
+        }
+        daemon.update(self.config.get("daemon", {}))
+        return daemon
+
+    def get_cursor_path(self) -> str:
+        """Get scan cursor path (next to the state DB)"""
+        return self.config.get("cursor_path", str(Path(self.get_state_path()).parent / "scan_cursor.json"))
+
     def get_filters(self) -> Dict:
         """Get filters dict"""
         return self.config.get("filters", {})
@@ -46,6 +98,63 @@ class Config:
         """Get state DB path"""
         return self.config.get("state_path", ".state/jobhunt.sqlite")
 
+    def get_snapshot_path(self) -> str:
+        """Get `compact` snapshot path (next to the state DB)"""
+        return self.config.get("snapshot_path", str(Path(self.get_state_path()).parent / "snapshot.tar.gz"))
+
+    def get_retention_config(self) -> Dict:
+        """Get state pruning settings (days, and a cap on recorded scan runs)"""
+        retention = {
+            "closed_days": 30,
+            "unseen_days": 90,
+            "history_days": 180,
+            "max_runs": 5000,
+        }
+        retention.update(self.config.get("retention", {}))
+        return retention
+
+    def get_concurrency_config(self) -> Dict:
+        """Get adaptive fetch concurrency settings (--workers is the starting point)"""
+        concurrency = {
+            "adaptive": True,
+            "min_workers": 2,
+            "max_workers": 32,
+            "increase": 1,
+            "decrease": 0.5,
+            "latency_factor": 3.0,
+        }
+        concurrency.update(self.config.get("concurrency", {}))
+        return concurrency
+
+    def get_metrics_config(self) -> Dict:
+        """Get metrics export settings"""
+        metrics = {
+            "prometheus_path": "out/jobhunt.prom",
+            "run_record_path": "out/last_run.json",
+        }
+        metrics.update(self.config.get("metrics", {}))
+        return metrics
+
+    def get_dedup_config(self) -> Dict:
+        """Get cross-source duplicate detection settings"""
+        dedup = {"enabled": True}
+        dedup.update(self.config.get("dedup", {}))
+        return dedup
+
+    def get_alerts_config(self) -> Dict:
+        """Get alert delivery settings"""
+        alerts = {
+            "mode": "single",
+            "max_retries": 3,
+            "max_retry_wait": 60,
+            "concurrency": 4,
+            "max_attempts": 5,
+            "backoff": 2.0,
+            "drain_timeout": 30,
+        }
+        alerts.update(self.config.get("alerts", {}))
+        return alerts
+
     def get_slack_webhook(self) -> Optional[str]:
         """Get Slack webhook URL"""
         # Try environment variable first (for GitHub Actions)
@@ -0,0 +1,292 @@
+"""
+Long-running scan daemon
+
+`jobhunt.py serve` runs the scan loop in one process instead of paying
+interpreter start-up, imports, config parsing and cold connections on
+every cron/timer run. Kept warm between scans:
+
+- the state DB connection (StateManager)
+- HTTP sessions to the ATS APIs (sources.base.pooled_session)
+- the compiled JobFilter, including the GeoFilter verdict cache
+- alert sinks, scheduler and metrics registry
+
+Every `interval` the daemon runs a scan; with the adaptive schedule
+always on, only boards that are due get fetched, so polling every few
+minutes is cheap. The config file is reloaded when its mtime changes (or
+on SIGHUP). A small HTTP endpoint serves /health (JSON) and /metrics
+(Prometheus text).
+"""
+import json
+import os
+import signal
+import sqlite3
+import threading
+import time
+import traceback
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from .budget import format_duration, parse_duration
+from .config import Config
+from .filtering import JobFilter
+from .metrics import MetricsRegistry
+from .scanner import JobScanner
+from .schedule import BoardScheduler
+from .sinks import AlertSink, build_sinks
+from .state import ScanCursor, StateManager
+from .tiers import add_carryover, plan_scan
+
+# State is pruned (config "retention") this often; `compact` is for CI/cron
+PRUNE_INTERVAL = 24 * 3600
+
+
+class ScanDaemon:
+    """Run scans on an interval in one long-lived process"""
+
+    def __init__(
+        self,
+        config_path: str,
+        max_workers: int = 10,
+        dry_run: bool = False,
+        interval: Optional[float] = None,
+        port: Optional[int] = None,
+        fixed_workers: bool = False
+    ):
+        self.config_path = config_path
+        self.max_workers = max_workers
+        self.fixed_workers = fixed_workers
+        # Each scan starts where the last one's adaptive concurrency ended
+        self.workers = max_workers
+        self.dry_run = dry_run
+        # CLI overrides win over the config's daemon section
+        self.interval_override = interval
+        self.port_override = port
+
+        self.metrics = MetricsRegistry()
+        self.config: Optional[Config] = None
+        self.state: Optional[StateManager] = None
+        self.job_filter: Optional[JobFilter] = None
+        self.sinks: List[AlertSink] = []
+        self.scheduler: Optional[BoardScheduler] = None
+        self.interval = 300.0
+
+        self._config_mtime = None
+        self._stop = threading.Event()
+        self._reload_requested = False
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        # Read by the HTTP thread
+        self.started_at = datetime.utcnow()
+        self.scans = 0
+        self.last_scan: Optional[Dict] = None
+        self.last_error: Optional[str] = None
+        self.next_scan_at: Optional[float] = None
+        self.last_prune_at: Optional[float] = None
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self._handle_reload)
+
+        self.load_config()
+        self._start_http()
+        print(f"🛰️  Serving - scan every {format_duration(self.interval)}, Ctrl-C to stop")
+
+        try:
+            while not self._stop.is_set():
+                cycle_started = time.monotonic()
+                if self._reload_requested or self._config_changed():
+                    self._reload_requested = False
+                    self.reload_config()
+
+                self.scan_once()
+                self.prune_if_due()
+
+                self.next_scan_at = time.time() + max(0.0, cycle_started + self.interval - time.monotonic())
+                while not self._stop.is_set() and not self._reload_requested and time.time() < self.next_scan_at:
+                    self._stop.wait(min(1.0, self.next_scan_at - time.time()))
+        finally:
+            if self._server:
+                self._server.shutdown()
+                self._server.server_close()
+            if self.state:
+                self.state.close()
+        print("👋 Daemon stopped")
+        return 0
+
+    def load_config(self):
+        """(Re)build everything that depends on the config file"""
+        config = Config(self.config_path)
+        daemon_config = config.get_daemon_config()
+
+        state_path = config.get_state_path()
+        if self.state is None or str(self.state.db_path) != state_path:
+            if self.state:
+                self.state.close()
+            self.state = StateManager(state_path)
+
+        alerts_config = config.get_alerts_config()
+        self.sinks = [] if self.dry_run else build_sinks(alerts_config, config.get_slack_webhook())
+        self.job_filter = JobFilter(config.get_filters(), metrics=self.metrics)
+
+        # Polling every few minutes only makes sense when boards are fetched when due
+        self.scheduler = BoardScheduler(self.state, {**config.get_schedule_config(), "enabled": True})
+
+        self.interval = self.interval_override or parse_duration(str(daemon_config["interval"]))
+        self.config = config
+        self._config_mtime = self._mtime()
+
+    def reload_config(self):
+        try:
+            self.load_config()
+            self.metrics.inc("jobhunt_daemon_config_reloads_total")
+            print(f"🔄 Reloaded {self.config_path}")
+        except Exception as e:
+            # Keep scanning with the last good config
+            self._config_mtime = self._mtime()
+            self.last_error = f"config reload failed: {e}"
+            print(f"  ⚠️  Config reload failed, keeping the previous config: {e}")
+
+    def scan_once(self) -> Optional[Dict]:
+        config = self.config
+        cursor = ScanCursor(config.get_cursor_path())
+        tiers = config.get_source_tiers()
+        cursor_state = cursor.load()
+        plan, next_cursor = plan_scan(tiers, config.get_tier_config(), cursor_state)
+        carryover = add_carryover(plan, tiers, cursor_state.get("carryover", []))
+        concurrency = config.get_concurrency_config()
+        if self.fixed_workers:
+            concurrency["adaptive"] = False
+
+        started = time.monotonic()
+        started_at = datetime.utcnow()
+        self.metrics.inc("jobhunt_daemon_scans_total")
+        try:
+            scanner = JobScanner(
+                sources=plan.sources,
+                filter_config=config.get_filters(),
+                state_manager=self.state,
+                sinks=self.sinks,
+                max_workers=self.workers,
+                dry_run=self.dry_run,
+                metrics=self.metrics,
+                metrics_config=config.get_metrics_config(),
+                dedup_config=config.get_dedup_config(),
+                alerts_config=config.get_alerts_config(),
+                tier_plan=plan,
+                scheduler=self.scheduler,
+                carryover=carryover,
+                job_filter=self.job_filter,
+                feeds_config=config.get_feeds_config(),
+                concurrency=concurrency,
+            )
+            stats = scanner.scan()
+            self.workers = scanner.concurrency.limit
+        except Exception as e:
+            self.metrics.inc("jobhunt_daemon_scan_failures_total")
+            self.last_error = f"scan failed: {e}"
+            traceback.print_exc()
+            return None
+
+        if not self.dry_run:
+            cursor.save({**next_cursor, "carryover": scanner.carryover})
+
+        self.scans += 1
+        self.last_error = None
+        self.last_scan = {
+            "started_at": started_at.isoformat(),
+            "duration_seconds": round(time.monotonic() - started, 3),
+            "stats": dict(stats),
+        }
+        return stats
+
+    def prune_if_due(self):
+        """Apply the retention policy once a day - freed pages are reused, so no VACUUM"""
+        if self.last_prune_at is not None and time.monotonic() - self.last_prune_at < PRUNE_INTERVAL:
+            return
+        self.last_prune_at = time.monotonic()
+        try:
+            deleted = self.state.prune(self.config.get_retention_config())
+        except sqlite3.Error as e:
+            print(f"  ⚠️  Failed to prune state: {e}")
+            return
+        if any(deleted.values()):
+            print(f"🧹 Pruned {sum(deleted.values()):,} rows past the retention policy")
+
+    def health(self) -> Dict:
+        """Status for /health - 'failing' after an error or a stalled loop"""
+        status = "starting" if self.last_scan is None else "ok"
+        error = self.last_error
+        if not error and self.next_scan_at and time.time() > self.next_scan_at + 2 * self.interval:
+            error = "scan loop stalled"
+        if error:
+            status = "failing"
+
+        return {
+            "status": status,
+            "started_at": self.started_at.isoformat(),
+            "interval_seconds": self.interval,
+            "scans": self.scans,
+            "last_scan": self.last_scan,
+            "next_scan_at": datetime.utcfromtimestamp(self.next_scan_at).isoformat() if self.next_scan_at else None,
+            "last_error": error,
+        }
+
+    def stop(self):
+        self._stop.set()
+
+    def _handle_stop(self, signum, frame):
+        print("\n🛑 Stopping after the current scan...")
+        self.stop()
+
+    def _handle_reload(self, signum, frame):
+        self._reload_requested = True
+
+    def _mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _config_changed(self) -> bool:
+        return self._mtime() != self._config_mtime
+
+    def _start_http(self):
+        daemon_config = self.config.get_daemon_config()
+        port = self.port_override if self.port_override is not None else daemon_config["port"]
+        if not port:
+            return
+
+        handler = type("Handler", (_StatusHandler,), {"daemon": self})
+        self._server = ThreadingHTTPServer((daemon_config["host"], port), handler)
+        threading.Thread(target=self._server.serve_forever, name="daemon-http", daemon=True).start()
+        host, port = self._server.server_address[:2]
+        print(f"🩺 Health on http://{host}:{port}/health, metrics on /metrics")
+
+
+class _StatusHandler(BaseHTTPRequestHandler):
+    daemon: ScanDaemon = None
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/health":
+            health = self.daemon.health()
+            code = 503 if health["status"] == "failing" else 200
+            self._reply(code, "application/json", json.dumps(health, indent=2) + "\n")
+        elif path == "/metrics":
+            self._reply(200, "text/plain; version=0.0.4", self.daemon.metrics.to_prometheus())
+        else:
+            self._reply(404, "text/plain", "not found\n")
+
+    def _reply(self, code: int, content_type: str, body: str):
+        data = body.encode()
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
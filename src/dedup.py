@@ -0,0 +1,289 @@
+"""
+Cross-source near-duplicate detection
+
+The same role is often listed on its ATS board and on several aggregated
+feeds (Remotive, RemoteOK, WWR, Adzuna) under different db_keys. Each job
+is fingerprinted from its normalized company, normalized title and
+64-bit SimHashes of its description's word bigrams (whole text and head,
+for truncated feed copies). Candidates come from an LSH index (SimHash
+split into bands, bucketed per company) persisted in the state DB, so
+postings cluster across sources and across runs.
+
+Only one canonical posting per cluster is filtered and alerted; the other
+copies are attached to it as links.
+"""
+import hashlib
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from .models import Job
+
+
+# ATS boards carry the most accurate location/description - prefer them
+SOURCE_PREFERENCE = [
+    "greenhouse", "lever", "ashby", "recruitee", "workable",
+    "remotive", "weworkremotely", "remoteok", "adzuna",
+]
+
+COMPANY_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "gmbh", "bv", "nv", "ag",
+    "sa", "sas", "plc", "corp", "corporation", "co", "company", "oy", "ab", "as",
+}
+
+SIMHASH_BITS = 64
+# Descriptions differ most in their tails (benefits, EEO boilerplate,
+# truncation) - only the head is fingerprinted, which also bounds the cost
+MAX_CHARS = 3000
+# Feeds often cut descriptions short - those copies are compared on their heads
+HEAD_WORDS = 60
+LSH_BANDS = 4
+BAND_BITS = SIMHASH_BITS // LSH_BANDS
+
+_WORD_RE = re.compile(r"\w+")
+_PAREN_RE = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_TITLE_SPLIT_RE = re.compile(r"\s+[-–|/@]\s+")
+
+
+def normalize_company(name: str) -> str:
+    """'GitLab Inc.' / 'gitlab' / 'Git-Lab' -> 'gitlab'"""
+    words = _WORD_RE.findall(name.lower().replace("_", " "))
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return "".join(words)
+
+
+def normalize_title(title: str) -> str:
+    """'Senior SRE (Remote) - EMEA' -> 'senior sre'"""
+    title = _PAREN_RE.sub(" ", title.lower())
+    title = _TITLE_SPLIT_RE.split(title)[0]
+    return " ".join(_WORD_RE.findall(title))
+
+
+# Counts for all 64 bits are packed into one big int, LANE_BITS per bit
+LANE_BITS = 20
+LANE_MASK = (1 << LANE_BITS) - 1
+_BYTE_SPREAD = [sum(((v >> i) & 1) << (i * LANE_BITS) for i in range(8)) for v in range(256)]
+
+_feature_cache: Dict[str, int] = {}
+
+
+def _spread_hash(feature: str) -> int:
+    """64-bit hash of a feature with each bit moved into its own counter lane"""
+    spread = _feature_cache.get(feature)
+    if spread is None:
+        if len(_feature_cache) > 200_000:
+            _feature_cache.clear()
+        h = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        spread = 0
+        for k in range(8):
+            spread |= _BYTE_SPREAD[(h >> (8 * k)) & 0xFF] << (8 * LANE_BITS * k)
+        _feature_cache[feature] = spread
+    return spread
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased words of the first MAX_CHARS characters"""
+    return _WORD_RE.findall(text[:MAX_CHARS].lower())
+
+
+def simhash(words: List[str]) -> int:
+    """64-bit SimHash over word bigrams, weighted by count"""
+    if len(words) < 2:
+        features = Counter(words)
+    else:
+        features = Counter(map(" ".join, zip(words, words[1:])))
+    if not features:
+        return 0
+
+    # One big-int multiply-add per distinct feature instead of 64 additions
+    counts = 0
+    for feature, weight in features.items():
+        counts += _spread_hash(feature) * weight
+
+    half = sum(features.values()) / 2
+    value = 0
+    for bit in range(SIMHASH_BITS):
+        if (counts >> (bit * LANE_BITS)) & LANE_MASK > half:
+            value |= 1 << bit
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def title_similarity(a: str, b: str) -> float:
+    """Token Jaccard similarity of normalized titles"""
+    ta, tb = set(a.split()), set(b.split())
+    if not ta or not tb:
+        return 0.0
+    return len(ta & tb) / len(ta | tb)
+
+
+@dataclass
+class Fingerprint:
+    db_key: str
+    source: str
+    url: str
+    company: str
+    title: str
+    simhash: int
+    head_simhash: int
+    words: int
+
+    @property
+    def identity(self) -> str:
+        return f"{self.company}|{self.title}"
+
+    def bands(self) -> List[str]:
+        """LSH bucket keys for the full and head hashes, bucketed per company"""
+        mask = (1 << BAND_BITS) - 1
+        return [
+            f"{self.company}:{kind}{i}:{(value >> (i * BAND_BITS)) & mask:04x}"
+            for kind, value in (("f", self.simhash), ("h", self.head_simhash))
+            for i in range(LSH_BANDS)
+        ]
+
+    @classmethod
+    def from_job(cls, job: Job) -> "Fingerprint":
+        words = tokenize(job.content_text)
+        return cls(
+            db_key=job.get_db_key(),
+            source=job.source,
+            url=job.url,
+            company=normalize_company(job.company),
+            title=normalize_title(job.title),
+            simhash=simhash(words),
+            head_simhash=simhash(words[:HEAD_WORDS]),
+            words=len(words),
+        )
+
+
+class DuplicateDetector:
+    """Cluster near-duplicate postings across sources and runs"""
+
+    def __init__(self, state_manager, config: Optional[dict] = None):
+        config = config or {}
+        self.state = state_manager
+        self.max_distance = config.get("max_distance", 10)
+        self.min_title_similarity = config.get("min_title_similarity", 0.8)
+        # Feeds like Adzuna only ship a snippet - rely on company+title there
+        self.short_description_words = config.get("short_description_words", 80)
+
+        self._seen_elsewhere: Set[str] = set()
+        self._known: Set[str] = set()
+        self._fingerprints: Dict[str, Fingerprint] = {}
+        self._lock = threading.Lock()
+
+    def prepare(self):
+        """Load already fingerprinted keys (main thread, before fetching)"""
+        self._known = self.state.get_fingerprinted_keys()
+        self._fingerprints = {}
+
+    def precompute(self, jobs: List[Job]):
+        """
+        Fingerprint new jobs from a fetch worker
+
+        Hashing is CPU work that overlaps with other workers' network waits,
+        so cluster() only has to do the index lookups.
+        """
+        computed = {}
+        for job in jobs:
+            db_key = job.get_db_key()
+            if db_key not in self._known:
+                computed[db_key] = Fingerprint.from_job(job)
+        with self._lock:
+            self._fingerprints.update(computed)
+
+    def _is_match(self, fp: Fingerprint, other: Dict) -> bool:
+        if other["source"] == fp.source:
+            # Same board listing a role twice (e.g. per city) is not a duplicate
+            return False
+        if title_similarity(fp.title, other["title_norm"]) < self.min_title_similarity:
+            return False
+        shorter, longer = sorted((fp.words, other["words"]))
+        if shorter < self.short_description_words:
+            return fp.title == other["title_norm"]
+        if shorter < longer * 0.75:
+            return hamming(fp.head_simhash, int(other["head_simhash"], 16)) <= self.max_distance
+        return hamming(fp.simhash, int(other["simhash"], 16)) <= self.max_distance
+
+    def _assign_cluster(self, fp: Fingerprint) -> str:
+        for other in self.state.find_fingerprint_candidates(fp.bands(), fp.identity):
+            if self._is_match(fp, other):
+                return other["cluster_id"]
+        return fp.db_key
+
+    @staticmethod
+    def _preference(job: Job) -> int:
+        try:
+            return SOURCE_PREFERENCE.index(job.source)
+        except ValueError:
+            return len(SOURCE_PREFERENCE)
+
+    def cluster(self, jobs: List[Job]) -> Tuple[List[Job], Dict[str, List[Dict]]]:
+        """
+        Assign every job to a cluster and pick one canonical job per cluster
+
+        Returns:
+            (canonical_jobs, copies) where copies maps a canonical db_key to
+            [{"source", "url"}] for every other known copy (this run or earlier)
+        """
+        self._seen_elsewhere = set()
+
+        keys = [job.get_db_key() for job in jobs]
+        known = self.state.get_fingerprint_clusters(keys)
+
+        # ATS postings found clusters; feed copies attach to them
+        ordered = sorted(zip(jobs, keys), key=lambda pair: self._preference(pair[0]))
+
+        clusters: Dict[str, List[Job]] = {}
+        seen: Set[str] = set()
+        for job, db_key in ordered:
+            if db_key in seen:
+                continue
+            seen.add(db_key)
+
+            cluster_id = known.get(db_key)
+            if cluster_id is None:
+                fp = self._fingerprints.get(db_key) or Fingerprint.from_job(job)
+                cluster_id = self._assign_cluster(fp)
+                known[db_key] = cluster_id
+                # Uncommitted rows are already visible to later jobs of this run
+                self.state.save_fingerprint(fp, cluster_id, commit=False)
+            clusters.setdefault(cluster_id, []).append(job)
+
+        self.state.commit()
+        self._fingerprints = {}
+
+        members_by_cluster = self.state.get_cluster_members(list(clusters))
+
+        canonical_jobs = []
+        copies: Dict[str, List[Dict]] = {}
+        for cluster_id, members in clusters.items():
+            # Stable choice: the job that founded the cluster, else best source
+            members.sort(key=lambda j: (j.get_db_key() != cluster_id, self._preference(j)))
+            canonical = members[0]
+            canonical_key = canonical.get_db_key()
+            canonical_jobs.append(canonical)
+
+            in_run = {j.get_db_key() for j in members}
+            links = [{"source": j.source, "url": j.url} for j in members[1:]]
+
+            prior = [m for m in members_by_cluster.get(cluster_id, []) if m["db_key"] not in in_run]
+            links.extend({"source": m["source"], "url": m["url"]} for m in prior)
+            if links:
+                copies[canonical_key] = links
+
+            # A copy from another source was already stored (and alerted)
+            if any(m["stored"] for m in prior):
+                self._seen_elsewhere.add(canonical_key)
+
+        return canonical_jobs, copies
+
+    def seen_elsewhere(self, db_key: str) -> bool:
+        """Whether another copy of this job was already handled in an earlier run"""
+        return db_key in self._seen_elsewhere
@@ -3,6 +3,7 @@ Multi-stage filtering with explainability
 """
 from typing import Dict, List, Tuple, Optional, Set
 import re
+import time
 from dataclasses import dataclass, field
 from .location_parser import GeoFilter, LocationInfo
 
@@ -19,11 +20,56 @@ class FilterResult:
     location_info: Optional[LocationInfo] = None
 
 
+class PreFilter:
+    """
+    Gates cheap enough to run on raw payload fields
+
+    Source plugins apply it before normalizing a posting (HTML-to-text of
+    the description), so postings JobFilter would drop by title or blocked
+    location never get built. It only rejects what JobFilter rejects too.
+    """
+
+    def __init__(self, title_allow: List, title_block: List, blocked_locations: List[str]):
+        self.title_allow_patterns = title_allow
+        self.title_block_patterns = title_block
+        self.blocked_locations = blocked_locations
+
+    def check(self, title: str, location: str) -> Optional[str]:
+        """Drop reason (as JobFilter reports it), or None if the posting may pass"""
+        location_passed, location_reason = self.check_location(location.lower())
+        if not location_passed:
+            return f"Location: {location_reason}"
+        title_passed, title_reason = self.check_title(title.lower())
+        if not title_passed:
+            return f"Title: {title_reason}"
+        return None
+
+    def check_location(self, location: str) -> Tuple[bool, str]:
+        for blocked in self.blocked_locations:
+            if blocked in location:
+                return False, f"blocked location: '{blocked}'"
+        return True, "no blocked location"
+
+    def check_title(self, title: str) -> Tuple[bool, str]:
+        # Check blocks
+        for pattern in self.title_block_patterns:
+            if pattern.search(title):
+                return False, f"blocked: '{pattern.pattern}'"
+
+        # Check allows
+        for pattern in self.title_allow_patterns:
+            if pattern.search(title):
+                return True, f"allowed: '{pattern.pattern}'"
+
+        return False, "no allowed title pattern"
+
+
 class JobFilter:
     """Multi-stage job filtering with explainability"""
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, metrics=None):
         self.config = config
+        self.metrics = metrics
 
         # Geo filter (NEW - first gate!)
         geo_config = config.get("geo", {})
@@ -42,6 +88,10 @@ class JobFilter:
         self.title_allow_patterns = [re.compile(p, re.IGNORECASE) for p in config.get("title_allow_regex_any", [])]
         self.title_block_patterns = [re.compile(p, re.IGNORECASE) for p in config.get("title_block_regex_any", [])]
 
+        # Location strings that are never acceptable (e.g. "onsite")
+        self.blocked_locations = [l.lower() for l in config.get("blocked_locations", [])]
+        self.prefilter = PreFilter(self.title_allow_patterns, self.title_block_patterns, self.blocked_locations)
+
         # Stack groups
         self.stack_groups = config.get("stack_groups", {})
         self.min_groups_matched = config.get("min_stack_groups", 2)
@@ -60,14 +110,26 @@ class JobFilter:
         content_lower = job.content_text.lower()
         full_text = f"{title_lower} {location_lower} {content_lower}"
 
+        # GATE 0: Blocked location strings
+        if self.blocked_locations:
+            started = time.perf_counter()
+            location_passed, location_reason = self.prefilter.check_location(location_lower)
+            result.gate_results["location"] = location_passed
+            self._observe_gate("location", started)
+            if not location_passed:
+                result.drop_reason = f"Location: {location_reason}"
+                return result
+
         # GATE 0: Geo-filtering (NEW - FIRST!)
         if self.geo_filter:
+            started = time.perf_counter()
             geo_passed, geo_reason, loc_info = self.geo_filter.check_location(
                 job.location,
                 job.content_text
             )
             result.gate_results["geo"] = geo_passed
             result.location_info = loc_info
+            self._observe_gate("geo", started)
 
             if not geo_passed:
                 result.drop_reason = f"Geo: {geo_reason}"
@@ -75,30 +137,38 @@ class JobFilter:
 
         # GATE 1: Remote (LEGACY - kept for backwards compat if no geo config)
         if not self.geo_filter:
+            started = time.perf_counter()
             remote_passed, remote_reason = self._check_remote_gate(location_lower, content_lower)
             result.gate_results["remote"] = remote_passed
+            self._observe_gate("remote", started)
             if not remote_passed:
                 result.drop_reason = f"Remote: {remote_reason}"
                 return result
 
         # GATE 2: Region (LEGACY - skip if geo filter used)
         if not self.geo_filter:
+            started = time.perf_counter()
             region_passed, region_reason = self._check_region_gate(location_lower, content_lower)
             result.gate_results["region"] = region_passed
+            self._observe_gate("region", started)
             if not region_passed:
                 result.drop_reason = f"Region: {region_reason}"
                 return result
 
         # GATE 3: Title
+        started = time.perf_counter()
         title_passed, title_reason = self._check_title_gate(title_lower)
         result.gate_results["title"] = title_passed
+        self._observe_gate("title", started)
         if not title_passed:
             result.drop_reason = f"Title: {title_reason}"
             return result
 
         # GATE 4: Stack
+        started = time.perf_counter()
         stack_passed, stack_reason, matched_groups = self._check_stack_gate(full_text)
         result.gate_results["stack"] = stack_passed
+        self._observe_gate("stack", started)
         if explain:
             result.keyword_matches["stack_groups"] = matched_groups
         if not stack_passed:
@@ -106,7 +176,9 @@ class JobFilter:
             return result
 
         # Compute score
+        started = time.perf_counter()
         score, breakdown, matches = self._compute_score(title_lower, content_lower)
+        self._observe_gate("score", started)
         result.score = score
         result.scoring_breakdown = breakdown
         if explain:
@@ -120,6 +192,10 @@ class JobFilter:
         result.passed = True
         return result
 
+    def _observe_gate(self, gate: str, started: float):
+        if self.metrics:
+            self.metrics.observe("jobhunt_filter_gate_seconds", time.perf_counter() - started, gate=gate)
+
     def _check_remote_gate(self, location: str, content: str) -> Tuple[bool, str]:
         text = f"{location} {content}"
 
@@ -172,17 +248,7 @@ class JobFilter:
         return True, "no region restriction"
 
     def _check_title_gate(self, title: str) -> Tuple[bool, str]:
-        # Check blocks
-        for pattern in self.title_block_patterns:
-            if pattern.search(title):
-                return False, f"blocked: '{pattern.pattern}'"
-
-        # Check allows
-        for pattern in self.title_allow_patterns:
-            if pattern.search(title):
-                return True, f"allowed: '{pattern.pattern}'"
-
-        return False, "no allowed title pattern"
+        return self.prefilter.check_title(title)
 
     def _check_stack_gate(self, text: str) -> Tuple[bool, str, List[str]]:
         tokens = self._tokenize(text)
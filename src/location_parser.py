@@ -7,7 +7,9 @@ Parses job location strings and determines:
 - Which countries/regions?
 - Should it be allowed based on geo policy?
 """
+import hashlib
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Set, Optional, Tuple
 from enum import Enum
@@ -273,6 +275,10 @@ class GeoFilter:
         self.config = config
         self.parser = LocationParser()
 
+        # LRU of recent verdicts - unchanged postings are re-checked every scan
+        self.cache_size = config.get('cache_size', 4096)
+        self._cache: "OrderedDict[tuple, Tuple[bool, str, LocationInfo]]" = OrderedDict()
+
         # Policy
         self.allowed_regions = set(r.lower() for r in config.get('allowed_regions', []))
         self.blocked_countries = set(c.lower() for c in config.get('blocked_countries', []))
@@ -293,6 +299,23 @@ class GeoFilter:
         Returns:
             (passes, reason, location_info)
         """
+        if not self.cache_size:
+            return self._check_location(raw_location, content)
+
+        # A digest keeps the key small without pinning the description in memory
+        key = (raw_location, hashlib.blake2b(content.encode(), digest_size=16).digest())
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        verdict = self._check_location(raw_location, content)
+        self._cache[key] = verdict
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return verdict
+
+    def _check_location(self, raw_location: str, content: str) -> Tuple[bool, str, LocationInfo]:
         loc = self.parser.parse_location(raw_location, content)
 
         # Not remote? Block if require_remote
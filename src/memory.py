@@ -0,0 +1,142 @@
+"""
+Memory-bounded scans
+
+`scan --max-memory 512M` keeps a scan under a memory ceiling. Fetched
+jobs normally hold their full description until they are filtered. Once
+the process RSS gets close to the ceiling, the descriptions of fetched
+jobs (and of every board fetched after that) are moved to a temporary
+SQLite file. In memory each job keeps only what dedup, state and alerts
+need. The filter reads a description back one job at a time.
+
+Fetches are admitted against the same ceiling: each one reserves a
+multiple of the board's usual response size (board_stats), and a new
+fetch only starts while RSS plus the reservations of those in flight
+stays below it - large feeds are not parsed side by side. A board whose
+response alone does not fit still runs once nothing else is in flight.
+"""
+import dataclasses
+import os
+import re
+import resource
+import sqlite3
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+from .models import Job
+
+
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([KMG]?)B?", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_size(text: str) -> int:
+    """'512M' / '2G' / '1.5g' / '300000000' -> bytes"""
+    match = _SIZE_RE.fullmatch(text.strip())
+    if not match or float(match.group(1)) <= 0:
+        raise ValueError(f"Invalid size: {text!r} (use e.g. 512M, 2G)")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def format_size(size: float) -> str:
+    return f"{size / 1024 ** 2:.0f} MB"
+
+
+def peak_rss() -> int:
+    """Highest resident set size of this process so far, in bytes"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def current_rss() -> int:
+    """Resident set size now (falls back to the peak where /proc is missing)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return peak_rss()
+
+
+class MemoryLimit:
+    """RSS ceiling of one scan, with room reserved for fetches in flight"""
+
+    # Raw body, decoded text, parsed JSON and normalized jobs coexist while parsing
+    PARSE_FACTOR = 4
+
+    def __init__(self, limit: int, headroom: float = 0.8):
+        self.limit = limit
+        # Act before the ceiling; filtering and alerting still need some room
+        self.threshold = int(limit * headroom)
+        self.reserved = 0
+
+    def under_pressure(self) -> bool:
+        return current_rss() >= self.threshold
+
+    def cost(self, response_bytes: float) -> int:
+        return int(response_bytes * self.PARSE_FACTOR)
+
+    def has_room(self, cost: int) -> bool:
+        return current_rss() + self.reserved + cost <= self.threshold
+
+
+class SpillStore:
+    """Job descriptions moved out of memory for the rest of a scan"""
+
+    def __init__(self):
+        # Once on, every later board is spilled too
+        self.active = False
+        self.spilled = 0
+        self.bytes = 0
+        self._rows: Dict[int, int] = {}
+        self._path: Optional[str] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def spill(self, jobs: List[Job]) -> List[Job]:
+        """
+        Store the descriptions and return copies without them
+
+        Keyed by the copy's id(), so the copies must stay referenced
+        (in the scan's job list) until they are restored.
+        """
+        if self._conn is None:
+            fd, self._path = tempfile.mkstemp(prefix="jobhunt-spill-", suffix=".sqlite")
+            os.close(fd)
+            self._conn = sqlite3.connect(self._path)
+            self._conn.execute("PRAGMA journal_mode = OFF")
+            self._conn.execute("PRAGMA synchronous = OFF")
+            self._conn.execute("CREATE TABLE spill (id INTEGER PRIMARY KEY, content_text TEXT NOT NULL)")
+
+        copies = []
+        for job in jobs:
+            if not job.content_text:
+                copies.append(job)
+                continue
+            row_id = self._conn.execute("INSERT INTO spill (content_text) VALUES (?)", (job.content_text,)).lastrowid
+            copy = job.without_content()
+            self._rows[id(copy)] = row_id
+            self.spilled += 1
+            self.bytes += len(job.content_text)
+            copies.append(copy)
+        return copies
+
+    def restore(self, job: Job) -> Job:
+        """The job with its description back (jobs that were not spilled as they are)"""
+        row_id = self._rows.pop(id(job), None)
+        if row_id is None:
+            return job
+        content_text = self._conn.execute("SELECT content_text FROM spill WHERE id = ?", (row_id,)).fetchone()[0]
+        return dataclasses.replace(job, content_text=content_text)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._path:
+            for suffix in ("", "-journal"):
+                try:
+                    os.remove(self._path + suffix)
+                except OSError:
+                    pass
+            self._path = None
+        self._rows = {}
@@ -0,0 +1,216 @@
+"""
+Scan metrics
+
+Thread-safe counters, gauges and histograms for the scan pipeline.
+Exported after every scan as a Prometheus textfile (for node_exporter's
+textfile collector) and as a JSON run record.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+# Seconds - covers fast filter gates up to slow board fetches
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Known metrics: name -> (type, help)
+METRICS = {
+    "jobhunt_source_fetch_seconds": (HISTOGRAM, "Time to fetch and normalize one source"),
+    "jobhunt_source_bytes_total": (COUNTER, "Response bytes downloaded per source type"),
+    "jobhunt_source_jobs_total": (COUNTER, "Jobs returned per source type"),
+    "jobhunt_source_jobs_rejected_total": (COUNTER, "Jobs dropped by the pre-filter inside the source plugin"),
+    "jobhunt_source_errors_total": (COUNTER, "Failed fetches per source type"),
+    "jobhunt_board_fetch_seconds": (GAUGE, "Last fetch latency per board"),
+    "jobhunt_board_jobs": (GAUGE, "Jobs returned by the last fetch per board"),
+    "jobhunt_filter_gate_seconds": (HISTOGRAM, "Time spent in each filter gate"),
+    "jobhunt_state_seconds": (HISTOGRAM, "Time spent in state DB operations"),
+    "jobhunt_alert_seconds": (HISTOGRAM, "Alert delivery latency"),
+    "jobhunt_scan_duration_seconds": (GAUGE, "Wall time of the last scan"),
+    "jobhunt_scan_last_run_timestamp": (GAUGE, "Unix time the last scan finished"),
+    "jobhunt_scan_stat": (GAUGE, "Scan summary counters of the last run"),
+    "jobhunt_daemon_scans_total": (COUNTER, "Scans run by `jobhunt.py serve`"),
+    "jobhunt_daemon_scan_failures_total": (COUNTER, "Scans that raised in `jobhunt.py serve`"),
+    "jobhunt_daemon_config_reloads_total": (COUNTER, "Config reloads in `jobhunt.py serve`"),
+}
+
+
+def _label_key(labels: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: Tuple[Tuple[str, str], ...], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key)
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = []
+    for k, v in pairs:
+        v = v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        escaped.append(f'{k}="{v}"')
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Histogram:
+    """Cumulative bucket counts plus sum/count"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "buckets": {_format_value(b): c for b, c in zip(self.buckets, self.counts)},
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe metric store shared by the scanner and its workers"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._values: Dict[str, Dict[Tuple, object]] = {}
+        self._types: Dict[str, str] = {}
+
+    def _series(self, name: str, kind: str) -> Dict[Tuple, object]:
+        # Caller holds the lock
+        series = self._values.get(name)
+        if series is None:
+            series = self._values[name] = {}
+            self._types[name] = METRICS.get(name, (kind, ""))[0]
+        return series
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Increment a counter"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series(name, COUNTER)
+            series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        """Set a gauge"""
+        key = _label_key(labels)
+        with self._lock:
+            self._series(name, GAUGE)[key] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """Record a histogram observation"""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series(name, HISTOGRAM)
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = _Histogram(self.buckets)
+            hist.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Observe the duration of a block in seconds"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def get(self, name: str, **labels):
+        """Current value of a counter/gauge (histograms return their count)"""
+        key = _label_key(labels)
+        with self._lock:
+            value = self._values.get(name, {}).get(key, 0)
+        if isinstance(value, _Histogram):
+            return value.count
+        return value
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+            self._types.clear()
+
+    def to_prometheus(self) -> str:
+        """Render in Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for name in sorted(self._values):
+                kind = self._types[name]
+                help_text = METRICS.get(name, (kind, ""))[1]
+                if help_text:
+                    lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+
+                for key, value in sorted(self._values[name].items()):
+                    if isinstance(value, _Histogram):
+                        for bound, count in zip(value.buckets, value.counts):
+                            labels = _format_labels(key, ("le", _format_value(bound)))
+                            lines.append(f"{name}_bucket{labels} {count}")
+                        labels = _format_labels(key, ("le", "+Inf"))
+                        lines.append(f"{name}_bucket{labels} {value.count}")
+                        lines.append(f"{name}_sum{_format_labels(key)} {_format_value(value.sum)}")
+                        lines.append(f"{name}_count{_format_labels(key)} {value.count}")
+                    else:
+                        lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict:
+        """JSON-serializable view of all metrics"""
+        result = {}
+        with self._lock:
+            for name in sorted(self._values):
+                entries = []
+                for key, value in sorted(self._values[name].items()):
+                    entry = {"labels": dict(key)}
+                    if isinstance(value, _Histogram):
+                        entry.update(value.to_dict())
+                    else:
+                        entry["value"] = value
+                    entries.append(entry)
+                result[name] = {"type": self._types[name], "series": entries}
+        return result
+
+    def write_prometheus(self, path: str):
+        """Write textfile atomically so the collector never reads a partial file"""
+        _atomic_write(Path(path), self.to_prometheus())
+
+    def write_run_record(self, path: str, record: Dict):
+        """Write JSON run record (record + metrics snapshot)"""
+        payload = dict(record)
+        payload["metrics"] = self.snapshot()
+        _atomic_write(Path(path), json.dumps(payload, indent=2, sort_keys=True, default=str))
+
+
+def _atomic_write(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
@@ -1,10 +1,11 @@
 """
 Core data models
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
 import hashlib
+import sys
 
 
 class SourceHealth(Enum):
@@ -13,8 +14,13 @@ class SourceHealth(Enum):
     PERM_FAIL = "perm_fail"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Job:
+    """
+    One normalized posting - immutable, so the db key and content hash
+    are computed at most once. Repeated strings (source, company, common
+    locations) are interned to share one copy across a scan.
+    """
     source: str
     company: str
     job_id: str
@@ -23,15 +29,27 @@ class Job:
     url: str
     updated_at: Optional[str]
     content_text: str
+    _db_key: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _content_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        for name in ("source", "company", "location"):
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
 
     def get_db_key(self) -> str:
         """Unique key for deduplication"""
-        return f"{self.source}:{self.company}:{self.job_id}"
+        if self._db_key is None:
+            object.__setattr__(self, "_db_key", f"{self.source}:{self.company}:{self.job_id}")
+        return self._db_key
 
     def get_content_hash(self) -> str:
         """Hash of content for change detection"""
-        content = f"{self.title}|{self.location}|{self.content_text}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        if self._content_hash is None:
+            content = f"{self.title}|{self.location}|{self.content_text}"
+            object.__setattr__(self, "_content_hash", hashlib.sha256(content.encode()).hexdigest()[:16])
+        return self._content_hash
 
     def is_updated(self, old_updated_at: Optional[str], old_hash: str) -> bool:
         """Check if job has been updated"""
@@ -41,6 +59,20 @@ class Job:
             return True
         return False
 
+    def without_content(self) -> "Job":
+        """
+        Copy without the description, for jobs kept after filtering
+
+        The copy keeps the original content hash and db key.
+        """
+        self.get_db_key()
+        self.get_content_hash()
+        job = object.__new__(Job)
+        for name in self.__slots__:
+            object.__setattr__(job, name, getattr(self, name))
+        object.__setattr__(job, "content_text", "")
+        return job
+
 
 @dataclass
 class SourceHealthRecord:
@@ -0,0 +1,371 @@
+"""
+Durable alert outbox
+
+Alerts are written to the `alert_outbox` table (one row per sink) in the
+same transaction as the job upsert, so a job is never marked as seen
+without its alerts being recorded. Each sink gets an OutboxWorker that
+drains its rows from a background thread (with its own SQLite
+connection) while the scan is still filtering, delivering in batches with
+bounded concurrency and exponential backoff. Whatever is left - sink
+down, no webhook configured - stays pending for the next scan or
+`flush-alerts`.
+"""
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from .filtering import FilterResult
+from .metrics import MetricsRegistry
+from .models import Job
+from .sinks import AlertSink, PartialDelivery
+
+
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+
+def alert_payload(job: Job, result, duplicates: Optional[List[Dict]] = None) -> Dict:
+    """Everything needed to deliver the alert later, as JSON-able dict"""
+    return {
+        "job": {
+            "source": job.source,
+            "company": job.company,
+            "job_id": job.job_id,
+            "title": job.title,
+            "location": job.location,
+            "url": job.url,
+            "updated_at": job.updated_at,
+        },
+        "score": result.score,
+        "keyword_matches": result.keyword_matches,
+        "duplicates": duplicates or [],
+    }
+
+
+def alert_from_payload(payload: Dict) -> Tuple[Job, FilterResult, List[Dict]]:
+    job = Job(content_text="", **payload["job"])
+    result = FilterResult(
+        passed=True,
+        score=payload["score"],
+        keyword_matches=payload.get("keyword_matches", {}),
+    )
+    return job, result, payload.get("duplicates", [])
+
+
+class OutboxWorker:
+    """Deliver one sink's pending outbox rows in the background"""
+
+    def __init__(
+        self,
+        db_path: str,
+        sink: AlertSink,
+        max_attempts: int = 5,
+        backoff: float = 2.0,
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        self.db_path = str(db_path)
+        self.sink = sink
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.metrics = metrics or MetricsRegistry()
+
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.errors: List[str] = []
+        self.latencies: List[float] = []
+
+        self._wakeup = threading.Event()
+        self._draining = threading.Event()
+        self._deadline = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name=f"outbox-{self.sink.name}", daemon=True)
+        self._thread.start()
+
+    def notify(self):
+        """New rows were committed"""
+        self._wakeup.set()
+
+    def stop_at(self, deadline: float):
+        """Finish what is due before `deadline` (unix time), then exit"""
+        self._deadline = deadline
+        self._draining.set()
+        self._wakeup.set()
+
+    def join(self):
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        self._conn = _connect(self.db_path)
+        try:
+            # Claims left behind by a crashed run
+            self._conn.execute(
+                "UPDATE alert_outbox SET status = ? WHERE status = ? AND sink = ?",
+                (PENDING, SENDING, self.sink.name)
+            )
+            self._conn.commit()
+
+            if self.sink.at_drain:
+                self._run_at_drain()
+            else:
+                self._run_batches()
+        finally:
+            self._conn.close()
+            self._conn = None
+
+    def _run_batches(self):
+        in_flight = {}
+        executor = ThreadPoolExecutor(max_workers=self.sink.concurrency, thread_name_prefix=f"sink-{self.sink.name}")
+        try:
+            while True:
+                overdue = self._draining.is_set() and time.time() > self._deadline
+                while not overdue and len(in_flight) < self.sink.concurrency:
+                    rows = self._claim(self.sink.batch_size)
+                    if not rows:
+                        break
+                    in_flight[executor.submit(self._deliver, rows)] = rows
+
+                if in_flight:
+                    if overdue:
+                        self._settle(in_flight)
+                        return
+                    done, _ = wait(list(in_flight), timeout=0.5, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._record_batch(in_flight.pop(future), future.exception())
+                    continue
+
+                if overdue or (self._draining.is_set() and not self._has_pending(self._deadline)):
+                    return
+
+                self._wakeup.wait(timeout=0.5)
+                self._wakeup.clear()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _settle(self, in_flight: Dict):
+        """
+        Past the deadline: unclaim batches not started yet and record the
+        ones being sent (bounded by the sink's timeout) - a batch that got
+        through must not be sent again by the next run
+        """
+        unstarted = [row for future, rows in in_flight.items() if future.cancel() for row in rows]
+        if unstarted:
+            self._conn.executemany(
+                "UPDATE alert_outbox SET status = ? WHERE id = ?", [(PENDING, row["id"]) for row in unstarted]
+            )
+            self._conn.commit()
+        for future, rows in in_flight.items():
+            if not future.cancelled():
+                self._record_batch(rows, future.exception())
+
+    def _run_at_drain(self):
+        # Batch everything at the end so one digest covers the whole run
+        self._draining.wait()
+        while time.time() <= self._deadline:
+            rows = self._claim(limit=None)
+            if rows:
+                error = None
+                try:
+                    self._deliver(rows)
+                except Exception as e:
+                    error = e
+                self._record_batch(rows, error)
+            if not self._has_pending(self._deadline):
+                return
+            time.sleep(0.5)
+
+    def _deliver(self, rows: List[sqlite3.Row]):
+        alerts = [alert_from_payload(json.loads(row["payload"])) for row in rows]
+        started = time.perf_counter()
+        try:
+            self.sink.send(alerts)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.latencies.append(elapsed)
+            self.metrics.observe("jobhunt_alert_seconds", elapsed, sink=self.sink.name)
+
+    def _claim(self, limit: Optional[int]) -> List[sqlite3.Row]:
+        """Mark due rows as sending and return them"""
+        query = "SELECT * FROM alert_outbox WHERE status = ? AND sink = ? AND next_attempt_at <= ? ORDER BY id"
+        params = [PENDING, self.sink.name, _now()]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self._conn.execute(query, params).fetchall()
+        if rows:
+            self._conn.executemany(
+                "UPDATE alert_outbox SET status = ? WHERE id = ?", [(SENDING, row["id"]) for row in rows]
+            )
+            self._conn.commit()
+        return rows
+
+    def _has_pending(self, before: float) -> bool:
+        """Pending rows that become due before `before` (unix time)"""
+        due = datetime.utcfromtimestamp(before).isoformat()
+        row = self._conn.execute(
+            "SELECT 1 FROM alert_outbox WHERE status = ? AND sink = ? AND next_attempt_at <= ? LIMIT 1",
+            (PENDING, self.sink.name, due)
+        ).fetchone()
+        return row is not None
+
+    def _record_batch(self, rows: List[sqlite3.Row], error: Optional[BaseException]):
+        failed = set(range(len(rows)))
+        if error is None:
+            failed = set()
+        elif isinstance(error, PartialDelivery):
+            failed = error.failed
+
+        for index, row in enumerate(rows):
+            self._record(row, error if index in failed else None)
+        self._conn.commit()
+
+    def _record(self, row: sqlite3.Row, error: Optional[BaseException]):
+        if error is None:
+            self._conn.execute(
+                "UPDATE alert_outbox SET status = ?, attempts = attempts + 1, sent_at = ?, last_error = NULL WHERE id = ?",
+                (SENT, _now(), row["id"])
+            )
+            self.sent += 1
+            return
+
+        attempts = row["attempts"] + 1
+        self.errors.append(str(error))
+        if attempts >= self.max_attempts:
+            status, next_attempt = FAILED, _now()
+            self.failed += 1
+        else:
+            status = PENDING
+            next_attempt = (datetime.utcnow() + timedelta(seconds=self.backoff * 2 ** (attempts - 1))).isoformat()
+            self.retried += 1
+
+        self._conn.execute(
+            "UPDATE alert_outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+            (status, attempts, next_attempt, str(error)[:500], row["id"])
+        )
+
+
+class DeliveryPool:
+    """One OutboxWorker per sink"""
+
+    def __init__(
+        self,
+        db_path: str,
+        sinks: List[AlertSink],
+        max_attempts: int = 5,
+        backoff: float = 2.0,
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        self.db_path = str(db_path)
+        self.workers = {
+            sink.name: OutboxWorker(db_path, sink, max_attempts=max_attempts, backoff=backoff, metrics=metrics)
+            for sink in sinks
+        }
+
+    @property
+    def sink_names(self) -> List[str]:
+        return list(self.workers)
+
+    @property
+    def errors(self) -> List[str]:
+        return [error for worker in self.workers.values() for error in worker.errors]
+
+    def start(self):
+        for worker in self.workers.values():
+            worker.start()
+
+    def notify(self):
+        for worker in self.workers.values():
+            worker.notify()
+
+    def drain(self, timeout: float = 30.0) -> Dict[str, Dict]:
+        """
+        Deliver everything due, waiting up to `timeout` seconds for retries
+
+        Rows whose backoff ends after the deadline stay pending; batches
+        still being sent at the deadline are waited for.
+        """
+        deadline = time.time() + timeout
+        for worker in self.workers.values():
+            worker.stop_at(deadline)
+        for worker in self.workers.values():
+            worker.join()
+        return self.counts()
+
+    def stop(self):
+        """Stop delivering (a scan that failed) - what is not sent stays pending"""
+        self.drain(timeout=0)
+
+    def flush(self, include_failed: bool = True, timeout: float = 30.0) -> Dict[str, Dict]:
+        """Retry all leftovers of the configured sinks now (jobhunt.py flush-alerts)"""
+        conn = _connect(self.db_path)
+        statuses = (PENDING, FAILED) if include_failed else (PENDING,)
+        names = self.sink_names
+        conn.execute(f"""
+            UPDATE alert_outbox SET status = ?, next_attempt_at = ?, attempts = 0
+            WHERE status IN ({",".join("?" * len(statuses))})
+              AND sink IN ({",".join("?" * len(names))})
+        """, (PENDING, _now(), *statuses, *names))
+        conn.commit()
+        conn.close()
+
+        self.start()
+        return self.drain(timeout=timeout)
+
+    def counts(self) -> Dict[str, Dict]:
+        """Per sink: this run's delivery counters, latency and outbox rows by status"""
+        conn = _connect(self.db_path)
+        rows = conn.execute("SELECT sink, status, COUNT(*) AS n FROM alert_outbox GROUP BY sink, status").fetchall()
+        conn.close()
+        by_sink: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            by_sink.setdefault(row["sink"], {})[row["status"]] = row["n"]
+
+        counts = {}
+        for name, worker in self.workers.items():
+            statuses = by_sink.get(name, {})
+            latencies = worker.latencies
+            counts[name] = {
+                "sent": worker.sent,
+                "retried": worker.retried,
+                "failed": worker.failed,
+                "pending": statuses.get(PENDING, 0) + statuses.get(SENDING, 0),
+                "failed_total": statuses.get(FAILED, 0),
+                "batches": len(latencies),
+                "latency_avg": sum(latencies) / len(latencies) if latencies else 0.0,
+                "latency_max": max(latencies) if latencies else 0.0,
+            }
+        return counts
+
+    def pending_jobs(self, limit: int = 10) -> List[Job]:
+        """Most recent undelivered alerts (any sink)"""
+        conn = _connect(self.db_path)
+        rows = conn.execute("""
+            SELECT payload FROM alert_outbox
+            WHERE id IN (
+                SELECT MAX(id) FROM alert_outbox WHERE status IN (?, ?) GROUP BY db_key
+            )
+            ORDER BY id DESC LIMIT ?
+        """, (PENDING, FAILED, limit)).fetchall()
+        conn.close()
+        return [alert_from_payload(json.loads(row["payload"]))[0] for row in rows]
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
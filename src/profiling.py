@@ -0,0 +1,232 @@
+"""
+Per-stage profiling
+
+Records timing spans for the scan stages (fetch, normalize, filter, state,
+alert), optionally with cProfile and tracemalloc data per stage, and
+renders a breakdown table plus a Chrome trace / Perfetto JSON file with
+one lane per worker thread.
+
+Spans nest per thread: a stage's "self" time excludes time spent in
+stages nested inside it (e.g. normalize excludes its network fetch).
+"""
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+STAGES = ["fetch", "normalize", "dedup", "filter", "state", "alert"]
+
+
+class _Frame:
+    """Open span on a thread's stack"""
+
+    __slots__ = ("stage", "started", "children", "profile", "mem_before")
+
+    def __init__(self, stage: str, started: float):
+        self.stage = stage
+        self.started = started
+        self.children = 0.0
+        self.profile = None
+        self.mem_before = None
+
+
+class Profiler:
+    """Collect stage spans from the main thread and fetch workers"""
+
+    def __init__(self, enabled: bool = False, use_cprofile: bool = False, use_tracemalloc: bool = False):
+        self.enabled = enabled or use_cprofile or use_tracemalloc
+        self.use_cprofile = use_cprofile
+        self.use_tracemalloc = use_tracemalloc
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+        self._events: List[tuple] = []
+        self._lanes: Dict[int, tuple] = {}
+        self._totals: Dict[str, Dict] = {}
+        self._profiles: Dict[str, object] = {}
+        self._started_tracemalloc = False
+
+    def start(self):
+        """Reset clocks (and start tracemalloc if requested)"""
+        self._origin = time.perf_counter()
+        if self.use_tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self):
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def span(self, stage: str, **args):
+        """Time a block as part of `stage`"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        frame = _Frame(stage, time.perf_counter())
+
+        # cProfile can only run once per thread - the outermost span owns it
+        if self.use_cprofile and not stack:
+            import cProfile
+            frame.profile = cProfile.Profile()
+            frame.profile.enable()
+
+        if self.use_tracemalloc and tracemalloc.is_tracing():
+            frame.mem_before = tracemalloc.get_traced_memory()[0]
+
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            ended = time.perf_counter()
+
+            if frame.profile is not None:
+                frame.profile.disable()
+
+            duration = ended - frame.started
+            if stack:
+                stack[-1].children += duration
+
+            mem_delta = None
+            mem_peak = None
+            if frame.mem_before is not None:
+                current, mem_peak = tracemalloc.get_traced_memory()
+                mem_delta = current - frame.mem_before
+
+            self._record(frame, ended, duration, mem_delta, mem_peak, args)
+
+    def _record(self, frame: _Frame, ended: float, duration: float, mem_delta, mem_peak, args: Dict):
+        thread = threading.current_thread()
+        with self._lock:
+            totals = self._totals.get(frame.stage)
+            if totals is None:
+                totals = self._totals[frame.stage] = {
+                    "calls": 0, "total": 0.0, "self": 0.0, "mem_delta": 0, "mem_peak": 0,
+                }
+            totals["calls"] += 1
+            totals["total"] += duration
+            totals["self"] += duration - frame.children
+            if mem_delta is not None:
+                totals["mem_delta"] += mem_delta
+                totals["mem_peak"] = max(totals["mem_peak"], mem_peak)
+
+            if frame.profile is not None:
+                self._merge_profile(frame.stage, frame.profile)
+
+            if self.enabled:
+                if thread.ident not in self._lanes:
+                    self._lanes[thread.ident] = (len(self._lanes) + 1, thread.name)
+                self._events.append((
+                    frame.stage, thread.ident, frame.started - self._origin, duration, args,
+                ))
+
+    def _merge_profile(self, stage: str, profile):
+        # Caller holds the lock
+        import pstats
+        existing = self._profiles.get(stage)
+        if existing is None:
+            self._profiles[stage] = pstats.Stats(profile)
+        else:
+            existing.add(profile)
+
+    def stage_totals(self) -> Dict[str, Dict]:
+        """Per-stage calls/total/self seconds"""
+        with self._lock:
+            return {
+                stage: {
+                    "calls": t["calls"],
+                    "total": round(t["total"], 4),
+                    "self": round(t["self"], 4),
+                }
+                for stage, t in self._totals.items()
+            }
+
+    def print_table(self, wall_time: float, gate_times: Optional[Dict[str, float]] = None):
+        """Print per-stage breakdown"""
+        with self._lock:
+            totals = dict(self._totals)
+
+        busy = sum(t["self"] for t in totals.values()) or 1.0
+        ordered = [s for s in STAGES if s in totals] + sorted(s for s in totals if s not in STAGES)
+
+        print(f"{'='*60}")
+        print("⏱️  STAGE BREAKDOWN")
+        print(f"{'='*60}")
+        header = f"  {'Stage':<12}{'Calls':>7}{'Total s':>10}{'Self s':>10}{'Share':>8}"
+        if self.use_tracemalloc:
+            header += f"{'Alloc KB':>11}{'Peak KB':>10}"
+        print(header)
+
+        for stage in ordered:
+            t = totals[stage]
+            line = (
+                f"  {stage:<12}{t['calls']:>7}{t['total']:>10.3f}{t['self']:>10.3f}"
+                f"{t['self'] / busy:>8.1%}"
+            )
+            if self.use_tracemalloc:
+                line += f"{t['mem_delta'] / 1024:>11.0f}{t['mem_peak'] / 1024:>10.0f}"
+            print(line)
+
+        if gate_times:
+            print("\n  Filter gates:")
+            for gate, seconds in sorted(gate_times.items(), key=lambda x: x[1], reverse=True):
+                print(f"    {gate:<10}{seconds:>10.3f}s")
+
+        print(f"\n  Wall time:  {wall_time:.3f}s  (stage time is summed across worker threads)")
+        print(f"{'='*60}\n")
+
+    def write_chrome_trace(self, path: str) -> Path:
+        """Write Chrome trace event JSON (open in chrome://tracing or ui.perfetto.dev)"""
+        with self._lock:
+            events = list(self._events)
+            lanes = dict(self._lanes)
+
+        trace = [{
+            "name": "process_name", "ph": "M", "pid": 1, "tid": 0,
+            "args": {"name": "jobhunt scan"},
+        }]
+        for lane, name in sorted(lanes.values()):
+            trace.append({
+                "name": "thread_name", "ph": "M", "pid": 1, "tid": lane,
+                "args": {"name": name},
+            })
+
+        for stage, ident, started, duration, args in events:
+            trace.append({
+                "name": stage,
+                "cat": stage,
+                "ph": "X",
+                "pid": 1,
+                "tid": lanes[ident][0],
+                "ts": round(started * 1e6, 1),
+                "dur": round(duration * 1e6, 1),
+                "args": args,
+            })
+
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        return output
+
+    def write_cprofile(self, output_dir: str) -> List[Path]:
+        """Dump merged cProfile stats per stage (.prof, readable by pstats/snakeviz)"""
+        with self._lock:
+            profiles = dict(self._profiles)
+
+        written = []
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        for stage, stats in sorted(profiles.items()):
+            path = out / f"{stage}.prof"
+            stats.dump_stats(str(path))
+            written.append(path)
+        return written
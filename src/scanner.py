@@ -1,16 +1,35 @@
 """
 Main job scanner orchestration
 """
+import sqlite3
+import threading
+import time
 from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from .sources import SOURCE_REGISTRY
+from .sources.base import DeadlineExceeded
 from .models import Job
 from .filtering import JobFilter
 from .state import StateManager
 from .alerting import SlackAlerter
 from .source_health import SourceHealth
+from .metrics import MetricsRegistry
+from .profiling import Profiler
+from .dedup import DuplicateDetector
+from .outbox import DeliveryPool, alert_payload
+from .sinks import AlertSink, SlackSink
+from .tiers import TierPlan
+from .schedule import BoardScheduler
+from .budget import ScanBudget, board_key, format_duration, rank_tasks
+from .singleflight import SingleFlight
+from .memory import MemoryLimit, SpillStore, format_size, peak_rss
+from .concurrency import ConcurrencyController
+
+# Checkpoints are committed every this many boards or seconds, whichever comes first
+CHECKPOINT_BATCH = 25
+CHECKPOINT_INTERVAL = 5.0
 
 
 class JobScanner:
@@ -26,43 +45,176 @@ class JobScanner:
         dry_run: bool = False,
         explain: bool = False,
         print_all: bool = False,
-        skip_failed_sources: bool = True
+        skip_failed_sources: bool = True,
+        metrics: Optional[MetricsRegistry] = None,
+        metrics_config: Optional[dict] = None,
+        profiler: Optional[Profiler] = None,
+        profile_dir: str = "out/profile",
+        dedup_config: Optional[dict] = None,
+        alerts_config: Optional[dict] = None,
+        sinks: Optional[List[AlertSink]] = None,
+        tier_plan: Optional[TierPlan] = None,
+        scheduler: Optional[BoardScheduler] = None,
+        budget: Optional[ScanBudget] = None,
+        carryover: Optional[List[str]] = None,
+        job_filter: Optional[JobFilter] = None,
+        source_health: Optional[SourceHealth] = None,
+        deliver: bool = True,
+        feeds_config: Optional[dict] = None,
+        max_memory: Optional[int] = None,
+        checkpoint: bool = False,
+        resume_since: Optional[str] = None,
+        concurrency: Optional[dict] = None
     ):
         self.sources = sources
-        self.filter = JobFilter(filter_config)
+        self.tier_plan = tier_plan
+        self.scheduler = scheduler
+        self.budget = budget
+        self.previous_carryover = carryover or []
+        # Boards left unfetched when the budget ran out ("type/identifier")
+        self.carryover: List[str] = []
+        self.metrics = metrics or MetricsRegistry()
+        self.profiler = profiler or Profiler()
+        self.profile_dir = profile_dir
+        self.metrics_config = metrics_config or {}
+        # serve passes a long-lived filter so compiled patterns and geo cache survive scans
+        self.filter = job_filter or JobFilter(filter_config, metrics=self.metrics)
         self.state = state_manager
-        self.slack = slack_alerter
+        self.alerts_config = alerts_config or {}
+        if sinks is None:
+            sinks = []
+            if slack_alerter:
+                sinks.append(SlackSink(self.alerts_config, alerter=slack_alerter))
+        self.sinks = sinks
+        # Shards only queue alerts; `merge` hands them to the main outbox
+        self.deliver = deliver
+        self.outbox: Optional[DeliveryPool] = None
+        self.sink_stats: Dict[str, Dict] = {}
+        self.deferred_alerts: List[Job] = []
         self.max_workers = max_workers
+        # Fetches in flight start at max_workers; with concurrency.adaptive the
+        # limit moves between its min/max_workers (AIMD), otherwise it stays put
+        concurrency = concurrency or {}
+        if concurrency.get("adaptive"):
+            self.concurrency = ConcurrencyController(
+                max_workers,
+                min_workers=concurrency.get("min_workers", 2),
+                max_workers=concurrency.get("max_workers", 32),
+                increase=concurrency.get("increase", 1),
+                decrease=concurrency.get("decrease", 0.5),
+                latency_factor=concurrency.get("latency_factor", 3.0),
+            )
+        else:
+            self.concurrency = ConcurrencyController(max_workers)
         self.dry_run = dry_run
         self.explain = explain
         self.print_all = print_all
         self.skip_failed_sources = skip_failed_sources
 
+        # Title/location gates run inside the plugins, before normalizing.
+        # Off with --print-all, which reports every rejected job.
+        self.pre_filter = None
+        if filter_config.get("prefilter", True) and not print_all:
+            self.pre_filter = self.filter.prefilter
+        self.rejected_at_source: Dict[str, int] = {}
+
+        # Cross-source duplicate clustering
+        dedup_config = dedup_config or {}
+        self.dedup = DuplicateDetector(state_manager, dedup_config) if dedup_config.get("enabled", True) else None
+        self.duplicates: Dict[str, List[Dict]] = {}
+
         # Source health tracking
-        self.source_health = SourceHealth()
+        self.source_health = source_health or SourceHealth()
 
         # Explore mode output
         self.explore_mode = filter_config.get('explore_mode', False)
         self.explore_jobs = []  # Collect all passed jobs for explore output
 
+        # Worker threads update stats/source_stats concurrently
+        self._stats_lock = threading.Lock()
+        self.source_stats: Dict[str, Dict] = {}
+
+        # id(job) -> (source_type, identifier), for per-board match yield
+        self._job_board: Dict[int, tuple] = {}
+        self._board_matches: Dict[tuple, int] = {}
+        # IDs the pre-filter dropped per board - still listed, so not closed
+        self._rejected_ids: Dict[tuple, List[str]] = {}
+        self._board_latency: Dict[tuple, float] = {}
+
+        # Identical feeds are fetched once per scan (see BaseSource.feed_key)
+        self._flights = SingleFlight()
+        self._shared_fetches: Dict[tuple, str] = {}
+        # Boards per (source_type, feed) still to fetch - the shared result is dropped after the last
+        self._feed_users: Dict[tuple, int] = {}
+        self._task_feed: Dict[tuple, tuple] = {}
+
+        # High-water marks of newest-first feeds (BaseSource.incremental)
+        self.feeds_config = feeds_config or {}
+        self._feed_marks: Dict[tuple, Dict] = {}
+        self._new_marks: Dict[tuple, Dict] = {}
+        self._partial_boards = set()
+
+        # --max-memory: fetches are admitted by expected size, descriptions
+        # go to disk once RSS nears the ceiling
+        self.max_memory = max_memory
+
+        # Fetched boards are checkpointed until the scan completes; --resume
+        # takes boards checkpointed since `resume_since` from there instead of fetching
+        self.checkpoint = checkpoint
+        self.resume_since = resume_since
+        self._checkpoints_unsaved = 0
+        self._checkpoints_saved_at = time.monotonic()
+        self.memory = MemoryLimit(max_memory) if max_memory else None
+        self.spill: Optional[SpillStore] = None
+
         self.stats = {
             "sources_scanned": 0,
             "sources_skipped": 0,
+            "sources_not_due": 0,
+            "sources_carried_over": 0,
+            "sources_coalesced": 0,
             "jobs_fetched": 0,
+            "jobs_rejected_at_source": 0,
+            "jobs_duplicates": 0,
             "jobs_passed": 0,
             "jobs_new": 0,
             "jobs_updated": 0,
+            "jobs_closed": 0,
+            "jobs_reopened": 0,
             "alerts_sent": 0,
+            "alerts_deferred": 0,
             "errors": 0,
+            "jobs_spilled": 0,
+            "sources_resumed": 0,
+            "jobs_resumed": 0,
+            "workers_final": 0,
+            "workers_peak": 0,
+            "workers_decreases": 0,
+            "peak_rss_mb": 0,
         }
 
     def scan(self) -> Dict:
         """Run full scan pipeline"""
         print("🚀 Starting job scan...")
+        self.started_at = datetime.utcnow()
+        scan_started = time.perf_counter()
+        self.profiler.start()
+
+        if self.dedup:
+            self.dedup.prepare()
+        if self.scheduler:
+            self.scheduler.load()
+        if self.feeds_config.get("incremental", True):
+            self._feed_marks = self.state.get_feed_marks()
+
+        checkpoints = self.state.get_checkpoints(self.resume_since) if self.resume_since else {}
+        resumed = []
 
         # Collect tasks
         tasks = []
+        seen = set()
         skipped = 0
+        not_due = 0
         for source_type, identifiers in self.sources.items():
             source_class = SOURCE_REGISTRY.get(source_type)
             if not source_class:
@@ -70,6 +222,11 @@ class JobScanner:
                 continue
 
             for identifier in identifiers:
+                # Listed in more than one config section
+                if (source_type, identifier) in seen:
+                    continue
+                seen.add((source_type, identifier))
+
                 # Check source health
                 if self.skip_failed_sources and self.source_health.should_skip(source_type, identifier):
                     status = self.source_health.get_status(source_type, identifier)
@@ -78,65 +235,315 @@ class JobScanner:
                         print(f"  ⏭️  Skipping {source_type}/{identifier} (status: {status})")
                     continue
 
+                # Fetched by an interrupted run (its schedule already moved on, so before is_due)
+                if (source_type, identifier) in checkpoints:
+                    resumed.append((source_type, identifier))
+                    continue
+
+                # Adaptive revisit plan
+                if self.scheduler and not self.scheduler.is_due(source_type, identifier):
+                    not_due += 1
+                    continue
+
                 tasks.append((source_type, identifier, source_class))
+                feed = (source_type, source_class().feed_key(identifier))
+                self._feed_users[feed] = self._feed_users.get(feed, 0) + 1
+                self._task_feed[(source_type, identifier)] = feed
 
         if skipped > 0:
             print(f"  ⏭️  Skipped {skipped} failed sources")
+        if not_due > 0:
+            print(f"  💤 {not_due} boards not due yet (see `jobhunt.py schedule`)")
+        if resumed:
+            print(f"  ⏯️  Resuming {len(resumed)} boards from the interrupted scan's checkpoints")
 
         print(f"  📦 Scanning {len(tasks)} sources...")
         self.stats['sources_skipped'] = skipped
+        self.stats['sources_not_due'] = not_due
+
+        # Fetch jobs in parallel, most valuable boards first when on a budget
+        expected = {}
+        board_stats = self.state.get_board_stats() if self.budget or self.memory else {}
+        if self.budget:
+            tasks, expected = rank_tasks(tasks, board_stats, self.previous_carryover)
 
-        # Fetch jobs in parallel
         all_jobs = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self._fetch_jobs, src_type, ident, src_class): (src_type, ident)
-                for src_type, ident, src_class in tasks
+        costs = {}
+        if self.memory:
+            self.spill = SpillStore()
+            costs = {
+                (src_type, ident): self.memory.cost(board_stats.get((src_type, ident), {}).get("response_bytes", 0))
+                for src_type, ident, _ in tasks
             }
+        if resumed:
+            with self.profiler.span("state", op="resume"):
+                for src_type, ident in resumed:
+                    self._resume_board(src_type, ident, all_jobs)
+        pending = list(reversed(tasks))
+        controller = self.concurrency
+        with ThreadPoolExecutor(max_workers=controller.max_workers, thread_name_prefix="fetch") as executor:
+            futures = {}
+            while pending or futures:
+                while pending and len(futures) < controller.limit:
+                    src_type, ident, src_class = pending[-1]
+                    if self.memory and futures and not self.memory.has_room(costs[(src_type, ident)]):
+                        # Let in-flight fetches land (and spill) first
+                        break
+                    pending.pop()
+                    key = board_key(src_type, ident)
+                    if self.budget and not self.budget.can_dispatch(expected[key]):
+                        # Would not finish in time - first in line next run
+                        self.carryover.append(key)
+                        self._release_feed(self._task_feed[(src_type, ident)])
+                        continue
+                    if self.memory:
+                        self.memory.reserved += costs[(src_type, ident)]
+                    futures[executor.submit(self._fetch_jobs, src_type, ident, src_class)] = (src_type, ident)
+
+                if not futures:
+                    break
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                in_flight = len(futures)
+                for future in done:
+                    src_type, ident = futures.pop(future)
+                    if self.memory:
+                        self.memory.reserved -= costs[(src_type, ident)]
+                    self._record_fetch_result(src_type, ident, future, all_jobs)
+                    source = self.source_stats[board_key(src_type, ident)]
+                    controller.record(
+                        src_type,
+                        source["latency"],
+                        error=future.exception(),
+                        throttled=source["throttled"],
+                        in_flight=in_flight,
+                        measured=not source["shared"],
+                    )
+
+        if self._checkpoints_unsaved:
+            self._commit_checkpoints()
+
+        self.stats['workers_final'] = controller.limit
+        self.stats['workers_peak'] = controller.peak
+        self.stats['workers_decreases'] = controller.decreases
+        self.metrics.set("jobhunt_fetch_concurrency", controller.limit)
+
+        self.stats['sources_carried_over'] = len(self.carryover)
+        if self.carryover:
+            print(f"  ⏱️  Budget exhausted - {len(self.carryover)} boards carried over to the next run")
+
+        # Collapse cross-posted copies to one canonical job each
+        if self.dedup:
+            with self.profiler.span("dedup", jobs=len(all_jobs)):
+                canonical_jobs, self.duplicates = self.dedup.cluster(all_jobs)
+            self.stats['jobs_duplicates'] = len(all_jobs) - len(canonical_jobs)
+            all_jobs = canonical_jobs
+
+        # Deliver alerts in the background while filtering
+        if not self.dry_run and self.sinks and self.deliver:
+            self.outbox = DeliveryPool(
+                self.state.db_path,
+                self.sinks,
+                max_attempts=self.alerts_config.get("max_attempts", 5),
+                backoff=self.alerts_config.get("backoff", 2.0),
+                metrics=self.metrics,
+            )
+            self.outbox.start()
 
-            for future in as_completed(futures):
-                src_type, ident = futures[future]
-                try:
-                    jobs = future.result()
-                    all_jobs.extend(jobs)
-                    self.stats['sources_scanned'] += 1
+        # Filter jobs
+        print(f"\n🔍 Filtering {len(all_jobs)} jobs...")
+        alerts = []
 
-                    # Record success
-                    self.source_health.record_success(src_type, ident)
+        try:
+            with self.profiler.span("filter", jobs=len(all_jobs)):
+                self._filter_jobs(all_jobs, alerts)
+        except BaseException:
+            # Don't leave the sink workers claiming rows behind a failed scan
+            if self.outbox:
+                self.outbox.stop()
+            raise
+        finally:
+            if self.spill:
+                self.stats['jobs_spilled'] = self.spill.spilled
+                self.spill.close()
+        # Matches are kept without their descriptions; the rest can go
+        all_jobs.clear()
+
+        # Match yield per fetch second feeds the budget planner
+        with self.profiler.span("state", op="board_stats"):
+            self.state.update_board_stats([
+                (
+                    src_type, ident, latency, self._board_matches.get((src_type, ident), 0),
+                    self.source_stats[board_key(src_type, ident)]["bytes"]
+                )
+                for (src_type, ident), latency in self._board_latency.items()
+            ])
+            # Only now that their items are filtered and saved
+            if self._new_marks:
+                self.state.save_feed_marks(list(self._new_marks.values()))
+
+        if self.outbox:
+            print(f"\n📢 Delivering alerts to {', '.join(self.outbox.sink_names)} ({len(alerts)} new)...")
+            with self.profiler.span("alert", alerts=len(alerts)):
+                self._drain_outbox()
+        elif not self.dry_run and alerts:
+            self.stats['alerts_deferred'] = len(alerts)
+            self.deferred_alerts = [job for job, _ in alerts]
+            if self.deliver:
+                print(f"\n📥 {len(alerts)} alerts queued (no alert sink configured - run flush-alerts later)")
+            else:
+                print(f"\n📥 {len(alerts)} alerts queued in the shard segment (delivered after `merge`)")
 
-                    print(f"  ✓ {src_type}/{ident}: {len(jobs)} jobs")
-                except Exception as e:
-                    error_msg = str(e)
+        # Generate explore output
+        if self.explore_mode and self.explore_jobs:
+            self._write_explore_output()
 
-                    # Extract HTTP status if available
-                    http_status = None
-                    if "404" in error_msg:
-                        http_status = 404
-                    elif "403" in error_msg:
-                        http_status = 403
+        # Everything fetched is filtered and saved - nothing left to resume
+        if self.checkpoint:
+            self.state.clear_checkpoints()
 
-                    # Record failure
-                    self.source_health.record_failure(src_type, ident, error_msg, http_status)
+        # Summary
+        self.stats['peak_rss_mb'] = round(peak_rss() / 1024 ** 2, 1)
+        self._print_summary()
 
-                    print(f"  ✗ {src_type}/{ident}: {e}")
-                    self.stats['errors'] += 1
+        wall_time = time.perf_counter() - scan_started
+        if self.profiler.enabled:
+            self._write_profile(wall_time)
+        self.profiler.stop()
 
-        # Filter jobs
-        print(f"\n🔍 Filtering {len(all_jobs)} jobs...")
-        alerts = []
+        self._export_metrics(wall_time)
+        self._record_run(wall_time)
 
+        return self.stats
+
+    def _record_fetch_result(self, src_type: str, ident: str, future, all_jobs: List[Job]):
+        try:
+            jobs = future.result()
+            self._incr('sources_scanned')
+            shared_feed = self._shared_fetches.get((src_type, ident))
+            if self.checkpoint:
+                with self.profiler.span("state", op="checkpoint"):
+                    # A shared fetch's jobs are in the checkpoint of the board that fetched the feed
+                    self.state.save_checkpoint(src_type, ident, [] if shared_feed else jobs, commit=False)
+                    self._checkpoints_unsaved += 1
+                    if (self._checkpoints_unsaved >= CHECKPOINT_BATCH
+                            or time.monotonic() - self._checkpoints_saved_at >= CHECKPOINT_INTERVAL):
+                        self._commit_checkpoints()
+            if shared_feed:
+                # Same Job objects as the board that fetched the feed
+                self._incr('sources_coalesced')
+            else:
+                if self.spill and (self.spill.active or self.memory.under_pressure()):
+                    jobs = self._spill_jobs(jobs, all_jobs)
+                all_jobs.extend(jobs)
+                self._board_latency[(src_type, ident)] = self.source_stats[board_key(src_type, ident)]["latency"]
+                for job in jobs:
+                    self._job_board[id(job)] = (src_type, ident)
+
+            # Record success
+            with self.profiler.span("state", op="source_health"):
+                self.source_health.record_success(src_type, ident)
+
+            partial = (src_type, ident) in self._partial_boards
+            if self.scheduler:
+                with self.profiler.span("state", op="schedule"):
+                    changes = self.scheduler.record_fetch(
+                        src_type, ident, jobs, partial=partial,
+                        rejected_ids=self._rejected_ids.pop((src_type, ident), [])
+                    )
+                self._incr('jobs_closed', changes["removed"])
+                self._incr('jobs_reopened', changes["reopened"])
+
+            note = ""
+            if shared_feed:
+                note = f" (shared fetch of {shared_feed})"
+            elif partial:
+                note = " (new since last scan)"
+            rejected = self.source_stats[board_key(src_type, ident)]["rejected"]
+            if rejected:
+                note += f" (+{rejected} rejected at source)"
+            print(f"  ✓ {src_type}/{ident}: {len(jobs)} jobs{note}")
+        except Exception as e:
+            error_msg = str(e)
+            self.source_stats[board_key(src_type, ident)]["error"] = error_msg
+
+            if isinstance(e, DeadlineExceeded) or isinstance(e.__cause__, DeadlineExceeded):
+                # Cut off by the budget - not the board's fault
+                print(f"  ⏱️  {src_type}/{ident}: cut off by the scan budget")
+                self.carryover.append(board_key(src_type, ident))
+                return
+
+            # Extract HTTP status if available
+            http_status = None
+            if "404" in error_msg:
+                http_status = 404
+            elif "403" in error_msg:
+                http_status = 403
+
+            # Record failure
+            with self.profiler.span("state", op="source_health"):
+                self.source_health.record_failure(src_type, ident, error_msg, http_status)
+
+            print(f"  ✗ {src_type}/{ident}: {e}")
+            self._incr('errors')
+            self.metrics.inc("jobhunt_source_errors_total", source=src_type)
+
+    def _commit_checkpoints(self):
+        self.state.commit()
+        self._checkpoints_unsaved = 0
+        self._checkpoints_saved_at = time.monotonic()
+
+    def _resume_board(self, src_type: str, ident: str, all_jobs: List[Job]):
+        """Add a checkpointed board's jobs as if it had just been fetched"""
+        jobs = self.state.load_checkpoint(src_type, ident)
+        # Fingerprint while the descriptions are still in memory, as _fetch_jobs does
+        if self.dedup and jobs:
+            with self.profiler.span("dedup", source=src_type, board=ident):
+                self.dedup.precompute(jobs)
+        if self.spill and (self.spill.active or self.memory.under_pressure()):
+            jobs = self._spill_jobs(jobs, all_jobs)
+        all_jobs.extend(jobs)
+        for job in jobs:
+            self._job_board[id(job)] = (src_type, ident)
+        self._incr('sources_resumed')
+        self._incr('jobs_resumed', len(jobs))
+        self._incr('jobs_fetched', len(jobs))
+        if self.explain:
+            print(f"  ⏯️  {src_type}/{ident}: {len(jobs)} jobs from checkpoint")
+
+    def _spill_jobs(self, jobs: List[Job], all_jobs: List[Job]) -> List[Job]:
+        """Move descriptions to the spill store - on first use, the ones already held too"""
+        if not self.spill.active:
+            self.spill.active = True
+            print(f"  💾 RSS near the {format_size(self.max_memory)} limit - spilling job descriptions to disk")
+            held = self.spill.spill(all_jobs)
+            for i, (job, copy) in enumerate(zip(all_jobs, held)):
+                if copy is not job:
+                    self._job_board[id(copy)] = self._job_board.pop(id(job), None)
+                    all_jobs[i] = copy
+        return self.spill.spill(jobs)
+
+    def _filter_jobs(self, all_jobs: List[Job], alerts: List[tuple]):
         for job in all_jobs:
+            board = self._job_board.get(id(job))
+            if self.spill:
+                job = self.spill.restore(job)
             result = self.filter.filter_job(job, explain=self.explain or self.print_all)
 
             if result.passed:
                 self.stats['jobs_passed'] += 1
+                if board:
+                    self._board_matches[board] = self._board_matches.get(board, 0) + 1
+
+                with self.metrics.timer("jobhunt_state_seconds", op="check_alert"), self.profiler.span("state"):
+                    should_alert, is_new = self._check_should_alert(job, result)
+
+                explanation = self.filter.explain_job(job) if should_alert and self.explain else None
+                job = job.without_content()
 
                 # Store for explore mode
                 if self.explore_mode:
                     self.explore_jobs.append((job, result))
 
-                should_alert, is_new = self._check_should_alert(job)
-
                 if should_alert:
                     if is_new:
                         self.stats['jobs_new'] += 1
@@ -144,43 +551,132 @@ class JobScanner:
                         self.stats['jobs_updated'] += 1
 
                     alerts.append((job, result))
+                    if self.outbox:
+                        self.outbox.notify()
 
                     if self.explain or self.print_all:
                         print(f"\n✅ MATCH: {job.title} @ {job.company}")
                         if self.explain:
-                            print(self.filter.explain_job(job))
+                            print(explanation)
 
             elif self.print_all:
                 print(f"\n❌ REJECT: {job.title} @ {job.company}")
                 print(f"Reason: {result.drop_reason}")
 
-        # Send alerts
-        if not self.dry_run and self.slack and alerts:
-            print(f"\n📢 Sending {len(alerts)} alerts to Slack...")
-            self._send_alerts(alerts)
-
-        # Generate explore output
-        if self.explore_mode and self.explore_jobs:
-            self._write_explore_output()
-
-        # Summary
-        self._print_summary()
-
-        return self.stats
+    def _incr(self, key: str, value: int = 1):
+        with self._stats_lock:
+            self.stats[key] += value
 
     def _fetch_jobs(self, source_type: str, identifier: str, source_class) -> List[Job]:
-        source = source_class()
-        jobs = source.fetch_jobs(identifier)
-        self.stats['jobs_fetched'] += len(jobs)
+        started = time.perf_counter()
+        source = None
+        jobs = []
+        shared = False
+        try:
+            source = source_class()
+            source.profiler = self.profiler
+            source.pre_filter = self.pre_filter
+            if self.budget:
+                source.deadline = self.budget.fetch_deadline
+            feed = source.feed_key(identifier)
+            if source.incremental:
+                source.since = self._feed_since(source_type, feed)
+
+            def fetch():
+                fetched = source.fetch_jobs(identifier)
+                self._record_rejected(source.rejected)
+                if source.newest_seen:
+                    with self._stats_lock:
+                        self._new_marks[(source_type, feed)] = {
+                            "source": source_type,
+                            "feed": feed,
+                            "mark": source.newest_seen,
+                            "full_pass": source.since is None,
+                            "partial": source.partial,
+                        }
+                return fetched, source.rejected_ids
+
+            with self.profiler.span("normalize", source=source_type, board=identifier):
+                try:
+                    (jobs, rejected_ids), shared = self._flights.do((source_type, feed), fetch)
+                finally:
+                    self._release_feed((source_type, feed))
+            self._rejected_ids[(source_type, identifier)] = rejected_ids
+            if shared:
+                self._shared_fetches[(source_type, identifier)] = feed
+            mark = self._new_marks.get((source_type, feed))
+            if mark and mark["partial"]:
+                self._partial_boards.add((source_type, identifier))
+        finally:
+            elapsed = time.perf_counter() - started
+            fetched_bytes = source.bytes_fetched if source else 0
+            throttled = source.throttled if source else 0
+            new_jobs = 0 if shared else len(jobs)
+            rejected = 0 if shared or not source else sum(source.rejected.values())
+
+            self.metrics.observe("jobhunt_source_fetch_seconds", elapsed, source=source_type)
+            self.metrics.inc("jobhunt_source_bytes_total", fetched_bytes, source=source_type)
+            self.metrics.inc("jobhunt_source_jobs_total", new_jobs, source=source_type)
+            self.metrics.inc("jobhunt_source_jobs_rejected_total", rejected, source=source_type)
+            self.metrics.set("jobhunt_board_fetch_seconds", elapsed, source=source_type, board=identifier)
+            self.metrics.set("jobhunt_board_jobs", len(jobs), source=source_type, board=identifier)
+
+            with self._stats_lock:
+                self.stats['jobs_fetched'] += new_jobs
+                self.source_stats[f"{source_type}/{identifier}"] = {
+                    "latency": round(elapsed, 4),
+                    "bytes": fetched_bytes,
+                    "jobs": len(jobs),
+                    "rejected": rejected,
+                    "shared": shared,
+                    "throttled": throttled,
+                    "error": None,
+                }
+
+        if self.dedup and jobs and not shared:
+            with self.profiler.span("dedup", source=source_type, board=identifier):
+                self.dedup.precompute(jobs)
+
         return jobs
 
-    def _check_should_alert(self, job: Job) -> tuple:
-        """Check if should alert (new or updated)"""
+    def _release_feed(self, key: tuple):
+        with self._stats_lock:
+            self._feed_users[key] = self._feed_users.get(key, 1) - 1
+            if self._feed_users[key] <= 0:
+                self._flights.forget(key)
+
+    def _record_rejected(self, reasons: Dict[str, int]):
+        with self._stats_lock:
+            for reason, count in reasons.items():
+                self.rejected_at_source[reason] = self.rejected_at_source.get(reason, 0) + count
+                self.stats['jobs_rejected_at_source'] += count
+
+    def _feed_since(self, source_type: str, feed: str) -> Optional[str]:
+        """High-water mark to stop at, or None for a full pass"""
+        row = self._feed_marks.get((source_type, feed))
+        if not row or not self.feeds_config.get("incremental", True):
+            return None
+        # Periodic full pass picks up edited postings below the mark
+        full_pass_hours = self.feeds_config.get("full_pass_hours", 24)
+        if not row["full_pass_at"] or datetime.fromisoformat(row["full_pass_at"]) < datetime.utcnow() - timedelta(hours=full_pass_hours):
+            return None
+        return row["mark"]
+
+    def _check_should_alert(self, job: Job, result) -> tuple:
+        """Check if should alert (new or updated) and queue the alert with the job"""
         db_key = job.get_db_key()
         existing = self.state.get_job_state(db_key)
 
+        alert = None
+        if not self.dry_run:
+            alert = alert_payload(job, result, self.duplicates.get(db_key))
+
         if not existing:
-            self.state.save_job(job, is_new=True)
+            # Copy of a posting already alerted from another source
+            if self.dedup and self.dedup.seen_elsewhere(db_key):
+                self.state.save_job(job, is_new=True, score=result.score)
+                return False, False
+            self.state.save_job(job, is_new=True, alert=alert, sinks=self._sink_names(), score=result.score)
             return True, True
 
         is_updated = job.is_updated(
@@ -189,19 +685,31 @@ class JobScanner:
         )
 
         if is_updated:
-            self.state.save_job(job, is_new=False)
+            self.state.save_job(job, is_new=False, alert=alert, sinks=self._sink_names(), score=result.score)
             return True, False
 
+        if existing["score"] is None:
+            self.state.index_job(job, result.score)
+
         return False, False
 
-    def _send_alerts(self, alerts: List[tuple]):
-        for job, result in alerts:
-            try:
-                self.slack.send_alert(job, result)
-                self.stats['alerts_sent'] += 1
-            except Exception as e:
-                print(f"  ⚠️  Failed alert: {e}")
-                self.stats['errors'] += 1
+    def _sink_names(self) -> List[str]:
+        # Without sinks, queue for Slack so flush-alerts can deliver later
+        return [sink.name for sink in self.sinks] or ["slack"]
+
+    def _drain_outbox(self):
+        """Wait for the sink workers to deliver what is due"""
+        self.sink_stats = self.outbox.drain(timeout=self.alerts_config.get("drain_timeout", 30))
+
+        for counts in self.sink_stats.values():
+            self.stats['alerts_sent'] += counts["sent"]
+            # Failed rows (retries exhausted) are still retried by flush-alerts
+            self.stats['alerts_deferred'] += counts["pending"] + counts["failed"]
+            self.stats['errors'] += counts["failed"]
+        for error in sorted(set(self.outbox.errors))[:5]:
+            print(f"  ⚠️  Failed alert: {error}")
+        if self.stats['alerts_deferred']:
+            self.deferred_alerts = self.outbox.pending_jobs()
 
     def _print_summary(self):
         print(f"\n{'='*60}")
@@ -210,12 +718,64 @@ class JobScanner:
         print(f"  Sources scanned:   {self.stats['sources_scanned']}")
         if self.stats['sources_skipped'] > 0:
             print(f"  Sources skipped:   {self.stats['sources_skipped']} (failed)")
+        if self.stats['sources_not_due'] > 0:
+            print(f"  Sources not due:   {self.stats['sources_not_due']} (adaptive schedule)")
+        if self.stats['sources_coalesced'] > 0:
+            print(f"  Shared fetches:    {self.stats['sources_coalesced']} (same feed as another source)")
+        if self.stats['sources_resumed'] > 0:
+            print(f"  Sources resumed:   {self.stats['sources_resumed']} ({self.stats['jobs_resumed']} jobs from checkpoints)")
         print(f"  Jobs fetched:      {self.stats['jobs_fetched']}")
+        if self.stats['jobs_rejected_at_source'] > 0:
+            print(f"  Rejected at source: {self.stats['jobs_rejected_at_source']} (title/location pre-filter)")
+            if self.explain:
+                for reason, count in sorted(self.rejected_at_source.items(), key=lambda item: -item[1])[:10]:
+                    print(f"    {count:>6}  {reason}")
+        if self.stats['jobs_duplicates'] > 0:
+            print(f"  Duplicates:        {self.stats['jobs_duplicates']} (cross-posted copies)")
         print(f"  Jobs passed:       {self.stats['jobs_passed']}")
         print(f"  New jobs:          {self.stats['jobs_new']}")
         print(f"  Updated jobs:      {self.stats['jobs_updated']}")
+        if self.stats['jobs_closed'] or self.stats['jobs_reopened']:
+            print(f"  Closed postings:   {self.stats['jobs_closed']} ({self.stats['jobs_reopened']} reopened)")
         print(f"  Alerts sent:       {self.stats['alerts_sent']}")
+        if self.stats['alerts_deferred'] > 0:
+            print(f"  Alerts deferred:   {self.stats['alerts_deferred']} (queued - retried next run or by flush-alerts)")
+            for job in self.deferred_alerts[:10]:
+                print(f"    - {job.company}: {job.title} {job.url}")
+            if self.stats['alerts_deferred'] > 10:
+                print(f"    ... and {self.stats['alerts_deferred'] - 10} more")
         print(f"  Errors:            {self.stats['errors']}")
+        if self.max_memory:
+            print(
+                f"  Peak RSS:          {self.stats['peak_rss_mb']:.0f} MB of {format_size(self.max_memory)}"
+                f" ({self.stats['jobs_spilled']} descriptions spilled to disk)"
+            )
+        else:
+            print(f"  Peak RSS:          {self.stats['peak_rss_mb']:.0f} MB")
+        if self.budget:
+            print(
+                f"  Budget:            {format_duration(self.budget.elapsed())} of {format_duration(self.budget.seconds)}"
+                f" ({self.stats['sources_carried_over']} boards carried over)"
+            )
+        if self.concurrency.adaptive:
+            controller = self.concurrency
+            print(
+                f"  Concurrency:       {self.stats['workers_final']} at the end, peak {self.stats['workers_peak']}"
+                f" ({controller.min_workers}-{controller.max_workers}, {self.stats['workers_decreases']} decreases)"
+            )
+            for line in controller.summary_lines():
+                print(f"  {line}")
+
+        if self.sink_stats:
+            print("\n  Alert sinks:")
+            for name, counts in self.sink_stats.items():
+                print(
+                    f"    {name:<16} sent {counts['sent']:<5} deferred {counts['pending'] + counts['failed']:<5}"
+                    f" {counts['batches']} batches, avg {counts['latency_avg']:.2f}s, max {counts['latency_max']:.2f}s"
+                )
+
+        if self.tier_plan:
+            self.tier_plan.print_summary()
 
         # Source health summary
         health_stats = self.source_health.get_stats()
@@ -229,6 +789,86 @@ class JobScanner:
 
         print(f"{'='*60}\n")
 
+    def _write_profile(self, wall_time: float):
+        """Print stage breakdown and write trace/profile files"""
+        gate_times = {}
+        gate_metric = self.metrics.snapshot().get("jobhunt_filter_gate_seconds", {})
+        for series in gate_metric.get("series", []):
+            gate_times[series["labels"]["gate"]] = series["sum"]
+
+        self.profiler.print_table(wall_time, gate_times)
+
+        try:
+            trace_path = self.profiler.write_chrome_trace(str(Path(self.profile_dir) / "trace.json"))
+            print(f"📈 Trace written to: {trace_path} (open in ui.perfetto.dev)")
+
+            if self.profiler.use_cprofile:
+                for path in self.profiler.write_cprofile(self.profile_dir):
+                    print(f"   cProfile: {path}")
+        except OSError as e:
+            print(f"  ⚠️  Failed to write profile: {e}")
+
+    def _export_metrics(self, duration: float):
+        """Write Prometheus textfile and JSON run record"""
+        finished_at = datetime.utcnow()
+
+        self.metrics.set("jobhunt_scan_duration_seconds", round(duration, 4))
+        self.metrics.set("jobhunt_scan_last_run_timestamp", int(time.time()))
+        for key, value in self.stats.items():
+            self.metrics.set("jobhunt_scan_stat", value, stat=key)
+
+        record = {
+            "started_at": self.started_at.isoformat(),
+            "finished_at": finished_at.isoformat(),
+            "duration_seconds": round(duration, 4),
+            "dry_run": self.dry_run,
+            "stats": self.stats,
+            "sources": self.source_stats,
+            "concurrency": self.concurrency.timeline,
+        }
+
+        try:
+            prom_path = self.metrics_config.get("prometheus_path")
+            if prom_path:
+                self.metrics.write_prometheus(prom_path)
+
+            record_path = self.metrics_config.get("run_record_path")
+            if record_path:
+                self.metrics.write_run_record(record_path, record)
+        except OSError as e:
+            print(f"  ⚠️  Failed to write metrics: {e}")
+
+    def _record_run(self, duration: float):
+        """Keep the run summary in the state DB for `jobhunt.py stats`"""
+        run = {
+            "started_at": self.started_at.isoformat(),
+            "finished_at": datetime.utcnow().isoformat(),
+            "duration_seconds": round(duration, 4),
+            "dry_run": int(self.dry_run),
+            "stats": self.stats,
+        }
+        for key in ("sources_scanned", "jobs_fetched", "jobs_passed", "jobs_new", "jobs_updated",
+                    "alerts_sent", "errors", "peak_rss_mb"):
+            run[key] = self.stats[key]
+
+        sources = []
+        for key, source in self.source_stats.items():
+            src_type, ident = key.split("/", 1)
+            sources.append({
+                "source": src_type,
+                "board": ident,
+                "latency": source["latency"],
+                "bytes": source["bytes"],
+                "jobs": source["jobs"],
+                "matches": self._board_matches.get((src_type, ident), 0),
+                "error": source["error"],
+            })
+
+        try:
+            self.state.record_scan_run(run, self.profiler.stage_totals(), sources)
+        except sqlite3.Error as e:
+            print(f"  ⚠️  Failed to record scan run: {e}")
+
     def _write_explore_output(self):
         """Write explore mode output to markdown file"""
         from pathlib import Path
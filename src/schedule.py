@@ -0,0 +1,105 @@
+"""
+Adaptive board revisit scheduling
+
+Every fetch is diffed against the board's previous job set (StateManager
+board_jobs) and the number of new or updated postings per hour feeds an
+exponential moving average of the board's churn. The next fetch is
+planned for when about `target_changes` changes are expected:
+
+    interval = target_changes / churn_ema    (clamped to min/max)
+
+Boards with no changes back off by `idle_backoff` per fetch. With
+scheduling enabled, scans skip boards that are not due yet, so fast
+movers get polled every run while dormant boards are visited rarely.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from .models import Job
+
+
+DEFAULT_SCHEDULE = {
+    "enabled": False,
+    "min_interval_hours": 2,
+    "max_interval_hours": 168,
+    "initial_interval_hours": 12,
+    "target_changes": 1.0,
+    "alpha": 0.3,
+    "idle_backoff": 1.5,
+}
+
+
+class BoardScheduler:
+    """Track per-board churn and decide which boards are due"""
+
+    def __init__(self, state_manager, config: Optional[dict] = None):
+        self.state = state_manager
+        self.config = {**DEFAULT_SCHEDULE, **(config or {})}
+        self.enabled = self.config["enabled"]
+        self._plan: Dict[Tuple[str, str], Dict] = {}
+
+    def load(self):
+        """Read the persisted plan (main thread, before a scan)"""
+        self._plan = {(row["source"], row["board"]): row for row in self.state.get_board_schedule()}
+
+    def is_due(self, source: str, board: str, now: Optional[datetime] = None) -> bool:
+        if not self.enabled:
+            return True
+        row = self._plan.get((source, board))
+        if row is None:
+            return True
+        now = now or datetime.utcnow()
+        return row["next_due"] <= now.isoformat()
+
+    def record_fetch(
+        self,
+        source: str,
+        board: str,
+        jobs: List[Job],
+        now: Optional[datetime] = None,
+        partial: bool = False,
+        rejected_ids: Optional[List[str]] = None
+    ) -> Dict:
+        """Diff the fetch against the board's last job set and re-plan its next visit"""
+        now = now or datetime.utcnow()
+        changes = self.state.record_board_jobs(source, board, jobs, partial=partial, rejected_ids=rejected_ids)
+        previous = self._plan.get((source, board))
+
+        if previous is None:
+            # First visit only sets the baseline job set
+            churn = None
+            ema = 0.0
+            interval = self.config["initial_interval_hours"]
+            fetches = 1
+        else:
+            last_fetch = datetime.fromisoformat(previous["last_fetch"])
+            hours = max((now - last_fetch).total_seconds() / 3600, 1 / 60)
+            churn = (changes["new"] + changes["updated"] + changes["reopened"]) / hours
+
+            alpha = self.config["alpha"]
+            ema = alpha * churn + (1 - alpha) * previous["churn_ema"]
+            if churn > 0 and ema > 0:
+                interval = self.config["target_changes"] / ema
+            else:
+                interval = previous["interval_hours"] * self.config["idle_backoff"]
+            fetches = previous["fetches"] + 1
+
+        interval = min(max(interval, self.config["min_interval_hours"]), self.config["max_interval_hours"])
+        row = {
+            "source": source,
+            "board": board,
+            "churn_ema": ema,
+            "interval_hours": interval,
+            "last_fetch": now.isoformat(),
+            "next_due": (now + timedelta(hours=interval)).isoformat(),
+            "fetches": fetches,
+            "last_changes": changes["new"] + changes["updated"] + changes["reopened"],
+        }
+        self.state.save_board_schedule(row)
+        self._plan[(source, board)] = row
+        return {**changes, "churn": churn, "interval_hours": interval}
+
+    def upcoming(self, limit: Optional[int] = None) -> List[Dict]:
+        """Planned fetches, soonest first"""
+        rows = sorted(self.state.get_board_schedule(), key=lambda r: r["next_due"])
+        return rows[:limit] if limit else rows
@@ -0,0 +1,304 @@
+"""
+Sharded scans
+
+`scan --shard i/N` scans only the boards that hash to shard i (1-based)
+on a consistent-hash ring keyed by (source_type, identifier), so adding a
+shard moves ~1/N of the boards instead of reshuffling all of them.
+
+A shard never writes the main state. It forks a segment - a copy of the
+main state and source-health DBs under `.state/shards/` - scans into it
+and queues alerts there without delivering them. `jobhunt.py merge`
+folds every segment back (newer rows win), moves the segments' new
+outbox rows into the main outbox and deletes the segments; the next scan
+or `flush-alerts` delivers. Cross-posted copies found by different shards
+are only alerted once: an alert is dropped at merge time when a job with
+the same company+title identity from another source already has one.
+"""
+import bisect
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+VNODES = 64
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """'2/4' -> (2, 4)"""
+    try:
+        index, total = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard: {text!r} (use i/N, e.g. 1/4)")
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"Invalid shard: {text!r} (i must be between 1 and N)")
+    return index, total
+
+
+def _point(key: str) -> int:
+    # Stable across processes and hosts, unlike hash()
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+
+class HashRing:
+    """Consistent-hash ring with VNODES virtual nodes per shard"""
+
+    def __init__(self, shards: int, vnodes: int = VNODES):
+        ring = sorted((_point(f"shard-{shard}-{v}"), shard) for shard in range(1, shards + 1) for v in range(vnodes))
+        self._points = [point for point, _ in ring]
+        self._shards = [shard for _, shard in ring]
+
+    def shard_for(self, source_type: str, identifier: str) -> int:
+        i = bisect.bisect(self._points, _point(f"{source_type}/{identifier}")) % len(self._points)
+        return self._shards[i]
+
+
+def shard_sources(sources: Dict[str, List[str]], index: int, total: int) -> Dict[str, List[str]]:
+    """The part of a source_type -> identifiers mapping owned by shard `index`"""
+    ring = HashRing(total)
+    owned = {}
+    for source_type, identifiers in sources.items():
+        mine = [i for i in identifiers if ring.shard_for(source_type, i) == index]
+        if mine:
+            owned[source_type] = mine
+    return owned
+
+
+def segment_paths(state_path: str, health_path: str, index: int, total: int) -> Tuple[str, str]:
+    """(state segment, source-health segment) of one shard"""
+    directory = Path(state_path).parent / "shards"
+    suffix = f"shard-{index}-of-{total}"
+    return (
+        str(directory / f"{Path(state_path).stem}.{suffix}.sqlite"),
+        str(directory / f"{Path(health_path).stem}.{suffix}.db"),
+    )
+
+
+def fork_segment(main_path: str, segment_path: str, meta: Optional[Dict] = None) -> bool:
+    """
+    Copy a DB to a shard segment (consistent snapshot via the backup API)
+
+    An existing segment that was not merged yet is kept, so its results
+    are not lost. Returns True if a new segment was forked.
+    """
+    segment = Path(segment_path)
+    if segment.exists():
+        return False
+    segment.parent.mkdir(parents=True, exist_ok=True)
+
+    dest = sqlite3.connect(segment_path)
+    if Path(main_path).exists():
+        source = sqlite3.connect(main_path, timeout=30)
+        source.backup(dest)
+        source.close()
+
+    dest.execute("CREATE TABLE IF NOT EXISTS segment_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    rows = {"forked_at": datetime.utcnow().isoformat(), **(meta or {})}
+    dest.executemany(
+        "INSERT OR REPLACE INTO segment_meta (key, value) VALUES (?, ?)",
+        [(key, json.dumps(value)) for key, value in rows.items()]
+    )
+    dest.commit()
+    dest.close()
+    return True
+
+
+def set_segment_meta(segment_path: str, key: str, value):
+    conn = sqlite3.connect(segment_path, timeout=30)
+    conn.execute("INSERT OR REPLACE INTO segment_meta (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+    conn.commit()
+    conn.close()
+
+
+def find_segments(state_path: str) -> List[str]:
+    directory = Path(state_path).parent / "shards"
+    return sorted(str(p) for p in directory.glob(f"{Path(state_path).stem}.shard-*.sqlite"))
+
+
+def merge_segment(state_path: str, health_path: str, segment_path: str) -> Dict:
+    """
+    Fold one shard segment into the main state and source-health DBs
+
+    Returns counts plus the segment's saved scan cursor (or None) and
+    the path of its source-health segment.
+    """
+    conn = sqlite3.connect(state_path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("ATTACH DATABASE ? AS seg", (segment_path,))
+    meta = {row["key"]: json.loads(row["value"]) for row in conn.execute("SELECT * FROM seg.segment_meta")}
+    forked_at = meta["forked_at"]
+    counts = {"jobs": 0, "boards": 0, "alerts": 0, "duplicate_alerts": 0, "health": 0, "runs": 0, "events": 0}
+
+    with conn:
+        # Ids are local to each DB; a job taken from the segment gets a new one
+        columns = _column_list(conn, "jobs", exclude="id")
+        counts["jobs"] = conn.execute(f"""
+            INSERT INTO jobs ({columns}) SELECT {columns} FROM seg.jobs WHERE last_seen >= ?
+            ON CONFLICT (db_key) DO UPDATE SET
+                title = excluded.title, location = excluded.location, url = excluded.url,
+                updated_at = excluded.updated_at, content_hash = excluded.content_hash,
+                first_seen = MIN(first_seen, excluded.first_seen), last_seen = excluded.last_seen,
+                score = COALESCE(excluded.score, jobs.score)
+            WHERE excluded.last_seen > jobs.last_seen
+        """, (forked_at,)).rowcount
+
+        # Search index rows of the jobs taken from the segment (ids differ between the DBs)
+        conn.execute("""
+            CREATE TEMP TABLE merged_jobs AS
+            SELECT m.id AS main_rowid, s.id AS seg_rowid FROM seg.jobs s
+            JOIN main.jobs m ON m.db_key = s.db_key
+            WHERE s.last_seen >= ? AND m.last_seen = s.last_seen
+        """, (forked_at,))
+        conn.execute("DELETE FROM main.jobs_fts WHERE rowid IN (SELECT main_rowid FROM merged_jobs)")
+        conn.execute("""
+            INSERT INTO main.jobs_fts (rowid, title, company, location, description)
+            SELECT mj.main_rowid, f.title, f.company, f.location, f.description
+            FROM merged_jobs mj JOIN seg.jobs_fts f ON f.rowid = mj.seg_rowid
+        """)
+        conn.execute("DROP TABLE merged_jobs")
+
+        # Keep the first cluster assignment a job got
+        columns = _column_list(conn, "job_fingerprints")
+        conn.execute(f"""
+            INSERT OR IGNORE INTO job_fingerprints ({columns})
+            SELECT {columns} FROM seg.job_fingerprints WHERE first_seen >= ?
+        """, (forked_at,))
+        columns = _column_list(conn, "fingerprint_bands")
+        conn.execute(f"INSERT OR IGNORE INTO fingerprint_bands ({columns}) SELECT {columns} FROM seg.fingerprint_bands")
+
+        # A board fetched by the shard replaces its job set, schedule and stats
+        conn.execute("""
+            CREATE TEMP TABLE merged_boards AS
+            SELECT s.source, s.board FROM seg.board_schedule s
+            LEFT JOIN main.board_schedule m ON m.source = s.source AND m.board = s.board
+            WHERE s.last_fetch >= ? AND (m.last_fetch IS NULL OR s.last_fetch > m.last_fetch)
+        """, (forked_at,))
+        counts["boards"] = conn.execute("SELECT COUNT(*) FROM merged_boards").fetchone()[0]
+        for table in ("board_jobs", "board_schedule", "board_stats"):
+            columns = _column_list(conn, table)
+            conn.execute(f"DELETE FROM main.{table} WHERE (source, board) IN (SELECT source, board FROM merged_boards)")
+            conn.execute(f"""
+                INSERT OR REPLACE INTO main.{table} ({columns})
+                SELECT {columns} FROM seg.{table} WHERE (source, board) IN (SELECT source, board FROM merged_boards)
+            """)
+        # Closed state follows the board job sets just taken from the segment
+        conn.execute("""
+            UPDATE main.jobs SET closed_at = b.closed_at
+            FROM main.board_jobs b
+            WHERE b.db_key = jobs.db_key AND (b.source, b.board) IN (SELECT source, board FROM merged_boards)
+        """)
+        conn.execute("DROP TABLE merged_boards")
+        counts["events"] = conn.execute("""
+            INSERT INTO main.job_events (source, board, job_id, db_key, event, at)
+            SELECT source, board, job_id, db_key, event, at FROM seg.job_events WHERE at >= ?
+        """, (forked_at,)).rowcount
+
+        columns = _column_list(conn, "feed_marks")
+        conn.execute(f"""
+            INSERT INTO main.feed_marks ({columns}) SELECT {columns} FROM seg.feed_marks WHERE updated_at >= ?
+            ON CONFLICT (source, feed) DO UPDATE SET
+                mark = MAX(mark, excluded.mark),
+                full_pass_at = NULLIF(MAX(COALESCE(full_pass_at, ''), COALESCE(excluded.full_pass_at, '')), ''),
+                updated_at = excluded.updated_at
+        """, (forked_at,))
+
+        # The shard's scan runs, renumbered
+        for run in conn.execute("SELECT * FROM seg.scan_runs WHERE started_at >= ? ORDER BY id", (forked_at,)).fetchall():
+            columns = [c for c in run.keys() if c != "id"]
+            run_id = conn.execute(
+                f"INSERT INTO main.scan_runs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                [run[c] for c in columns]
+            ).lastrowid
+            conn.execute("""
+                INSERT INTO main.scan_run_stages (run_id, stage, calls, seconds)
+                SELECT ?, stage, calls, seconds FROM seg.scan_run_stages WHERE run_id = ?
+            """, (run_id, run["id"]))
+            conn.execute("""
+                INSERT INTO main.scan_run_sources (run_id, source, board, latency, bytes, jobs, matches, error)
+                SELECT ?, source, board, latency, bytes, jobs, matches, error FROM seg.scan_run_sources WHERE run_id = ?
+            """, (run_id, run["id"]))
+            counts["runs"] += 1
+
+        # New alerts only; suppress cross-posted copies alerted by another shard
+        rows = conn.execute("""
+            SELECT o.*, f.identity, f.source AS fingerprint_source FROM seg.alert_outbox o
+            LEFT JOIN seg.job_fingerprints f ON f.db_key = o.db_key
+            WHERE o.created_at >= ? ORDER BY o.id
+        """, (forked_at,)).fetchall()
+        for row in rows:
+            if _already_alerted(conn, row, forked_at):
+                counts["duplicate_alerts"] += 1
+                continue
+            conn.execute("""
+                INSERT INTO main.alert_outbox (db_key, sink, payload, status, attempts, next_attempt_at, last_error, created_at, sent_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                row["db_key"], row["sink"], row["payload"], row["status"], row["attempts"],
+                row["next_attempt_at"], row["last_error"], row["created_at"], row["sent_at"]
+            ))
+            counts["alerts"] += 1
+
+    conn.execute("DETACH DATABASE seg")
+    conn.close()
+
+    health_segment = meta.get("health_segment")
+    if health_segment and Path(health_segment).exists():
+        counts["health"] = _merge_health(health_path, health_segment, forked_at)
+
+    counts["cursor"] = meta.get("cursor")
+    counts["health_segment"] = health_segment
+    return counts
+
+
+def _column_list(conn: sqlite3.Connection, table: str, exclude: str = "") -> str:
+    """
+    Columns of the main DB's `table`, to name on both sides of a merge
+
+    Column order differs between DBs whose columns were added by migrations
+    at different times, so `SELECT *` would shift values across columns.
+    """
+    columns = [row[1] for row in conn.execute(f"PRAGMA main.table_info({table})") if row[1] != exclude]
+    return ", ".join(columns)
+
+
+def _already_alerted(conn: sqlite3.Connection, row: sqlite3.Row, forked_at: str) -> bool:
+    same_job = conn.execute(
+        "SELECT 1 FROM main.alert_outbox WHERE db_key = ? AND sink = ? AND created_at = ? LIMIT 1",
+        (row["db_key"], row["sink"], row["created_at"])
+    ).fetchone()
+    if same_job:
+        return True
+    if not row["identity"]:
+        return False
+    copy = conn.execute("""
+        SELECT 1 FROM main.alert_outbox o
+        JOIN main.job_fingerprints f ON f.db_key = o.db_key
+        WHERE f.identity = ? AND f.source != ? AND o.sink = ? AND o.created_at >= ?
+        LIMIT 1
+    """, (row["identity"], row["fingerprint_source"], row["sink"], forked_at)).fetchone()
+    return copy is not None
+
+
+def _merge_health(health_path: str, segment_path: str, forked_at: str) -> int:
+    conn = sqlite3.connect(health_path, timeout=30)
+    conn.execute("ATTACH DATABASE ? AS seg", (segment_path,))
+    columns = _column_list(conn, "source_health")
+    with conn:
+        merged = conn.execute(f"""
+            INSERT INTO source_health ({columns}) SELECT {columns} FROM seg.source_health WHERE last_checked_at >= ?
+            ON CONFLICT (source_type, source_id) DO UPDATE SET
+                status = excluded.status, fail_count = excluded.fail_count,
+                last_ok_at = excluded.last_ok_at, last_error = excluded.last_error,
+                last_http_status = excluded.last_http_status, last_checked_at = excluded.last_checked_at
+            WHERE excluded.last_checked_at > COALESCE(source_health.last_checked_at, '')
+        """, (forked_at,)).rowcount
+    conn.execute("DETACH DATABASE seg")
+    conn.close()
+    return merged
+
+
+def remove_segment(path: str):
+    for suffix in ("", "-wal", "-shm"):
+        Path(path + suffix).unlink(missing_ok=True)
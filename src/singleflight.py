@@ -0,0 +1,59 @@
+"""
+Single-flight call coalescing
+
+Several config entries can resolve to the same download - RemoteOK has
+one feed whatever the identifier, unknown WeWorkRemotely categories fall
+back to the programming feed. Within a scan, SingleFlight runs the fetch
+once per key: callers that arrive while it is in flight wait for it, and
+later callers get the finished result (or the same exception) until the
+key is forgotten.
+"""
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Run fn() once per key and share its outcome"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable) -> Tuple[object, bool]:
+        """
+        Returns:
+            (result, shared) - shared is False only for the caller that ran fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result, not leader
+
+    def forget(self, key: Hashable):
+        """Drop a finished result once no other caller needs it"""
+        with self._lock:
+            self._calls.pop(key, None)
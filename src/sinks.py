@@ -0,0 +1,243 @@
+"""
+Alert sinks
+
+A sink delivers a batch of alerts somewhere: Slack, a generic JSON
+webhook, a JSONL file, or email through an SMTP relay. Every sink has its
+own batch size, concurrency and timeout; OutboxWorker runs one delivery
+loop per sink so a slow sink never holds up the others or the scan.
+
+Config (`alerts.sinks`):
+
+    [
+      {"type": "slack"},
+      {"type": "webhook", "url": "https://example.com/hook", "batch_size": 20},
+      {"type": "jsonl", "path": "out/alerts.jsonl"},
+      {"type": "email", "host": "localhost", "port": 25,
+       "from": "jobhunt@localhost", "to": ["me@example.com"], "batch_size": 50}
+    ]
+"""
+import json
+import smtplib
+import threading
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import requests
+
+from .alerting import SlackAlerter
+from .models import Job
+
+
+# (job, filter result, duplicate links)
+Alert = Tuple[Job, object, List[Dict]]
+
+
+class PartialDelivery(Exception):
+    """Some alerts of a batch were not delivered"""
+
+    def __init__(self, failed: Set[int], message: str):
+        super().__init__(message)
+        self.failed = failed
+
+
+class AlertSink(ABC):
+    """Abstract alert sink"""
+
+    type_name = "sink"
+
+    def __init__(self, config: Optional[dict] = None):
+        config = config or {}
+        self.name = config.get("name", self.type_name)
+        self.batch_size = config.get("batch_size", 1)
+        self.concurrency = config.get("concurrency", 1)
+        self.timeout = config.get("timeout", 10)
+        # Deliver everything in one batch when the scan ends (digests)
+        self.at_drain = False
+
+    @abstractmethod
+    def send(self, alerts: List[Alert]):
+        """
+        Deliver a batch
+
+        Raise to fail the whole batch, PartialDelivery to fail some of it.
+        """
+        pass
+
+
+class SlackSink(AlertSink):
+    type_name = "slack"
+
+    def __init__(self, config: Optional[dict] = None, alerter: Optional[SlackAlerter] = None):
+        config = config or {}
+        super().__init__(config)
+        self.alerter = alerter or SlackAlerter(
+            config.get("webhook_url"),
+            max_retries=config.get("max_retries", 3),
+            max_retry_wait=config.get("max_retry_wait", 60),
+            timeout=self.timeout,
+        )
+        self.digest = config.get("mode", "single") == "digest"
+        self.concurrency = config.get("concurrency", 4)
+        self.at_drain = self.digest
+
+    def send(self, alerts: List[Alert]):
+        if not self.digest:
+            for job, result, duplicates in alerts:
+                self.alerter.send_alert(job, result, duplicates)
+            return
+
+        report = self.alerter.send_digest(
+            [(job, result) for job, result, _ in alerts],
+            {job.get_db_key(): duplicates for job, _, duplicates in alerts},
+        )
+        if report.deferred:
+            deferred = {id(job) for job in report.deferred}
+            failed = {i for i, (job, _, _) in enumerate(alerts) if id(job) in deferred}
+            raise PartialDelivery(failed, "; ".join(report.errors) or "deferred")
+
+
+class WebhookSink(AlertSink):
+    """POST {"alerts": [...]} as JSON"""
+
+    type_name = "webhook"
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.url = config["url"]
+        self.headers = config.get("headers", {})
+
+    def send(self, alerts: List[Alert]):
+        payload = {"alerts": [_alert_dict(job, result, duplicates) for job, result, duplicates in alerts]}
+        resp = requests.post(self.url, json=payload, headers=self.headers, timeout=self.timeout)
+        resp.raise_for_status()
+
+
+class JsonlSink(AlertSink):
+    """Append one JSON object per alert to a file"""
+
+    type_name = "jsonl"
+
+    def __init__(self, config: dict):
+        config = {"batch_size": 100, **config}
+        super().__init__(config)
+        self.path = Path(config.get("path", "out/alerts.jsonl"))
+        self._lock = threading.Lock()
+
+    def send(self, alerts: List[Alert]):
+        lines = "".join(
+            json.dumps(_alert_dict(job, result, duplicates), sort_keys=True) + "\n"
+            for job, result, duplicates in alerts
+        )
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(lines)
+
+
+class EmailSink(AlertSink):
+    """One plain-text email per batch through an SMTP relay"""
+
+    type_name = "email"
+
+    def __init__(self, config: dict):
+        config = {"batch_size": 50, **config}
+        super().__init__(config)
+        self.host = config.get("host", "localhost")
+        self.port = config.get("port", 25)
+        self.sender = config.get("from", "jobhunt@localhost")
+        self.recipients = config["to"]
+        self.username = config.get("username")
+        self.password = config.get("password")
+        self.starttls = config.get("starttls", False)
+
+    def send(self, alerts: List[Alert]):
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = ", ".join(self.recipients)
+        message["Subject"] = f"🎯 {len(alerts)} new job match{'es' if len(alerts) != 1 else ''}"
+
+        blocks = []
+        for job, result, duplicates in sorted(alerts, key=lambda a: a[1].score, reverse=True):
+            lines = [
+                f"{job.title} - {job.company} ({job.source})",
+                f"  Location: {job.location}",
+                f"  Score: {result.score}",
+                f"  {job.url}",
+            ]
+            lines.extend(f"  Also on {d['source']}: {d['url']}" for d in duplicates)
+            blocks.append("\n".join(lines))
+        message.set_content("\n\n".join(blocks) + "\n")
+
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+            smtp.send_message(message)
+
+
+SINK_TYPES = {
+    "slack": SlackSink,
+    "webhook": WebhookSink,
+    "jsonl": JsonlSink,
+    "email": EmailSink,
+}
+
+
+def build_sinks(alerts_config: dict, slack_webhook: Optional[str] = None) -> List[AlertSink]:
+    """
+    Create sinks from `alerts.sinks`
+
+    Without a sinks list, Slack is the only sink (if a webhook is set).
+    Slack sinks inherit mode/retry settings from the alerts section.
+    """
+    specs = alerts_config.get("sinks")
+    if specs is None:
+        specs = [{"type": "slack"}] if slack_webhook else []
+
+    sinks = []
+    for spec in specs:
+        sink_class = SINK_TYPES.get(spec.get("type"))
+        if not sink_class:
+            print(f"  ⚠️  Unknown alert sink: {spec.get('type')}")
+            continue
+
+        if sink_class is SlackSink:
+            spec = {
+                "mode": alerts_config.get("mode", "single"),
+                "max_retries": alerts_config.get("max_retries", 3),
+                "max_retry_wait": alerts_config.get("max_retry_wait", 60),
+                "concurrency": alerts_config.get("concurrency", 4),
+                "webhook_url": slack_webhook,
+                **spec,
+            }
+            if not spec.get("webhook_url"):
+                print("  ⚠️  Slack sink configured without a webhook - skipped")
+                continue
+
+        sinks.append(sink_class(spec))
+
+    names = [sink.name for sink in sinks]
+    duplicated = {name for name in names if names.count(name) > 1}
+    if duplicated:
+        raise ValueError(f"Alert sink names must be unique (set \"name\"): {', '.join(sorted(duplicated))}")
+
+    return sinks
+
+
+def _alert_dict(job: Job, result, duplicates: List[Dict]) -> Dict:
+    return {
+        "db_key": job.get_db_key(),
+        "source": job.source,
+        "company": job.company,
+        "job_id": job.job_id,
+        "title": job.title,
+        "location": job.location,
+        "url": job.url,
+        "updated_at": job.updated_at,
+        "score": result.score,
+        "keyword_matches": result.keyword_matches,
+        "duplicates": duplicates,
+    }
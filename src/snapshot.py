@@ -0,0 +1,95 @@
+"""
+Compact state snapshots
+
+`jobhunt.py compact` packs the state DB, the source-health DB and the scan
+cursor into one tar.gz that CI caches instead of the raw `.state/`
+directory (WAL files, shard leftovers and free pages included). The
+archive is deterministic: the DBs are VACUUM INTO copies, members are
+written in a fixed order with zeroed timestamps and owners, and the gzip
+header carries no name or mtime - the same state always gives the same
+bytes. `jobhunt.py restore` unpacks it back into place.
+"""
+import gzip
+import io
+import os
+import sqlite3
+import tarfile
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+# Member name -> whether it is a SQLite DB (copied with VACUUM INTO)
+MEMBERS = {
+    "state.sqlite": True,
+    "source_health.sqlite": True,
+    "scan_cursor.json": False,
+}
+
+
+def write_snapshot(files: Dict[str, str], output: str, level: int = 9) -> Dict[str, int]:
+    """
+    Write the snapshot of `files` (member name -> path; missing files are skipped)
+
+    Returns the uncompressed size of each member written.
+    """
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    sizes = {}
+    with tempfile.TemporaryDirectory(prefix="jobhunt-snapshot-", dir=str(output_path.parent)) as tmp:
+        partial = Path(tmp) / "snapshot.tar.gz"
+        with open(partial, "wb") as raw, \
+                gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=level, mtime=0) as gz, \
+                tarfile.open(fileobj=gz, mode="w", format=tarfile.USTAR_FORMAT) as tar:
+            for name, is_db in MEMBERS.items():
+                path = files.get(name)
+                if not path or not Path(path).exists():
+                    continue
+                if is_db:
+                    copy = Path(tmp) / name
+                    conn = sqlite3.connect(path, timeout=30)
+                    conn.execute("VACUUM INTO ?", (str(copy),))
+                    conn.close()
+                    # Every VACUUM bumps the schema cookie; pin it so only content changes the bytes.
+                    # Safe on a private copy nobody else has open.
+                    conn = sqlite3.connect(str(copy))
+                    conn.execute("PRAGMA schema_version = 1")
+                    conn.close()
+                    data = copy.read_bytes()
+                    copy.unlink()
+                else:
+                    data = Path(path).read_bytes()
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mode = 0o644
+                info.mtime = 0
+                tar.addfile(info, io.BytesIO(data))
+                sizes[name] = len(data)
+        os.replace(partial, output_path)
+    return sizes
+
+
+def restore_snapshot(snapshot: str, files: Dict[str, str]) -> List[str]:
+    """
+    Unpack a snapshot over `files` (member name -> path)
+
+    Stale -wal/-shm files of a replaced DB are removed first - SQLite would
+    otherwise replay them over the restored copy. Returns the member names
+    restored.
+    """
+    restored = []
+    with tarfile.open(snapshot, mode="r:gz") as tar:
+        for member in tar.getmembers():
+            target = files.get(member.name)
+            if not target or not member.isfile():
+                continue
+            target_path = Path(target)
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            partial = target_path.with_name(target_path.name + ".restore")
+            with tar.extractfile(member) as src, open(partial, "wb") as dst:
+                dst.write(src.read())
+            if MEMBERS.get(member.name):
+                for suffix in ("-wal", "-shm"):
+                    Path(str(target_path) + suffix).unlink(missing_ok=True)
+            os.replace(partial, target_path)
+            restored.append(member.name)
+    return restored
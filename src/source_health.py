@@ -11,6 +11,9 @@ from typing import Optional, Dict
 from datetime import datetime, timedelta
 
 
+DEFAULT_DB_PATH = ".state/source_health.db"
+
+
 class SourceHealth:
     """Track source health status"""
 
@@ -19,7 +22,7 @@ class SourceHealth:
     TEMP_FAIL = "TEMP_FAIL"
     PERM_FAIL = "PERM_FAIL"
 
-    def __init__(self, db_path: str = ".state/source_health.db"):
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
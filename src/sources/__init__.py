@@ -1,25 +1,51 @@
-"""Source plugins"""
-from .greenhouse import GreenhouseSource
-from .lever import LeverSource
-from .ashby import AshbySource
-from .remotive import RemotiveSource
-from .weworkremotely import WeWorkRemotelySource
-from .adzuna import AdzunaSource
-from .remoteok import RemoteOKSource
-from .recruitee import RecruiteeSource
-from .workable import WorkableSource
-
-SOURCE_REGISTRY = {
-    "greenhouse": GreenhouseSource,
-    "lever": LeverSource,
-    "ashby": AshbySource,
-    "remotive": RemotiveSource,
-    "weworkremotely": WeWorkRemotelySource,
-    "adzuna": AdzunaSource,
-    "remoteok": RemoteOKSource,
-    "recruitee": RecruiteeSource,
-    "workable": WorkableSource,
+"""
+Source plugins
+
+Plugins are registered by name and imported on first lookup, so commands
+that never fetch don't load requests, BeautifulSoup and every plugin.
+"""
+import importlib
+import threading
+from collections.abc import Mapping
+
+# name -> (module, class)
+_PLUGINS = {
+    "greenhouse": (".greenhouse", "GreenhouseSource"),
+    "lever": (".lever", "LeverSource"),
+    "ashby": (".ashby", "AshbySource"),
+    "remotive": (".remotive", "RemotiveSource"),
+    "weworkremotely": (".weworkremotely", "WeWorkRemotelySource"),
+    "adzuna": (".adzuna", "AdzunaSource"),
+    "remoteok": (".remoteok", "RemoteOKSource"),
+    "recruitee": (".recruitee", "RecruiteeSource"),
+    "workable": (".workable", "WorkableSource"),
 }
 
-__all__ = ['SOURCE_REGISTRY']
 
+class _LazyRegistry(Mapping):
+    """Read-only name -> plugin class mapping that imports on first use"""
+
+    def __init__(self, plugins):
+        self._plugins = plugins
+        self._loaded = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name):
+        source_class = self._loaded.get(name)
+        if source_class is None:
+            module_name, class_name = self._plugins[name]
+            with self._lock:
+                module = importlib.import_module(module_name, __name__)
+                source_class = self._loaded[name] = getattr(module, class_name)
+        return source_class
+
+    def __iter__(self):
+        return iter(self._plugins)
+
+    def __len__(self):
+        return len(self._plugins)
+
+
+SOURCE_REGISTRY = _LazyRegistry(_PLUGINS)
+
+__all__ = ['SOURCE_REGISTRY']
@@ -8,7 +8,7 @@ import requests
 import os
 from typing import List, Optional
 from ..models import Job
-from .base import BaseSource
+from .base import BaseSource, DeadlineExceeded
 
 
 class AdzunaSource(BaseSource):
@@ -81,7 +81,7 @@ class AdzunaSource(BaseSource):
             }
 
             # Fetch with proper GET request
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self._http_get(url, params=params)
             response.raise_for_status()
 
             # Validate structure
@@ -92,13 +92,17 @@ class AdzunaSource(BaseSource):
 
             # Parse results
             for job_data in data.get('results', []):
+                location = job_data.get('location', {}).get('display_name', 'Netherlands')
+                if self._rejected_at_source(job_data.get('title', ''), location, job_data.get('id')):
+                    continue
+
                 # Extract fields
                 job = Job(
                     source="adzuna",
                     company=job_data.get('company', {}).get('display_name', 'Unknown'),
                     job_id=str(job_data.get('id', '')),
                     title=job_data.get('title', ''),
-                    location=job_data.get('location', {}).get('display_name', 'Netherlands'),
+                    location=location,
                     url=job_data.get('redirect_url', ''),
                     updated_at=job_data.get('created', ''),
                     content_text=job_data.get('description', '')
@@ -108,6 +112,8 @@ class AdzunaSource(BaseSource):
 
             return jobs
 
+        except DeadlineExceeded:
+            raise
         except requests.RequestException as e:
             raise Exception(f"Adzuna API error: {e}")
         except Exception as e:
@@ -30,8 +30,8 @@ class AshbySource(BaseSource):
         url = self.build_url(job_board)
         resp = self._fetch_with_retry(url)
 
-        if resp.status_code != 200:
-            return []
+        # An error page is not an empty board - raise so no posting gets closed
+        resp.raise_for_status()
 
         data = resp.json()
         jobs_data = data.get("jobs", [])
@@ -42,9 +42,12 @@ class AshbySource(BaseSource):
         jobs = []
         for job_data in jobs_data:
             try:
+                if self._rejected_at_source(job_data.get("title"), job_data.get("location", "Unknown"), job_data.get("id")):
+                    continue
                 job = self._normalize_job(job_board, job_data)
                 jobs.append(job)
             except Exception:
+                self._skipped_unparsable(job_data)
                 continue
 
         return jobs
@@ -2,18 +2,101 @@
 Base source plugin
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
 import requests
+import threading
 import time
 from ..models import Job, SourceHealth
 
 
+# Rate limiting / overload answers: retried, then raised as requests.HTTPError.
+# A plugin would otherwise read them as an empty board.
+THROTTLE_STATUSES = {429, 500, 502, 503, 504}
+# Longest Retry-After honoured between attempts (seconds)
+MAX_RETRY_AFTER = 30
+
+# Idle sessions, reused across fetch threads and scans so keep-alive
+# connections (and TLS sessions) to the ATS APIs stay warm
+_session_pool: List[requests.Session] = []
+_session_lock = threading.Lock()
+
+
+@contextmanager
+def pooled_session():
+    """Borrow a requests.Session - each one is used by one thread at a time"""
+    with _session_lock:
+        session = _session_pool.pop() if _session_pool else requests.Session()
+    try:
+        yield session
+    finally:
+        with _session_lock:
+            _session_pool.append(session)
+
+
+class DeadlineExceeded(requests.Timeout):
+    """The scan budget ran out before this source finished"""
+
+
+def feed_timestamp(value) -> Optional[str]:
+    """ISO 8601 / RFC 822 date or unix epoch -> comparable UTC 'YYYY-MM-DDTHH:MM:SS'"""
+    if value in (None, ""):
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            parsed = datetime.fromtimestamp(value, timezone.utc)
+        elif value[:4].isdigit():
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        else:
+            parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.isoformat(timespec="seconds")
+
+
+def _retry_after(resp: requests.Response) -> float:
+    """Seconds asked for by a Retry-After header (0 if absent or unparsable)"""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return 0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0
+
+
 class BaseSource(ABC):
     """Abstract ATS source plugin"""
 
+    # Newest-first feeds that can stop at a high-water mark
+    incremental = False
+
     def __init__(self, timeout: int = 30, max_retries: int = 2):
         self.timeout = timeout
         self.max_retries = max_retries
+        self.bytes_fetched = 0
+        # THROTTLE_STATUSES answers seen, retried ones included
+        self.throttled = 0
+        self.profiler = None
+        # time.monotonic() cut-off set by budgeted scans
+        self.deadline: Optional[float] = None
+        # Incremental feeds: skip items older than `since` (feed_timestamp)
+        self.since: Optional[str] = None
+        self.newest_seen: Optional[str] = None
+        self.partial = False
+        # filtering.PreFilter pushed down by the scanner; drop reason -> count
+        self.pre_filter = None
+        self.rejected: Dict[str, int] = {}
+        # IDs of the postings it dropped - still listed, so not closed
+        self.rejected_ids: List[str] = []
 
     @abstractmethod
     def get_source_name(self) -> str:
@@ -31,6 +114,15 @@ class BaseSource(ABC):
     def _validate_response_structure(self, response: requests.Response):
         pass
 
+    def feed_key(self, identifier: str) -> str:
+        """
+        What fetch_jobs(identifier) downloads and parses
+
+        Identifiers with the same key share one fetch per scan. Sources whose
+        result does not depend on the identifier beyond the URL override this.
+        """
+        return identifier
+
     def validate_source(self, identifier: str) -> SourceHealth:
         """Validate source is accessible"""
         try:
@@ -45,26 +137,102 @@ class BaseSource(ABC):
 
         except requests.Timeout:
             return SourceHealth.TEMP_FAIL
+        except requests.HTTPError:
+            return SourceHealth.TEMP_FAIL
         except requests.ConnectionError:
             return SourceHealth.TEMP_FAIL
         except Exception:
             return SourceHealth.PERM_FAIL
 
     def _fetch_with_retry(self, url: str) -> requests.Response:
-        """Fetch with exponential backoff"""
+        """Fetch with exponential backoff (or the server's Retry-After)"""
         last_exc = None
 
         for attempt in range(self.max_retries + 1):
+            wait = 2 ** attempt
             try:
-                resp = requests.get(url, timeout=self.timeout)
-                return resp
+                resp = self._http_get(url)
+                if resp.status_code not in THROTTLE_STATUSES:
+                    return resp
+                self.throttled += 1
+                last_exc = requests.HTTPError(f"HTTP {resp.status_code} from {url}", response=resp)
+                wait = max(wait, min(_retry_after(resp), MAX_RETRY_AFTER))
+            except DeadlineExceeded:
+                raise
             except (requests.Timeout, requests.ConnectionError) as e:
                 last_exc = e
-                if attempt < self.max_retries:
-                    time.sleep(2 ** attempt)
-                continue
+            if attempt < self.max_retries:
+                # Don't sleep past the deadline just to fail afterwards
+                if self.deadline is not None and time.monotonic() + wait >= self.deadline:
+                    raise DeadlineExceeded(f"Scan budget exhausted while retrying {url}") from last_exc
+                time.sleep(wait)
 
         if last_exc:
             raise last_exc
         raise requests.RequestException(f"Failed after {self.max_retries} retries")
 
+    def _http_get(self, url: str, **kwargs) -> requests.Response:
+        """Single GET request, counting downloaded bytes"""
+        kwargs.setdefault("timeout", self.timeout)
+        clamped = False
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceeded(f"Scan budget exhausted before {url}")
+            clamped = remaining < kwargs["timeout"]
+            kwargs["timeout"] = min(kwargs["timeout"], remaining)
+        with self._span("fetch"), pooled_session() as session:
+            try:
+                resp = session.get(url, **kwargs)
+            except requests.Timeout as e:
+                # Cut short by the budget, not the board's fault
+                if clamped or (self.deadline is not None and time.monotonic() >= self.deadline):
+                    raise DeadlineExceeded(f"Scan budget exhausted during {url}") from e
+                raise
+        self.bytes_fetched += len(resp.content)
+        return resp
+
+    def _reached_mark(self, stamp: Optional[str]) -> bool:
+        """
+        Track the newest item of a newest-first feed
+
+        True once an item is older than the high-water mark - everything
+        after it was processed by an earlier scan, so parsing can stop.
+        """
+        if stamp is None:
+            return False
+        if self.newest_seen is None or stamp > self.newest_seen:
+            self.newest_seen = stamp
+        if self.since is not None and stamp < self.since:
+            self.partial = True
+            return True
+        return False
+
+    def _rejected_at_source(self, title, location, job_id=None) -> bool:
+        """
+        Run the pushed-down pre-filter on raw title/location fields
+
+        Call before normalizing a posting - it must see the same title and
+        location strings the Job would get, and `job_id` the Job's job_id.
+        """
+        if self.pre_filter is None:
+            return False
+        reason = self.pre_filter.check(title or "", location or "")
+        if reason is None:
+            return False
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        if job_id not in (None, ""):
+            self.rejected_ids.append(str(job_id))
+        return True
+
+    def _skipped_unparsable(self, job_data):
+        """Keep a posting that failed to normalize open - it is still listed"""
+        job_id = job_data.get("id") if isinstance(job_data, dict) else None
+        if job_id not in (None, ""):
+            self.rejected_ids.append(str(job_id))
+
+    def _span(self, stage: str):
+        """Profiler span for this source (no-op without a profiler)"""
+        if self.profiler:
+            return self.profiler.span(stage, source=self.get_source_name())
+        return nullcontext()
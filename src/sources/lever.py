@@ -28,8 +28,8 @@ class LeverSource(BaseSource):
         url = self.build_url(account)
         resp = self._fetch_with_retry(url)
 
-        if resp.status_code != 200:
-            return []
+        # An error page is not an empty board - raise so no posting gets closed
+        resp.raise_for_status()
 
         jobs_data = resp.json()
 
@@ -39,9 +39,14 @@ class LeverSource(BaseSource):
         jobs = []
         for job_data in jobs_data:
             try:
+                if self._rejected_at_source(
+                    job_data.get("text"), job_data.get("categories", {}).get("location", "Unknown"), job_data.get("id")
+                ):
+                    continue
                 job = self._normalize_job(account, job_data)
                 jobs.append(job)
             except Exception:
+                self._skipped_unparsable(job_data)
                 continue
 
         return jobs
@@ -8,12 +8,14 @@ Very popular in NL/EU startups
 import requests
 from typing import List, Optional
 from ..models import Job
-from .base import BaseSource
+from .base import BaseSource, DeadlineExceeded
 
 
 class RecruiteeSource(BaseSource):
     """Recruitee careers API"""
 
+    BASE_URL = "https://{identifier}.recruitee.com"
+
     def get_source_name(self) -> str:
         """Return source name"""
         return "recruitee"
@@ -24,7 +26,7 @@ class RecruiteeSource(BaseSource):
 
         identifier is the subdomain (e.g., 'payter' for payter.recruitee.com)
         """
-        return f"https://{identifier}.recruitee.com/api/offers"
+        return f"{self.BASE_URL.format(identifier=identifier)}/api/offers"
 
     def _validate_response_structure(self, response: requests.Response):
         """Validate response has expected structure"""
@@ -73,11 +75,14 @@ class RecruiteeSource(BaseSource):
                     location_parts.append(offer['country'])
                 location = ', '.join(location_parts) if location_parts else 'Remote'
 
+                if self._rejected_at_source(offer.get('title', ''), location, offer.get('id')):
+                    continue
+
                 # Get careers URL
                 careers_url = offer.get('careers_url', '')
                 if not careers_url:
                     # Fallback to constructed URL
-                    careers_url = f"https://{identifier}.recruitee.com/o/{offer.get('slug', '')}"
+                    careers_url = f"{self.BASE_URL.format(identifier=identifier)}/o/{offer.get('slug', '')}"
 
                 # Create Job object
                 job = Job(
@@ -95,6 +100,8 @@ class RecruiteeSource(BaseSource):
 
             return jobs
 
+        except DeadlineExceeded:
+            raise
         except requests.RequestException as e:
             raise Exception(f"Recruitee API error: {e}")
         except Exception as e:
@@ -8,12 +8,14 @@ import requests
 from typing import List, Optional
 from datetime import datetime
 from ..models import Job
-from .base import BaseSource
+from .base import BaseSource, DeadlineExceeded, feed_timestamp
 
 
 class RemoteOKSource(BaseSource):
     """RemoteOK remote jobs JSON feed"""
 
+    incremental = True
+
     JSON_URL = "https://remoteok.com/api"
 
     def get_source_name(self) -> str:
@@ -24,6 +26,10 @@ class RemoteOKSource(BaseSource):
         """Build API URL (identifier not used, always returns main feed)"""
         return self.JSON_URL
 
+    def feed_key(self, identifier: str) -> str:
+        """One feed for every identifier"""
+        return self.build_url(identifier)
+
     def _validate_response_structure(self, response: requests.Response):
         """Validate response is a list"""
         data = response.json()
@@ -50,7 +56,7 @@ class RemoteOKSource(BaseSource):
                 'User-Agent': 'Mozilla/5.0 (compatible; JobScanner/1.0)'
             }
 
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self._http_get(url, headers=headers)
             response.raise_for_status()
 
             # Validate structure
@@ -75,6 +81,16 @@ class RemoteOKSource(BaseSource):
                 if not job_data.get('slug'):
                     continue
 
+                # Newest first - the rest was handled by earlier scans
+                if self._reached_mark(feed_timestamp(job_data.get('epoch') or job_data.get('date'))):
+                    break
+
+                if self._rejected_at_source(
+                    job_data.get('position', ''), job_data.get('location', 'Remote'),
+                    job_data.get('id', job_data.get('slug', ''))
+                ):
+                    continue
+
                 # Create Job object
                 job = Job(
                     source="remoteok",
@@ -91,6 +107,8 @@ class RemoteOKSource(BaseSource):
 
             return jobs
 
+        except DeadlineExceeded:
+            raise
         except requests.RequestException as e:
             raise Exception(f"RemoteOK API error: {e}")
         except Exception as e:
@@ -7,12 +7,14 @@ Public API, no auth required
 import requests
 from typing import List
 from ..models import Job
-from .base import BaseSource
+from .base import BaseSource, DeadlineExceeded, feed_timestamp
 
 
 class RemotiveSource(BaseSource):
     """Remotive job board API"""
 
+    incremental = True
+
     BASE_URL = "https://remotive.com/api/remote-jobs"
 
     def get_source_name(self) -> str:
@@ -62,6 +64,15 @@ class RemotiveSource(BaseSource):
                 if not job_data.get('publication_date'):
                     continue
 
+                # Newest first - the rest was handled by earlier scans
+                if self._reached_mark(feed_timestamp(job_data['publication_date'])):
+                    break
+
+                if self._rejected_at_source(
+                    job_data.get('title', ''), job_data.get('candidate_required_location', 'Remote'), job_data.get('id')
+                ):
+                    continue
+
                 # Create Job object
                 job = Job(
                     source="remotive",
@@ -78,6 +89,8 @@ class RemotiveSource(BaseSource):
 
             return jobs
 
+        except DeadlineExceeded:
+            raise
         except requests.RequestException as e:
             raise Exception(f"Remotive API error: {e}")
         except Exception as e:
@@ -4,16 +4,19 @@ WeWorkRemotely RSS source
 Fetches jobs from WeWorkRemotely RSS feed
 Public feed, no auth required
 """
+import io
 import requests
 import xml.etree.ElementTree as ET
 from typing import List
 from ..models import Job
-from .base import BaseSource
+from .base import BaseSource, DeadlineExceeded, feed_timestamp
 
 
 class WeWorkRemotelySource(BaseSource):
     """WeWorkRemotely RSS feed"""
 
+    incremental = True
+
     # RSS URLs by category
     RSS_URLS = {
         "programming": "https://weworkremotely.com/categories/remote-programming-jobs.rss",
@@ -29,6 +32,10 @@ class WeWorkRemotelySource(BaseSource):
         """Build RSS URL"""
         return self.RSS_URLS.get(identifier, self.RSS_URLS["programming"])
 
+    def feed_key(self, identifier: str) -> str:
+        """Unknown categories share the programming feed"""
+        return self.build_url(identifier)
+
     def _validate_response_structure(self, response: requests.Response):
         """Validate RSS feed structure"""
         try:
@@ -56,27 +63,36 @@ class WeWorkRemotelySource(BaseSource):
             response = self._fetch_with_retry(url)
             response.raise_for_status()
 
-            # Validate structure
-            self._validate_response_structure(response)
-
-            # Parse XML
-            root = ET.fromstring(response.content)
+            # Stream the items so parsing stops at the high-water mark
             jobs = []
+            events = ET.iterparse(io.BytesIO(response.content), events=("start", "end"))
+            _, root = next(events)
+            # Check it's an RSS feed
+            if root.tag not in ['rss', '{http://www.w3.org/2005/Atom}feed']:
+                raise ValueError(f"Not a valid RSS/Atom feed (root tag: {root.tag})")
+
+            for event, item in events:
+                if event != "end" or item.tag != "item":
+                    continue
 
-            # Parse items (handle both RSS and Atom)
-            for item in root.findall('.//item'):
                 title_elem = item.find('title')
                 link_elem = item.find('link')
                 description_elem = item.find('description')
                 pubdate_elem = item.find('pubDate')
 
                 if title_elem is None or link_elem is None:
+                    item.clear()
                     continue
 
                 title = title_elem.text or ''
                 link = link_elem.text or ''
                 description = description_elem.text or '' if description_elem is not None else ''
                 pubdate = pubdate_elem.text or '' if pubdate_elem is not None else ''
+                item.clear()
+
+                # Newest first - the rest was handled by earlier scans
+                if self._reached_mark(feed_timestamp(pubdate)):
+                    break
 
                 # Extract company from title (format: "Company: Job Title")
                 company = "Unknown"
@@ -88,6 +104,9 @@ class WeWorkRemotelySource(BaseSource):
                 # Generate job ID from URL
                 job_id = link.split('/')[-1] if '/' in link else link
 
+                if self._rejected_at_source(title, "Remote", job_id):
+                    continue
+
                 # Create Job object
                 job = Job(
                     source="weworkremotely",
@@ -104,6 +123,8 @@ class WeWorkRemotelySource(BaseSource):
 
             return jobs
 
+        except DeadlineExceeded:
+            raise
         except requests.RequestException as e:
             raise Exception(f"WWR RSS error: {e}")
         except ET.ParseError as e:
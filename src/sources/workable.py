@@ -8,12 +8,14 @@ Popular globally, some EU presence
 import requests
 from typing import List, Optional
 from ..models import Job
-from .base import BaseSource
+from .base import BaseSource, DeadlineExceeded
 
 
 class WorkableSource(BaseSource):
     """Workable careers widget API"""
 
+    BASE_URL = "https://apply.workable.com/api/v1/widget/accounts"
+
     def get_source_name(self) -> str:
         """Return source name"""
         return "workable"
@@ -24,7 +26,7 @@ class WorkableSource(BaseSource):
 
         identifier is the account name (e.g., 'inventyou-ab')
         """
-        return f"https://apply.workable.com/api/v1/widget/accounts/{identifier}"
+        return f"{self.BASE_URL}/{identifier}"
 
     def _validate_response_structure(self, response: requests.Response):
         """Validate response has expected structure"""
@@ -64,6 +66,9 @@ class WorkableSource(BaseSource):
                 if job_data.get('country'):
                     location = f"{location}, {job_data['country']}"
 
+                if self._rejected_at_source(job_data.get('title', ''), location, job_data.get('shortcode')):
+                    continue
+
                 # Create Job object
                 job = Job(
                     source="workable",
@@ -80,6 +85,8 @@ class WorkableSource(BaseSource):
 
             return jobs
 
+        except DeadlineExceeded:
+            raise
         except requests.RequestException as e:
             raise Exception(f"Workable API error: {e}")
         except Exception as e:
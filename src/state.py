@@ -3,8 +3,10 @@ SQLite state management
 """
 import sqlite3
 import json
-from typing import Optional, Dict, List, Tuple
-from datetime import datetime
+import time
+import zlib
+from typing import Optional, Dict, List, Set, Tuple
+from datetime import datetime, timedelta
 from pathlib import Path
 from .models import Job, SourceHealth, SourceHealthRecord
 
@@ -15,16 +17,20 @@ class StateManager:
     def __init__(self, db_path: str):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30)
         self.conn.row_factory = sqlite3.Row
+        # WAL lets the outbox worker's connection write while scans run
+        self.conn.execute("PRAGMA journal_mode=WAL")
         self._init_schema()
 
     def _init_schema(self):
         cursor = self.conn.cursor()
 
+        # id is the search index's rowid - declared, so VACUUM keeps it
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS jobs (
-                db_key TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                db_key TEXT NOT NULL UNIQUE,
                 source TEXT NOT NULL,
                 company TEXT NOT NULL,
                 job_id TEXT NOT NULL,
@@ -51,41 +57,829 @@ class StateManager:
             )
         """)
 
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_fingerprints (
+                db_key TEXT PRIMARY KEY,
+                cluster_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                url TEXT NOT NULL,
+                identity TEXT NOT NULL,
+                title_norm TEXT NOT NULL,
+                simhash TEXT NOT NULL,
+                head_simhash TEXT NOT NULL,
+                words INTEGER NOT NULL,
+                first_seen TEXT NOT NULL
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS fingerprint_bands (
+                band TEXT NOT NULL,
+                db_key TEXT NOT NULL,
+                PRIMARY KEY (band, db_key)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS alert_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                db_key TEXT NOT NULL,
+                sink TEXT NOT NULL DEFAULT 'slack',
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at TEXT NOT NULL,
+                last_error TEXT,
+                created_at TEXT NOT NULL,
+                sent_at TEXT
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS board_jobs (
+                source TEXT NOT NULL,
+                board TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                PRIMARY KEY (source, board, job_id)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS board_schedule (
+                source TEXT NOT NULL,
+                board TEXT NOT NULL,
+                churn_ema REAL NOT NULL,
+                interval_hours REAL NOT NULL,
+                last_fetch TEXT NOT NULL,
+                next_due TEXT NOT NULL,
+                fetches INTEGER NOT NULL,
+                last_changes INTEGER NOT NULL,
+                PRIMARY KEY (source, board)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS board_stats (
+                source TEXT NOT NULL,
+                board TEXT NOT NULL,
+                fetch_seconds REAL NOT NULL,
+                matches REAL NOT NULL,
+                fetches INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                response_bytes REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (source, board)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS feed_marks (
+                source TEXT NOT NULL,
+                feed TEXT NOT NULL,
+                mark TEXT NOT NULL,
+                full_pass_at TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (source, feed)
+            )
+        """)
+
+        # One row per scan, with its stage timings and per-board fetches
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scan_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                started_at TEXT NOT NULL,
+                finished_at TEXT NOT NULL,
+                duration_seconds REAL NOT NULL,
+                dry_run INTEGER NOT NULL,
+                sources_scanned INTEGER NOT NULL,
+                jobs_fetched INTEGER NOT NULL,
+                jobs_passed INTEGER NOT NULL,
+                jobs_new INTEGER NOT NULL,
+                jobs_updated INTEGER NOT NULL,
+                alerts_sent INTEGER NOT NULL,
+                errors INTEGER NOT NULL,
+                peak_rss_mb REAL NOT NULL,
+                stats TEXT NOT NULL
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scan_run_stages (
+                run_id INTEGER NOT NULL,
+                stage TEXT NOT NULL,
+                calls INTEGER NOT NULL,
+                seconds REAL NOT NULL,
+                PRIMARY KEY (run_id, stage)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scan_run_sources (
+                run_id INTEGER NOT NULL,
+                source TEXT NOT NULL,
+                board TEXT NOT NULL,
+                latency REAL NOT NULL,
+                bytes INTEGER NOT NULL,
+                jobs INTEGER NOT NULL,
+                matches INTEGER NOT NULL,
+                error TEXT,
+                PRIMARY KEY (run_id, source, board)
+            )
+        """)
+
+        # Closed/reopened transitions found by record_board_jobs, for alerts and reports
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                board TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                db_key TEXT,
+                event TEXT NOT NULL,
+                at TEXT NOT NULL
+            )
+        """)
+
+        # Boards fetched by a scan that has not finished yet, with their jobs (scan --resume)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scan_checkpoints (
+                source TEXT NOT NULL,
+                board TEXT NOT NULL,
+                saved_at TEXT NOT NULL,
+                jobs INTEGER NOT NULL,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (source, board)
+            )
+        """)
+
+        # Full-text index of saved jobs (rowid = jobs.id), kept up to date by save_job
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, company, location, description,
+                tokenize = 'porter unicode61 remove_diacritics 2'
+            )
+        """)
+
+        # Columns added after a table shipped
+        self._add_column_if_missing("alert_outbox", "sink", "TEXT NOT NULL DEFAULT 'slack'")
+        self._add_column_if_missing("board_stats", "response_bytes", "REAL NOT NULL DEFAULT 0")
+        # NULL for jobs saved before the search index existed
+        self._add_column_if_missing("jobs", "score", "INTEGER")
+        # Set when a job drops off its board, cleared if it comes back
+        self._add_column_if_missing("jobs", "closed_at", "TEXT")
+        self._add_column_if_missing("board_jobs", "db_key", "TEXT")
+        self._add_column_if_missing("board_jobs", "closed_at", "TEXT")
+        self._add_jobs_id()
+
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs(first_seen)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_health_status ON source_health(status)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_runs_started ON scan_runs(started_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_at ON job_events(at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_board_jobs_closed ON board_jobs(closed_at) WHERE closed_at IS NOT NULL")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_fp_cluster ON job_fingerprints(cluster_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_fp_identity ON job_fingerprints(identity)")
+        cursor.execute("DROP INDEX IF EXISTS idx_outbox_status")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_outbox_sink ON alert_outbox(sink, status, next_attempt_at)")
+
+        # One board's fetched job set, for record_board_jobs' set operations
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS fetched_jobs (
+                job_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                db_key TEXT NOT NULL
+            )
+        """)
+        # IDs the source-side pre-filter dropped: still listed, never returned
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS listed_jobs (job_id TEXT PRIMARY KEY)")
 
         self.conn.commit()
 
+    def _add_column_if_missing(self, table: str, column: str, definition: str):
+        columns = {row["name"] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    def _add_jobs_id(self):
+        """
+        Rebuild a jobs table that predates its id column
+
+        The search index joins on jobs.rowid, which VACUUM may renumber
+        unless it is a declared INTEGER PRIMARY KEY. Ids keep the old
+        rowids, so the index stays valid.
+        """
+        columns = self.conn.execute("PRAGMA table_info(jobs)").fetchall()
+        if any(column["name"] == "id" for column in columns):
+            return
+        definitions = ["id INTEGER PRIMARY KEY"]
+        for column in columns:
+            definition = f"{column['name']} {column['type']}"
+            if column["pk"]:
+                definition += " NOT NULL UNIQUE"
+            elif column["notnull"]:
+                definition += " NOT NULL"
+            if column["dflt_value"] is not None:
+                definition += f" DEFAULT {column['dflt_value']}"
+            definitions.append(definition)
+        names = ", ".join(column["name"] for column in columns)
+
+        self.conn.commit()
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.execute("ALTER TABLE jobs RENAME TO jobs_legacy")
+            self.conn.execute(f"CREATE TABLE jobs ({', '.join(definitions)})")
+            self.conn.execute(f"INSERT INTO jobs (id, {names}) SELECT rowid, {names} FROM jobs_legacy")
+            self.conn.execute("DROP TABLE jobs_legacy")
+
     def get_job_state(self, db_key: str) -> Optional[Dict]:
         cursor = self.conn.cursor()
         cursor.execute("SELECT * FROM jobs WHERE db_key = ?", (db_key,))
         row = cursor.fetchone()
         return dict(row) if row else None
 
-    def save_job(self, job: Job, is_new: bool = True):
+    def save_job(self, job: Job, is_new: bool = True, alert: Optional[Dict] = None, sinks: Optional[List[str]] = None,
+                 score: Optional[int] = None):
+        """
+        Upsert a job and its search index row
+
+        `alert` (outbox payload) is queued per sink in the same transaction.
+        """
         cursor = self.conn.cursor()
         now = datetime.utcnow().isoformat()
 
         if is_new:
             cursor.execute("""
                 INSERT INTO jobs (db_key, source, company, job_id, title, location, url, 
-                                updated_at, content_hash, first_seen, last_seen)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                                updated_at, content_hash, first_seen, last_seen, score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 job.get_db_key(), job.source, job.company, job.job_id, job.title,
                 job.location, job.url, job.updated_at, job.get_content_hash(),
-                now, now
+                now, now, score
             ))
+            self._index_job(cursor, cursor.lastrowid, job)
         else:
             cursor.execute("""
                 UPDATE jobs 
-                SET title = ?, location = ?, url = ?, updated_at = ?, content_hash = ?, last_seen = ?
+                SET title = ?, location = ?, url = ?, updated_at = ?, content_hash = ?, last_seen = ?,
+                    score = COALESCE(?, score)
                 WHERE db_key = ?
-            """, (job.title, job.location, job.url, job.updated_at, job.get_content_hash(), now, job.get_db_key()))
+            """, (job.title, job.location, job.url, job.updated_at, job.get_content_hash(), now, score, job.get_db_key()))
+            self._reindex_job(cursor, job)
+
+        if alert is not None:
+            payload = json.dumps(alert)
+            cursor.executemany("""
+                INSERT INTO alert_outbox (db_key, sink, payload, status, next_attempt_at, created_at)
+                VALUES (?, ?, ?, 'pending', ?, ?)
+            """, [(job.get_db_key(), sink, payload, now, now) for sink in (sinks or ["slack"])])
+
+        self.conn.commit()
+
+    def index_job(self, job: Job, score: int):
+        """Add an unchanged job saved before the search index existed"""
+        cursor = self.conn.cursor()
+        cursor.execute("UPDATE jobs SET score = ? WHERE db_key = ?", (score, job.get_db_key()))
+        self._reindex_job(cursor, job)
+        self.conn.commit()
+
+    def _reindex_job(self, cursor: sqlite3.Cursor, job: Job):
+        row = cursor.execute("SELECT id FROM jobs WHERE db_key = ?", (job.get_db_key(),)).fetchone()
+        if row:
+            cursor.execute("DELETE FROM jobs_fts WHERE rowid = ?", (row[0],))
+            self._index_job(cursor, row[0], job)
+
+    def _index_job(self, cursor: sqlite3.Cursor, rowid: int, job: Job):
+        cursor.execute(
+            "INSERT INTO jobs_fts (rowid, title, company, location, description) VALUES (?, ?, ?, ?, ?)",
+            (rowid, job.title, job.company, job.location, " ".join(job.content_text.split()))
+        )
+
+    def search_jobs(self, query: str, since: Optional[str] = None, sources: Optional[List[str]] = None,
+                    min_score: Optional[int] = None, order: str = "rank", limit: int = 20,
+                    max_candidates: int = 10000) -> Tuple[List[Dict], float]:
+        """
+        Full-text search over saved jobs
+
+        `query` is FTS5 syntax (terms are ANDed; OR, NOT, "phrases",
+        prefix* and column filters like location:emea work). A query that
+        is not valid syntax is retried with every word quoted. Unfiltered
+        relevance ranking looks at the newest `max_candidates` text matches
+        only, so a common term costs the same over years of history as over
+        a week; source/score filters and score order see every match. Returns
+        the rows (best first) and the query time in milliseconds.
+        """
+        started = time.perf_counter()
+        try:
+            rows = self._search(query, since, sources, min_score, order, limit, max_candidates)
+        except sqlite3.OperationalError:
+            quoted = " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+            try:
+                rows = self._search(quoted, since, sources, min_score, order, limit, max_candidates)
+            except sqlite3.OperationalError as e:
+                raise ValueError(f"Invalid search query {query!r}: {e}")
+        return rows, (time.perf_counter() - started) * 1000
+
+    def _search(self, query: str, since: Optional[str], sources: Optional[List[str]], min_score: Optional[int],
+                order: str, limit: int, max_candidates: int) -> List[Dict]:
+        # Job ids (the index's rowids) follow insertion order, so the date
+        # and candidate limits become a rowid range the FTS index can seek to
+        floor = 0
+        if since:
+            floor = self.conn.execute(
+                "SELECT MIN(id) FROM jobs INDEXED BY idx_jobs_first_seen WHERE first_seen >= ?", (since,)
+            ).fetchone()[0]
+            if floor is None:
+                return []
+        filters = []
+        filter_params: List = []
+        if since:
+            filters.append("j.first_seen >= ?")
+            filter_params.append(since)
+        if sources:
+            filters.append(f"j.source IN ({', '.join('?' * len(sources))})")
+            filter_params.extend(sources)
+        if min_score is not None:
+            filters.append("j.score >= ?")
+            filter_params.append(min_score)
+
+        # Only unfiltered relevance ranking is capped: the newest matches say
+        # nothing about which pass --source/--min-score or score highest
+        if order == "rank" and max_candidates and not sources and min_score is None:
+            oldest = self.conn.execute(
+                "SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ? AND rowid >= ? ORDER BY rowid DESC LIMIT 1 OFFSET ?",
+                (query, floor, max_candidates - 1)
+            ).fetchone()
+            if oldest:
+                floor = oldest[0]
+
+        where = ["jobs_fts MATCH ?", "jobs_fts.rowid >= ?", *filters]
+        params: List = [query, floor, *filter_params]
+        order_by = {"rank": "rank", "newest": "jobs_fts.rowid DESC", "score": "j.score DESC, rank"}[order]
+
+        # Title matches outrank company/location, which outrank the description
+        rows = self.conn.execute(f"""
+            SELECT j.*, jobs_fts.rowid AS fts_rowid, bm25(jobs_fts, 10.0, 4.0, 4.0, 1.0) AS rank
+            FROM jobs_fts JOIN jobs j ON j.id = jobs_fts.rowid
+            WHERE {' AND '.join(where)}
+            ORDER BY {order_by}
+            LIMIT ?
+        """, [*params, limit]).fetchall()
+
+        # Snippets for the rows shown only - each one re-reads a description
+        results = []
+        for row in rows:
+            result = dict(row)
+            result["snippet"] = self.conn.execute(
+                "SELECT snippet(jobs_fts, 3, '[', ']', '…', 12) FROM jobs_fts WHERE jobs_fts MATCH ? AND rowid = ?",
+                (query, row["fts_rowid"])
+            ).fetchone()[0]
+            results.append(result)
+        return results
+
+    def get_fingerprinted_keys(self) -> Set[str]:
+        cursor = self.conn.execute("SELECT db_key FROM job_fingerprints")
+        return {row["db_key"] for row in cursor}
+
+    def get_fingerprint_clusters(self, db_keys: List[str]) -> Dict[str, str]:
+        """Cluster ids of already fingerprinted jobs"""
+        clusters = {}
+        for chunk in _chunks(db_keys):
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self.conn.execute(
+                f"SELECT db_key, cluster_id FROM job_fingerprints WHERE db_key IN ({placeholders})",
+                chunk
+            )
+            clusters.update({row["db_key"]: row["cluster_id"] for row in cursor})
+        return clusters
+
+    def find_fingerprint_candidates(self, bands: List[str], identity: str) -> List[Dict]:
+        """Fingerprints sharing an LSH band or the exact company+title identity"""
+        placeholders = ",".join("?" * len(bands))
+        cursor = self.conn.execute(f"""
+            SELECT * FROM job_fingerprints
+            WHERE db_key IN (SELECT db_key FROM fingerprint_bands WHERE band IN ({placeholders}))
+               OR identity = ?
+            ORDER BY first_seen
+        """, (*bands, identity))
+        return [dict(row) for row in cursor]
+
+    def save_fingerprint(self, fingerprint, cluster_id: str, commit: bool = True):
+        now = datetime.utcnow().isoformat()
+        self.conn.execute("""
+            INSERT OR REPLACE INTO job_fingerprints
+                (db_key, cluster_id, source, url, identity, title_norm, simhash, head_simhash, words, first_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            fingerprint.db_key, cluster_id, fingerprint.source, fingerprint.url,
+            fingerprint.identity, fingerprint.title, f"{fingerprint.simhash:016x}",
+            f"{fingerprint.head_simhash:016x}", fingerprint.words, now
+        ))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO fingerprint_bands (band, db_key) VALUES (?, ?)",
+            [(band, fingerprint.db_key) for band in fingerprint.bands()]
+        )
+        if commit:
+            self.conn.commit()
+
+    def get_cluster_members(self, cluster_ids: List[str]) -> Dict[str, List[Dict]]:
+        """Members per cluster, flagged if the job is stored in `jobs`"""
+        members: Dict[str, List[Dict]] = {}
+        for chunk in _chunks(cluster_ids):
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self.conn.execute(f"""
+                SELECT f.cluster_id, f.db_key, f.source, f.url, j.db_key IS NOT NULL AS stored
+                FROM job_fingerprints f
+                LEFT JOIN jobs j ON j.db_key = f.db_key
+                WHERE f.cluster_id IN ({placeholders})
+                ORDER BY f.first_seen
+            """, chunk)
+            for row in cursor:
+                members.setdefault(row["cluster_id"], []).append(dict(row))
+        return members
+
+    def commit(self):
+        self.conn.commit()
+
+    def record_board_jobs(self, source: str, board: str, jobs: List[Job], partial: bool = False,
+                          rejected_ids: Optional[List[str]] = None) -> Dict:
+        """
+        Replace a board's job set with this fetch and report what changed
+
+        The fetched IDs are diffed against the stored set in SQL, a handful
+        of statements per board however many jobs it lists. Jobs missing
+        from the fetch are marked closed (board_jobs and jobs.closed_at),
+        closed jobs that come back are reopened, and both transitions are
+        logged to job_events. Everything still listed gets last_seen bumped.
+
+        A partial fetch (incremental feed) only adds and updates - jobs it
+        did not return are not treated as removed. `rejected_ids` are
+        postings the source-side pre-filter dropped: they are still listed,
+        so they are kept open (and reopened) without being stored or diffed.
+
+        Returns:
+            {"new", "updated", "removed", "reopened"} job counts
+        """
+        now = datetime.utcnow().isoformat()
+        key = {"source": source, "board": board, "now": now}
+
+        with self.conn:
+            self.conn.execute("DELETE FROM temp.fetched_jobs")
+            self.conn.execute("DELETE FROM temp.listed_jobs")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO temp.fetched_jobs (job_id, content_hash, db_key) VALUES (?, ?, ?)",
+                [(job.job_id, job.get_content_hash(), job.get_db_key()) for job in jobs]
+            )
+            if rejected_ids:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO temp.listed_jobs (job_id) VALUES (?)",
+                    [(job_id,) for job_id in rejected_ids]
+                )
+
+            counts = dict(self.conn.execute("""
+                SELECT COALESCE(SUM(b.job_id IS NULL), 0) AS new,
+                       COALESCE(SUM(b.closed_at IS NULL AND b.content_hash != f.content_hash), 0) AS updated,
+                       COALESCE(SUM(b.closed_at IS NOT NULL), 0) AS reopened
+                FROM temp.fetched_jobs f
+                LEFT JOIN board_jobs b ON b.source = :source AND b.board = :board AND b.job_id = f.job_id
+            """, key).fetchone())
+
+            if counts["reopened"]:
+                self.conn.execute("""
+                    INSERT INTO job_events (source, board, job_id, db_key, event, at)
+                    SELECT b.source, b.board, b.job_id, f.db_key, 'reopened', :now
+                    FROM board_jobs b JOIN temp.fetched_jobs f ON f.job_id = b.job_id
+                    WHERE b.source = :source AND b.board = :board AND b.closed_at IS NOT NULL
+                """, key)
 
+            if rejected_ids:
+                counts["reopened"] += self.conn.execute("""
+                    INSERT INTO job_events (source, board, job_id, db_key, event, at)
+                    SELECT source, board, job_id, db_key, 'reopened', :now
+                    FROM board_jobs
+                    WHERE source = :source AND board = :board AND closed_at IS NOT NULL
+                      AND job_id IN (SELECT job_id FROM temp.listed_jobs)
+                """, key).rowcount
+                self.conn.execute("""
+                    UPDATE board_jobs SET last_seen = :now, closed_at = NULL
+                    WHERE source = :source AND board = :board
+                      AND job_id IN (SELECT job_id FROM temp.listed_jobs)
+                """, key)
+
+            counts["removed"] = 0
+            if not partial:
+                self.conn.execute("""
+                    INSERT INTO job_events (source, board, job_id, db_key, event, at)
+                    SELECT source, board, job_id, db_key, 'closed', :now
+                    FROM board_jobs
+                    WHERE source = :source AND board = :board AND closed_at IS NULL
+                      AND job_id NOT IN (SELECT job_id FROM temp.fetched_jobs)
+                      AND job_id NOT IN (SELECT job_id FROM temp.listed_jobs)
+                """, key)
+                counts["removed"] = self.conn.execute("""
+                    UPDATE board_jobs SET closed_at = :now
+                    WHERE source = :source AND board = :board AND closed_at IS NULL
+                      AND job_id NOT IN (SELECT job_id FROM temp.fetched_jobs)
+                      AND job_id NOT IN (SELECT job_id FROM temp.listed_jobs)
+                """, key).rowcount
+                if counts["removed"]:
+                    self.conn.execute("""
+                        UPDATE jobs SET closed_at = :now
+                        WHERE db_key IN (
+                            SELECT db_key FROM board_jobs
+                            WHERE source = :source AND board = :board AND closed_at = :now
+                        )
+                    """, key)
+
+            # `WHERE true` keeps the upsert unambiguous after a SELECT
+            self.conn.execute("""
+                INSERT INTO board_jobs (source, board, job_id, content_hash, first_seen, last_seen, db_key, closed_at)
+                SELECT :source, :board, job_id, content_hash, :now, :now, db_key, NULL
+                FROM temp.fetched_jobs WHERE true
+                ON CONFLICT (source, board, job_id) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    last_seen = excluded.last_seen,
+                    db_key = excluded.db_key,
+                    closed_at = NULL
+            """, key)
+            self.conn.execute("""
+                UPDATE jobs SET last_seen = :now, closed_at = NULL
+                WHERE db_key IN (
+                    SELECT db_key FROM temp.fetched_jobs
+                    UNION ALL
+                    SELECT db_key FROM board_jobs
+                    WHERE source = :source AND board = :board AND job_id IN (SELECT job_id FROM temp.listed_jobs)
+                )
+            """, key)
+
+        return counts
+
+    def get_job_events(self, since: str, event: Optional[str] = None, matched: bool = False,
+                       limit: Optional[int] = None) -> List[Dict]:
+        """
+        Closed/reopened events since `since`, newest first
+
+        Events for jobs that were saved (matched) carry the job's title,
+        company, url and score; `matched` keeps only those.
+        """
+        cursor = self.conn.execute("""
+            SELECT e.source, e.board, e.job_id, e.event, e.at,
+                   j.title, j.company, j.url, j.score, j.first_seen
+            FROM job_events e LEFT JOIN jobs j ON j.db_key = e.db_key
+            WHERE e.at >= :since AND (:event IS NULL OR e.event = :event) AND (NOT :matched OR j.db_key IS NOT NULL)
+            ORDER BY e.at DESC, e.id DESC
+            LIMIT :limit
+        """, {"since": since, "event": event, "matched": matched, "limit": -1 if limit is None else limit})
+        return [dict(row) for row in cursor]
+
+    def get_closed_jobs(self, since: str, limit: Optional[int] = None) -> List[Dict]:
+        """Saved jobs that dropped off their board since `since` and are still gone, most recent first"""
+        cursor = self.conn.execute("""
+            SELECT source, company, job_id, title, url, score, first_seen, closed_at
+            FROM jobs WHERE closed_at >= ?
+            ORDER BY closed_at DESC
+            LIMIT ?
+        """, (since, -1 if limit is None else limit))
+        return [dict(row) for row in cursor]
+
+    def save_checkpoint(self, source: str, board: str, jobs: List[Job], commit: bool = True):
+        """Keep a fetched board's jobs until the scan completes (zlib-compressed JSON)"""
+        payload = zlib.compress(json.dumps([
+            [job.source, job.company, job.job_id, job.title, job.location, job.url, job.updated_at, job.content_text]
+            for job in jobs
+        ]).encode(), 1)
+        self.conn.execute("""
+            INSERT OR REPLACE INTO scan_checkpoints (source, board, saved_at, jobs, payload)
+            VALUES (?, ?, ?, ?, ?)
+        """, (source, board, datetime.utcnow().isoformat(), len(jobs), payload))
+        if commit:
+            self.conn.commit()
+
+    def get_checkpoints(self, since: str) -> Dict[Tuple[str, str], Dict]:
+        """Checkpointed boards saved since `since` (without their jobs)"""
+        cursor = self.conn.execute(
+            "SELECT source, board, saved_at, jobs FROM scan_checkpoints WHERE saved_at >= ?", (since,)
+        )
+        return {(row["source"], row["board"]): dict(row) for row in cursor}
+
+    def load_checkpoint(self, source: str, board: str) -> List[Job]:
+        row = self.conn.execute(
+            "SELECT payload FROM scan_checkpoints WHERE source = ? AND board = ?", (source, board)
+        ).fetchone()
+        if row is None:
+            return []
+        return [Job(*fields) for fields in json.loads(zlib.decompress(row["payload"]))]
+
+    def clear_checkpoints(self):
+        self.conn.execute("DELETE FROM scan_checkpoints")
+        self.conn.commit()
+
+    def get_board_schedule(self) -> List[Dict]:
+        cursor = self.conn.execute("SELECT * FROM board_schedule")
+        return [dict(row) for row in cursor]
+
+    def save_board_schedule(self, row: Dict):
+        self.conn.execute("""
+            INSERT OR REPLACE INTO board_schedule
+                (source, board, churn_ema, interval_hours, last_fetch, next_due, fetches, last_changes)
+            VALUES (:source, :board, :churn_ema, :interval_hours, :last_fetch, :next_due, :fetches, :last_changes)
+        """, row)
+        self.conn.commit()
+
+    def get_feed_marks(self) -> Dict[Tuple[str, str], Dict]:
+        cursor = self.conn.execute("SELECT * FROM feed_marks")
+        return {(row["source"], row["feed"]): dict(row) for row in cursor}
+
+    def save_feed_marks(self, marks: List[Dict]):
+        """Advance high-water marks ({source, feed, mark, full_pass}) - never backwards"""
+        now = datetime.utcnow().isoformat()
+        self.conn.executemany("""
+            INSERT INTO feed_marks (source, feed, mark, full_pass_at, updated_at)
+            VALUES (:source, :feed, :mark, :full_pass_at, :updated_at)
+            ON CONFLICT (source, feed) DO UPDATE SET
+                mark = MAX(mark, excluded.mark),
+                full_pass_at = COALESCE(excluded.full_pass_at, full_pass_at),
+                updated_at = excluded.updated_at
+        """, [
+            {**m, "full_pass_at": now if m["full_pass"] else None, "updated_at": now}
+            for m in marks
+        ])
+        self.conn.commit()
+
+    def get_board_stats(self) -> Dict[Tuple[str, str], Dict]:
+        cursor = self.conn.execute("SELECT * FROM board_stats")
+        return {(row["source"], row["board"]): dict(row) for row in cursor}
+
+    def update_board_stats(self, samples: List[Tuple[str, str, float, int, int]], alpha: float = 0.3):
+        """Fold (source, board, fetch_seconds, matches, response_bytes) samples into per-board EMAs"""
+        now = datetime.utcnow().isoformat()
+        self.conn.executemany("""
+            INSERT INTO board_stats (source, board, fetch_seconds, matches, fetches, updated_at, response_bytes)
+            VALUES (:source, :board, :seconds, :matches, 1, :now, :bytes)
+            ON CONFLICT (source, board) DO UPDATE SET
+                fetch_seconds = :alpha * excluded.fetch_seconds + (1 - :alpha) * fetch_seconds,
+                matches = :alpha * excluded.matches + (1 - :alpha) * matches,
+                response_bytes = CASE WHEN response_bytes = 0 THEN excluded.response_bytes
+                    ELSE :alpha * excluded.response_bytes + (1 - :alpha) * response_bytes END,
+                fetches = fetches + 1,
+                updated_at = excluded.updated_at
+        """, [
+            {"source": source, "board": board, "seconds": seconds, "matches": matches,
+             "bytes": response_bytes, "now": now, "alpha": alpha}
+            for source, board, seconds, matches, response_bytes in samples
+        ])
         self.conn.commit()
 
+    def record_scan_run(self, run: Dict, stages: Dict[str, Dict], sources: List[Dict]) -> int:
+        """
+        Store one scan's summary
+
+        `run` holds the scan_runs columns (`stats` as a dict), `stages` the
+        profiler's per-stage totals and `sources` one dict per fetched
+        board (source, board, latency, bytes, jobs, matches, error).
+        """
+        row = {**run, "stats": json.dumps(run["stats"])}
+        columns = ", ".join(row)
+        with self.conn:
+            run_id = self.conn.execute(
+                f"INSERT INTO scan_runs ({columns}) VALUES ({', '.join(':' + c for c in row)})", row
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO scan_run_stages (run_id, stage, calls, seconds) VALUES (?, ?, ?, ?)",
+                [(run_id, stage, totals["calls"], totals["self"]) for stage, totals in stages.items()]
+            )
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO scan_run_sources (run_id, source, board, latency, bytes, jobs, matches, error)
+                VALUES (:run_id, :source, :board, :latency, :bytes, :jobs, :matches, :error)
+            """, [{**source, "run_id": run_id} for source in sources])
+        return run_id
+
+    def get_run_days(self, since: str) -> List[Dict]:
+        """Per-day run counts and averages"""
+        cursor = self.conn.execute("""
+            SELECT date(started_at) AS day, COUNT(*) AS runs,
+                   AVG(duration_seconds) AS avg_seconds, MAX(duration_seconds) AS max_seconds,
+                   AVG(jobs_fetched) AS avg_fetched, AVG(jobs_passed) AS avg_passed,
+                   SUM(jobs_new) AS new, SUM(jobs_updated) AS updated,
+                   COALESCE(SUM(json_extract(stats, '$.jobs_closed')), 0) AS closed,
+                   SUM(errors) AS errors, MAX(peak_rss_mb) AS peak_rss_mb
+            FROM scan_runs WHERE started_at >= ?
+            GROUP BY day ORDER BY day
+        """, (since,))
+        return [dict(row) for row in cursor]
+
+    def get_run_stages(self, since: str, recent: str) -> List[Dict]:
+        """Average seconds per run by stage, over the window and since `recent`"""
+        cursor = self.conn.execute("""
+            SELECT s.stage,
+                   SUM(s.seconds) / COUNT(DISTINCT r.id) AS avg_seconds,
+                   SUM(CASE WHEN r.started_at >= :recent THEN s.seconds END)
+                       / COUNT(DISTINCT CASE WHEN r.started_at >= :recent THEN r.id END) AS recent_seconds
+            FROM scan_run_stages s JOIN scan_runs r ON r.id = s.run_id
+            WHERE r.started_at >= :since
+            GROUP BY s.stage ORDER BY avg_seconds DESC
+        """, {"since": since, "recent": recent})
+        return [dict(row) for row in cursor]
+
+    def get_run_sources(self, since: str, order: str = "slowest", limit: Optional[int] = None,
+                        by_board: bool = True) -> List[Dict]:
+        """
+        Fetch latency, volume and yield per board (or per source type)
+
+        `order`: "slowest" (average fetch time), "lowest_yield" (matches
+        per fetch minute, most fetch time first) or "busiest" (total
+        fetch time).
+        """
+        group = "source, board" if by_board else "source"
+        order_by = {
+            "slowest": "avg_latency DESC",
+            "lowest_yield": "matches_per_minute, total_latency DESC",
+            "busiest": "total_latency DESC",
+        }[order]
+        cursor = self.conn.execute(f"""
+            SELECT {group}, COUNT(DISTINCT board) AS boards, COUNT(*) AS fetches,
+                   AVG(latency) AS avg_latency, MAX(latency) AS max_latency, SUM(latency) AS total_latency,
+                   AVG(bytes) AS avg_bytes, SUM(bytes) AS bytes, SUM(jobs) AS jobs, SUM(matches) AS matches,
+                   COUNT(error) AS errors,
+                   SUM(matches) * 60.0 / MAX(SUM(latency), 0.001) AS matches_per_minute
+            FROM scan_run_sources
+            WHERE run_id IN (SELECT id FROM scan_runs WHERE started_at >= ?)
+            GROUP BY {group}
+            ORDER BY {order_by}
+            LIMIT ?
+        """, (since, -1 if limit is None else limit))
+        return [dict(row) for row in cursor]
+
+    def prune(self, retention: Dict, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Apply the retention policy and return deleted rows per table
+
+        - board_jobs and saved jobs: closed more than `closed_days` ago or
+          not listed for `unseen_days` (with their search index rows,
+          and fingerprints no other row still uses)
+        - board schedule, stats and feed marks of boards not fetched for
+          `unseen_days` (dropped from the config)
+        - delivered alerts, job events and scan runs older than
+          `history_days`, and runs beyond the newest `max_runs`; events
+          of jobs that were never saved already after `closed_days`
+        """
+        now = now or datetime.utcnow()
+        cutoffs = {
+            "closed": (now - timedelta(days=retention["closed_days"])).isoformat(),
+            "unseen": (now - timedelta(days=retention["unseen_days"])).isoformat(),
+            "history": (now - timedelta(days=retention["history_days"])).isoformat(),
+            "max_runs": retention["max_runs"],
+        }
+        stale = "closed_at < :closed OR last_seen < :unseen"
+        deleted = {}
+
+        def delete(table: str, sql: str):
+            deleted[table] = deleted.get(table, 0) + self.conn.execute(sql, cutoffs).rowcount
+
+        with self.conn:
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS pruned_keys (db_key TEXT PRIMARY KEY)")
+            self.conn.execute("DELETE FROM temp.pruned_keys")
+            self.conn.execute(f"""
+                INSERT OR IGNORE INTO temp.pruned_keys
+                SELECT db_key FROM board_jobs WHERE db_key IS NOT NULL AND ({stale})
+                UNION SELECT db_key FROM jobs WHERE {stale}
+            """, cutoffs)
+            delete("board_jobs", f"DELETE FROM board_jobs WHERE {stale}")
+            delete("jobs_fts", f"DELETE FROM jobs_fts WHERE rowid IN (SELECT id FROM jobs WHERE {stale})")
+            delete("jobs", f"DELETE FROM jobs WHERE {stale}")
+            # Still listed on another board (or saved) - keep the fingerprint
+            self.conn.execute("""
+                DELETE FROM temp.pruned_keys
+                WHERE db_key IN (SELECT db_key FROM board_jobs) OR db_key IN (SELECT db_key FROM jobs)
+            """)
+            delete("job_fingerprints", "DELETE FROM job_fingerprints WHERE db_key IN (SELECT db_key FROM temp.pruned_keys)")
+            delete("fingerprint_bands", "DELETE FROM fingerprint_bands WHERE db_key IN (SELECT db_key FROM temp.pruned_keys)")
+
+            delete("board_schedule", "DELETE FROM board_schedule WHERE last_fetch < :unseen")
+            delete("board_stats", "DELETE FROM board_stats WHERE updated_at < :unseen")
+            delete("feed_marks", "DELETE FROM feed_marks WHERE updated_at < :unseen")
+
+            delete("alert_outbox", "DELETE FROM alert_outbox WHERE status = 'sent' AND created_at < :history")
+            delete("job_events", """
+                DELETE FROM job_events
+                WHERE at < :history OR (at < :closed AND (db_key IS NULL OR db_key NOT IN (SELECT db_key FROM jobs)))
+            """)
+            delete("scan_runs", """
+                DELETE FROM scan_runs
+                WHERE started_at < :history OR id NOT IN (SELECT id FROM scan_runs ORDER BY id DESC LIMIT :max_runs)
+            """)
+            delete("scan_run_stages", "DELETE FROM scan_run_stages WHERE run_id NOT IN (SELECT id FROM scan_runs)")
+            delete("scan_run_sources", "DELETE FROM scan_run_sources WHERE run_id NOT IN (SELECT id FROM scan_runs)")
+        return deleted
+
+    def compact(self):
+        """VACUUM the DB and fold the WAL back into it"""
+        self.conn.execute("VACUUM")
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def get_source_health(self, source: str, company: str) -> Optional[SourceHealthRecord]:
         cursor = self.conn.cursor()
         cursor.execute("SELECT * FROM source_health WHERE source = ? AND company = ?", (source, company))
@@ -141,6 +935,12 @@ class StateManager:
         self.conn.close()
 
 
+def _chunks(items: List, size: int = 500):
+    """Split for SQLite's bound-parameter limit"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
 class ScanCursor:
     """Track batch scanning progress"""
 
@@ -150,7 +950,7 @@ class ScanCursor:
 
     def load(self) -> Dict:
         if not self.cursor_file.exists():
-            return {"tier2_index": 0, "last_run": None}
+            return {"tier2_index": 0, "tier3_index": 0, "carryover": [], "last_run": None}
         with open(self.cursor_file) as f:
             return json.load(f)
 
@@ -0,0 +1,133 @@
+"""
+Tiered rotating scans
+
+Tier 1 boards are scanned every run. Tier 2 and tier 3 boards are split
+into rotating slices of `boards_per_run`; the position of each rotation is
+kept in ScanCursor, so per-run cost stays constant however long the lists
+grow, and every board is still visited once per full rotation.
+
+Source config:
+
+    "greenhouse": {
+        "boards": ["gitlab", "datadog"],      # tier 1
+        "tier2": ["company-a", "company-b"],
+        "tier3": ["company-z"]
+    }
+"""
+import math
+from typing import Dict, List, Tuple
+
+from .budget import board_key
+
+
+ROTATING_TIERS = ["tier2", "tier3"]
+
+
+class TierPlan:
+    """Boards to scan this run plus per-tier rotation details"""
+
+    def __init__(self):
+        self.sources: Dict[str, List[str]] = {}
+        self.slices: List[Dict] = []
+
+    def add(self, source_type: str, identifier: str):
+        ids = self.sources.setdefault(source_type, [])
+        if identifier not in ids:
+            ids.append(identifier)
+
+    @property
+    def board_count(self) -> int:
+        return sum(len(ids) for ids in self.sources.values())
+
+    @property
+    def runs_for_full_coverage(self) -> int:
+        return max([s["runs_for_coverage"] for s in self.slices] or [1])
+
+    def print_summary(self):
+        if not self.slices:
+            return
+        print("\n  Tiers:")
+        for s in self.slices:
+            end = s["start"] + s["count"]
+            if end > s["total"]:
+                span = f"{_range(s['start'] + 1, s['total'])}, {_range(1, end - s['total'])}"
+            else:
+                span = _range(s["start"] + 1, end)
+            print(
+                f"    {s['tier']}: {s['count']} of {s['total']} boards ({span}),"
+                f" full coverage every {s['runs_for_coverage']} run(s)"
+            )
+        print(f"    All boards covered every {self.runs_for_full_coverage} run(s)")
+
+
+def _range(first: int, last: int) -> str:
+    return str(first) if first == last else f"{first}-{last}"
+
+
+def plan_scan(tiers: Dict[str, Dict[str, List[str]]], tier_config: Dict, cursor: Dict) -> Tuple[TierPlan, Dict]:
+    """
+    Pick this run's boards
+
+    Args:
+        tiers: source_type -> {"tier1": [...], "tier2": [...], "tier3": [...]}
+        tier_config: {"tier2": {"boards_per_run": n}, ...}
+        cursor: ScanCursor state ({"tier2_index": i, "tier3_index": j})
+
+    Returns:
+        (plan, new cursor state) - save the cursor only after a completed scan
+    """
+    plan = TierPlan()
+    new_cursor = dict(cursor)
+
+    for source_type, by_tier in tiers.items():
+        for identifier in by_tier.get("tier1", []):
+            plan.add(source_type, identifier)
+
+    for tier in ROTATING_TIERS:
+        # Flatten across source types in config order so slices are stable
+        boards = [
+            (source_type, identifier)
+            for source_type, by_tier in tiers.items()
+            for identifier in by_tier.get(tier, [])
+        ]
+        if not boards:
+            continue
+
+        per_run = max(1, min(tier_config.get(tier, {}).get("boards_per_run", len(boards)), len(boards)))
+        key = f"{tier}_index"
+        # Lists may have shrunk since the last run
+        start = cursor.get(key, 0) % len(boards)
+
+        for offset in range(per_run):
+            plan.add(*boards[(start + offset) % len(boards)])
+
+        new_cursor[key] = (start + per_run) % len(boards)
+        plan.slices.append({
+            "tier": tier,
+            "start": start,
+            "count": per_run,
+            "total": len(boards),
+            "runs_for_coverage": math.ceil(len(boards) / per_run),
+        })
+
+    return plan, new_cursor
+
+
+def add_carryover(plan: TierPlan, tiers: Dict[str, Dict[str, List[str]]], carryover: List[str]) -> List[str]:
+    """
+    Add boards a budgeted run did not get to ("type/identifier" keys)
+
+    Returns the keys that are still configured, in their original order.
+    """
+    configured = {
+        board_key(source_type, identifier): (source_type, identifier)
+        for source_type, by_tier in tiers.items()
+        for identifiers in by_tier.values()
+        for identifier in identifiers
+    }
+    kept = []
+    for key in carryover:
+        if key in configured:
+            plan.add(*configured[key])
+            kept.append(key)
+    return kept